@@ -9,22 +9,118 @@
     status via Blender's reporting system.
     
     Classes:
+        OrthoScale219SpatialIndex: Uniform grid over the camera-space extents of a set of objects.
         OrthoScale219ObjectItem: Property group for individual mesh objects.
         ORTHOSCALE219_UL_ObjectList: UI list for displaying mesh objects.
+        OrthoScale219BoundsItem: Property group for the stored compiled extents of an object.
+        OrthoScale219ViewItem: Property group for a generated multi-view camera.
         OrthoScale219ConfigProperties: Property group for configuration settings.
         ORTHOSCALE219_UL_ConfigList: UI list for displaying configurations.
+        OrthoScale219TileItem: Property group for a compiled tile of the tile grid.
         OrthoScale219Settings: Main scene-level settings property group.
         OBJECT_OT_OrthoScale219AddConfig: Operator to add a new config.
         OBJECT_OT_OrthoScale219RemoveConfig: Operator to remove the active config.
         OBJECT_OT_OrthoScale219AddObject: Operator to add a selected object.
-        OBJECT_OT_OrthoScale219AddSelectedObjects: Operator to add all selected meshes.
+        OBJECT_OT_OrthoScale219AddSelectedObjects: Operator to add all selected geometry objects.
         OBJECT_OT_OrthoScale219RemoveObject: Operator to remove the selected object.
+        OBJECT_OT_OrthoScale219PruneObjects: Operator to remove deleted or unsupported objects from every configuration.
         OBJECT_OT_OrthoScale219CompileCamera: Operator to compile camera settings.
+        OBJECT_OT_OrthoScale219CompileAll: Operator to compile every configuration as a single undo step.
+        OBJECT_OT_OrthoScale219CompileCameraModal: Cancellable, time-sliced version of the compile operator.
+        OBJECT_OT_OrthoScale219ApplyView: Operator to apply a compiled multi-view camera to the scene.
+        OBJECT_OT_OrthoScale219SwitchCamera: Operator to switch between the dedicated ortho camera and the source camera.
+        OBJECT_OT_OrthoScale219Isolate: Operator to isolate the active configuration for rendering, or end the isolation.
+        OBJECT_OT_OrthoScale219CompileTiles: Operator to compile the tile grid.
+        OBJECT_OT_OrthoScale219ApplyTile: Operator to apply a compiled tile to the tile camera.
         RENDER_PT_OrthoScale219Panel: UI panel in Render properties.
+        RENDER_PT_OrthoScale219TileGridPanel: UI sub-panel for the tile grid.
     
     Functions:
-        mesh_poll: Polls for valid mesh objects.
+        mesh_poll: Polls for valid geometry objects.
         camera_poll: Polls for valid camera objects.
+        get_config_objects: Returns the valid objects of a configuration.
+        get_geometry_key: Returns the key under which an object's evaluated geometry can be shared.
+        get_attribute_coords: Reads the position attribute of point cloud or hair curves data in bulk.
+        get_local_coords: Extracts the local-space vertex coordinates of an evaluated object.
+        get_cached_local_coords: Returns the local-space coordinates for a geometry key, extracting them on a cache miss.
+        cache_local_coords: Stores coordinates in the geometry cache if the cache stays within a memory budget.
+        get_world_extents: Returns the cached world-space extents of an evaluated object.
+        get_axis_aligned_linear: Detects cameras whose rotation is an exact permutation of the world axes.
+        get_object_camera_bounds: Computes the camera-space extents of each object in a list.
+        reduce_camera_bounds: Transforms local coordinates into camera space and reduces them to their extents.
+        get_pipelined_object_bounds: Computes per-object camera-space extents, overlapping extraction with reduction.
+        get_streamed_object_bounds: Computes per-object camera-space extents largest first within a memory budget.
+        get_camera_space_bounds: Computes the combined camera-space extents of a list of objects.
+        compute_framing: Computes the orthographic framing of camera-space extents.
+        assign_if_changed: Assigns properties only where they differ from the given values.
+        apply_framing: Applies a computed framing to a camera and the scene's render resolution.
+        get_world_coords: Gathers the world-space coordinates of a list of objects into a single array.
+        get_multi_view_rotations: Returns the world rotation of every view of a multi-view config.
+        get_multi_view_bounds: Projects world-space coordinates onto several camera rotations at once.
+        compile_multi_view: Compiles every view of a multi-view config in one pass.
+        compile_tile_grid: Compiles a fixed-pixel tile grid over the objects of every configuration.
+        get_point_count: Returns the number of vertices or points stored in an object's data.
+        get_evaluated_point_count: Estimates the number of coordinates reading an object's evaluated geometry allocates.
+        get_triangle_count: Returns the number of primitives an object renders as.
+        get_render_samples: Returns the samples per pixel the scene's render engine takes.
+        get_render_pixels: Returns the number of pixels a render shades, after the resolution percentage and border.
+        get_render_history_path: Returns the path of the local render history.
+        load_render_history: Returns the entries of the local render history.
+        record_render: Appends a render to the local render history.
+        fit_render_model: Fits a linear model to render history features by least squares.
+        estimate_render_cost: Predicts the render time and peak memory of a compiled configuration.
+        update_config_summary: Stores the object count, vertex and triangle counts, compile time, and render estimate shown in
+            the panel on a config.
+        get_geometry_fingerprint: Returns a vertex count and position hash fingerprint of a modifier-free mesh.
+        is_compile_up_to_date: Checks whether the compile result stored in a configuration still matches the scene.
+        get_persisted_object_bounds: Computes per-object camera-space extents, reusing the extents stored in a configuration.
+        store_compile_result: Stores a compile result in a configuration so it is saved with the .blend file.
+        get_dedicated_camera: Returns the dedicated ortho camera of a configuration, creating it on first use.
+        activate_dedicated_camera: Makes the dedicated ortho camera of a configuration the scene camera.
+        get_render_camera: Returns the camera a compiled single-view configuration renders through.
+        get_isolation_objects: Returns the objects an isolated render of a configuration contains.
+        get_isolation_collection: Returns the isolation collection of a scene.
+        begin_isolation: Makes the scene render only the objects of a configuration, through a temporary view layer.
+        end_isolation: Tears down the isolation of the scene.
+        compile_config: Compiles a configuration without going through the compile operator.
+        get_local_triangles: Extracts the local-space triangles of an evaluated object.
+        rasterize_triangles: Marks every cell of an occupancy grid that a 2D triangle overlaps, conservatively.
+        compute_occupancy: Rasterizes the projected triangles of objects into a coarse occupancy grid of a frame.
+        update_occupancy: Runs the occupancy pre-pass of a compiled configuration.
+        apply_occupancy_border: Sets the render border to the occupancy border stored on a configuration.
+        apply_render_passes: Enables the view layer passes and multilayer EXR output of the passes a configuration declares.
+        restore_render_passes: Restores the pass settings, output format, and pass indices apply_render_passes changed.
+        get_memory_usage_mb: Returns the current and peak resident memory of the Blender process.
+        measure_compile_undo: Measures repeated compiles with and without undo pushes.
+        push_compile_undo: Pushes a global undo step after a compile from the panel, unless undo steps are turned off.
+        get_spatial_index: Returns the spatial index of a configuration's objects, building or updating it as needed.
+        get_objects_in_frame: Returns the objects of a configuration that overlap the current frame of its camera.
+        prune_stale_objects: Removes deleted or unsupported object items from a configuration.
+        prune_all_configs: Removes stale object items from every configuration of every scene.
+        prune_all_configs_timer: Timer callback that prunes stale object items.
+        clear_geometry_cache: Clears all cached geometry, extents, and spatial indices.
+        on_depsgraph_update_post: Invalidates cached geometry and marks changed objects dirty in spatial indices.
+        on_frame_change_post: Clears cached geometry when the frame changes.
+        on_load_post: Clears cached geometry when a new file is loaded.
+        on_render_pre: Starts timing a render of a compiled configuration for the render history.
+        on_render_stats: Tracks the peak memory reported in the render statistics.
+        on_render_post: Records a timed render in the render history.
+        on_render_cancel: Drops the timing of a cancelled render.
+        get_rna_fingerprint: Returns the values of every plain property of an RNA struct, for hashing.
+        get_material_fingerprint: Returns a hashable description of a material.
+        get_node_tree_fingerprint: Returns a hashable description of a shader or compositor node tree.
+        get_render_cache_key: Returns the content address of a config render.
+        evict_render_cache: Deletes the least recently used files of a render cache until it fits its size limit.
+        get_render_tiles: Splits a frame into pixel-exact tiles.
+        get_png_chunk: Encodes a PNG chunk.
+        assemble_tiles: Assembles rendered tiles into one PNG, streaming one row of tiles at a time.
+        run_tile_worker: Renders tiles of a tiled render job in a background Blender process.
+        render_tiled: Renders a compiled frame as tiles across background Blender processes and assembles them.
+        split_render_passes: Writes every declared pass of multilayer EXR renders to its own file, on parallel threads.
+        run_batch_job: Compiles, and optionally renders, a single configuration for the batch driver.
+        run_batch_worker: Runs one worker of a parallel batch on a queue of .blend file chunks.
+        run_parallel_batch: Fans a batch out over several background Blender processes.
+        run_batch: Command-line batch driver for headless compile-and-render on farm nodes.
         register: Registers all classes and scene properties.
         unregister: Unregisters all classes and scene properties.
     
@@ -39,27 +135,68 @@
     Version: 2.1.9+109092.1756709219
 """
 from __future__ import annotations
-from typing import Any, cast, TYPE_CHECKING
+from typing import Any, Callable, cast, TYPE_CHECKING
 
+import argparse
+import concurrent.futures
+import fnmatch
+import glob
+import hashlib
+import json
 import math
+import os
+import queue
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
 import bpy
+import bmesh
+import numpy as np
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+try:
+    import OpenImageIO as oiio
+except ImportError: # Blender builds without the OpenImageIO Python module
+    oiio = None
 
 from mathutils import Vector
+from bpy.app.handlers import persistent
 from bpy.types import PropertyGroup, Operator, Panel, UIList
-from bpy.props import FloatProperty, PointerProperty, CollectionProperty, IntProperty, StringProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, FloatVectorProperty, PointerProperty, CollectionProperty, IntProperty, IntVectorProperty, StringProperty
 
 import mathutils
 
 if TYPE_CHECKING:
     from bpy.types import bpy_prop_collection
 
+SUPPORTED_OBJECT_TYPES:frozenset[str] = frozenset({
+    'MESH',
+    'CURVE',
+    'SURFACE',
+    'FONT',
+    'META',
+    'POINTCLOUD',
+    'CURVES',
+    'VOLUME',
+})
+
 def mesh_poll(self:bpy.types.bpy_struct, obj:bpy.types.ID) -> bool: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
     """
-        Poll function to determine if an object is a valid mesh for selection.
+        Poll function to determine if an object is a valid geometry object for selection.
         
         This function serves as a callback for PointerProperty polling in Blender add-ons. It checks whether the provided object
-        is an instance of bpy.types.Object and specifically of type 'MESH', allowing only mesh objects to be selectable in
-        properties that use this poll function.
+        is an instance of bpy.types.Object with one of the SUPPORTED_OBJECT_TYPES (meshes, curves, surfaces, text, metaballs,
+        point clouds, hair curves, and volumes), allowing only those to be selectable in properties that use this poll function.
         
         Args:
             self (bpy.types.bpy_struct): The struct owning the property, typically a bpy.types.bpy_struct instance. This
@@ -67,9 +204,9 @@ def mesh_poll(self:bpy.types.bpy_struct, obj:bpy.types.ID) -> bool: # noinspecti
             obj (bpy.types.ID): The object to evaluate for validity.
         
         Returns:
-            bool: True if the object is a mesh (instance of bpy.types.Object with type 'MESH'), False otherwise.
+            bool: True if the object is an instance of bpy.types.Object of a supported type, False otherwise.
     """
-    return isinstance(obj, bpy.types.Object) and obj.type == 'MESH'
+    return isinstance(obj, bpy.types.Object) and obj.type in SUPPORTED_OBJECT_TYPES
 
 def camera_poll(self:bpy.types.bpy_struct, obj:bpy.types.ID) -> bool: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
     """
@@ -89,245 +226,3241 @@ def camera_poll(self:bpy.types.bpy_struct, obj:bpy.types.ID) -> bool: # noinspec
     """
     return isinstance(obj, bpy.types.Object) and obj.type == 'CAMERA'
 
-class OrthoScale219ObjectItem(PropertyGroup):
+def get_config_objects(config:OrthoScale219ConfigProperties) -> list[bpy.types.Object]:
     """
-        Property group representing a single mesh object item in an OrthoScale219 configuration.
+        Returns the valid objects of a configuration.
         
-        This class stores a pointer to a mesh object that will be used for bounding box calculations during the orthographic
-        camera compilation. It is designed to be part of a collection in the configuration properties.
+        Args:
+            config (OrthoScale219ConfigProperties): The configuration to read.
         
-        Attributes:
-            mesh_object (bpy.types.Object): Pointer to the mesh object used for bounding box calculations.
+        Returns:
+            list[bpy.types.Object]: The configuration's objects that are still set and of a supported type.
     """
-    if TYPE_CHECKING:
-        mesh_object:bpy.types.Object
-    else:
-        mesh_object:PointerProperty(
-            name = "Object",
-            type = bpy.types.Object,
-            poll = mesh_poll
-        )
+    return [item.mesh_object for item in config.blender_objects if item.mesh_object and item.mesh_object.type in SUPPORTED_OBJECT_TYPES]
 
-class ORTHOSCALE219_UL_ObjectList(UIList): # pylint: disable=invalid-name # noqa: N801
+HULL_REDUCTION_MIN_VERTICES:int = 1024
+HULL_REDUCTION_COST:float = 2.0
+GEOMETRY_CACHE_MAX_MB:float = 256.0
+AXIS_ALIGNED_TOLERANCE:float = 1e-6
+MULTI_VIEW_CHUNK_SIZE:int = 1 << 20
+SPATIAL_INDEX_MAX_CELLS_PER_OBJECT:int = 256
+MODAL_TIME_SLICE:float = 0.05
+ISOLATION_NAME:str = "OrthoScale219 Isolation"
+RENDER_HISTORY_MAX_ENTRIES:int = 500
+RENDER_HISTORY_FILE_NAME:str = "ortho_scale_219_render_history.json"
+RENDER_CACHE_IGNORED_PROPERTIES:frozenset[str] = frozenset({
+    'filepath',
+    'rna_type',
+    'name',
+    'is_movie_format',
+    'location',
+    'width',
+    'select',
+    'show_options',
+    'threads',
+    'threads_mode',
+    'use_lock_interface',
+    'use_persistent_data',
+    'preview_pixel_size',
+})
+RENDER_PASSES:dict[str, tuple[str, str, str]] = {
+    'COLOR': ("use_pass_combined", "Combined", "Color"),
+    'DEPTH': ("use_pass_z", "Depth", "Depth"),
+    'NORMAL': ("use_pass_normal", "Normal", "Normal"),
+    'OBJECT_INDEX': ("use_pass_object_index", "IndexOB", "Object Index"),
+}
+
+ortho_scale_219_geometry_cache:dict[str, np.ndarray] = {}
+ortho_scale_219_geometry_cache_bytes:list[int] = [0]
+ortho_scale_219_extents_cache:dict[str, tuple[str, tuple[float, ...], np.ndarray, np.ndarray]] = {}
+ortho_scale_219_spatial_indices:dict[str, OrthoScale219SpatialIndex] = {}
+ortho_scale_219_object_count:list[int] = [0]
+ortho_scale_219_peak_rss_mb:list[float] = [0.0]
+ortho_scale_219_isolation_states:dict[str, dict[str, Any]] = {}
+ortho_scale_219_render_history:dict[str, tuple[tuple[int, int, int], list[dict[str, Any]]]] = {}
+ortho_scale_219_pending_render:dict[str, Any] = {}
+
+def get_geometry_key(obj:bpy.types.Object) -> str:
     """
-        UI list class for displaying and managing mesh object items in an OrthoScale219 configuration.
+        Returns the key under which an object's evaluated geometry can be shared with other objects.
         
-        This class handles the rendering of object items in the Blender UI, supporting default, compact, and grid layouts. It
-        displays each item with an object data icon and allows for property editing without embossing.
+        Linked duplicates (Alt+D) without modifiers evaluate to exactly the geometry of their shared mesh data-block, so they are
+        keyed by that data-block. Objects with modifiers, or that pin a shape key, produce their own evaluated geometry and are
+        keyed by the object itself. So are metaballs, whose geometry depends on every metaball of the same family.
+        
+        Args:
+            obj (bpy.types.Object): The object to key.
+        
+        Returns:
+            str: The geometry key of the object.
     """
-    def draw_item(self:ORTHOSCALE219_UL_ObjectList, context:bpy.types.Context, layout:bpy.types.UILayout, data:Any, item:Any, icon:int, active_data:Any, active_propname:str, index:int, flt_flag:int) -> None: # noinspection PyUnusedLocal,PyMethodOverriding # pylint: disable=unused-argument,arguments-renamed # type: ignore[override] # noqa: F841,PLW0237
-        """
-            Draws an individual mesh object item in the UI list.
-            
-            This method renders the item based on the layout type, using a property field for default/compact views or a centered
-            label for grid views. It displays the mesh_object property without embossing and with an 'OBJECT_DATA' icon.
-            
-            Args:
-                self (ORTHOSCALE219_UL_ObjectList): The UI list instance.
-                context (bpy.types.Context): The current Blender context.
-                layout (bpy.types.UILayout): The UI layout to draw into.
-                data (Any): The data source (e.g., the config containing the objects).
-                item (Any): The OrthoScale219ObjectItem to draw.
-                icon (int): The icon ID (unused).
-                active_data (Any): The active data source (unused).
-                active_propname (str): The active property name (unused).
-                index (int): The index of the item in the list (unused).
-                flt_flag (int): Filter flag (unused).
-            
-            Returns:
-                None
-        """
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            layout.prop(
-                data = item,
-                property = "mesh_object",
-                text = "",
-                emboss = False,
-                icon = 'OBJECT_DATA',
-            )
-        elif self.layout_type == 'GRID':
-            layout.alignment = 'CENTER'
-            layout.label(
-                text = "",
-                icon = 'OBJECT_DATA',
-            )
+    if obj.data is None or obj.type == 'META' or obj.modifiers or getattr(obj, "show_only_shape_key", False):
+        return f"OBJECT:{obj.name_full}"
+    
+    return f"DATA:{obj.data.name_full}"
 
-class OrthoScale219ConfigProperties(PropertyGroup):
+def get_attribute_coords(data:bpy.types.PointCloud | bpy.types.Curves) -> np.ndarray:
     """
-        Property group containing all settings for a single OrthoScale219 configuration.
+        Reads the position attribute of evaluated point cloud or hair curves data in bulk.
         
-        This class holds configuration-specific properties such as the name, pixels per Blender unit, edge margin, selected
-        camera, list of mesh objects, and related indices. It serves as an entry in the main settings' collection of
-        configurations.
+        Args:
+            data (bpy.types.PointCloud | bpy.types.Curves): The evaluated data to read.
+        
+        Returns:
+            np.ndarray: An (N, 3) float32 array of local-space point positions. Empty if the data has no points.
     """
-    if TYPE_CHECKING:
-        config_name:str
-    else:
-        config_name:StringProperty(
-            name = "Config Name",
-            description = "Name of this configuration.",
-            default = "Config"
-        )
+    position:bpy.types.Attribute | None = data.attributes.get("position")
     
-    if TYPE_CHECKING:
-        pixels_per_blender_unit:float
-    else:
-        pixels_per_blender_unit:FloatProperty(
-            name = "Pixels per Blender Unit",
-            description = "Pixels per Blender Unit (higher = more detail and larger files)",
-            default = 10.0,
-            min = 1.0,
-        )
+    if position is None or not len(position.data):
+        return np.empty((0, 3), dtype = np.float32)
     
-    if TYPE_CHECKING:
-        edge_margin:float
-    else:
-        edge_margin:FloatProperty(
-            name = "Margin (In Blender Units)",
-            description = "Margin (in Blender Units) that will be padded around the edge of the render.",
-            default = 1.0,
-            min = 0.0,
-        )
+    coords:np.ndarray = np.empty(len(position.data) * 3, dtype = np.float32)
+    position.data.foreach_get("vector", coords)
     
-    if TYPE_CHECKING:
-        camera:bpy.types.Object | None
-    else:
-        camera:PointerProperty(
-            name = "Camera",
-            type = bpy.types.Object,
-            poll = camera_poll,
-            description = "Select the camera to use."
-        )
+    return coords.reshape(-1, 3)
+
+def get_local_coords(eval_obj:bpy.types.Object, depsgraph:bpy.types.Depsgraph, users:int = 1) -> np.ndarray:
+    """
+        Extracts the local-space vertex coordinates of an evaluated object, using the cheapest source for its type.
+        
+        Volumes are bounded by the 8 corners of their evaluated bound_box, and point clouds and hair curves by their position
+        attribute, without building a mesh. Meshes, curves, surfaces, text, and metaballs are converted to a temporary
+        evaluated mesh that is read in bulk via foreach_get and cleared immediately afterward, so no converted copies are left
+        in the file. When the mesh has enough users that transforming all of its vertices once per user costs more than
+        building its convex hull, only the vertices of the hull are returned; these have exactly the same extents as the full
+        vertex set under any linear transform, which makes every additional linked duplicate cheap to bound. The hull costs
+        about HULL_REDUCTION_COST * log2(N) vertex transforms per vertex (a BMesh copy plus an O(N log N) hull), so it is
+        only built for meshes of at least HULL_REDUCTION_MIN_VERTICES vertices with more than that many users.
+        
+        Args:
+            eval_obj (bpy.types.Object): The evaluated object to extract coordinates from.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            users (int): The number of objects that share the geometry and will be bounded from these coordinates. Default: 1.
+        
+        Returns:
+            np.ndarray: An (N, 3) float32 array of local-space vertex coordinates. Empty if the object has no vertices.
+        
+        Notes:
+            Hair curves are bounded by their control points, so the point radius and Catmull-Rom overshoot are not included.
+    """
+    if eval_obj.type == 'VOLUME':
+        return np.array([tuple(corner) for corner in eval_obj.bound_box], dtype = np.float32)
     
-    if TYPE_CHECKING:
-        blender_objects:bpy_prop_collection[OrthoScale219ObjectItem]
-    else:
-        blender_objects:CollectionProperty(
-            type = OrthoScale219ObjectItem
-        )
+    if eval_obj.type in {'POINTCLOUD', 'CURVES'}:
+        return get_attribute_coords(eval_obj.data)
     
-    if TYPE_CHECKING:
-        active_object_index:int
-    else:
-        active_object_index:IntProperty()
+    mesh:bpy.types.Mesh | None = eval_obj.to_mesh(depsgraph = depsgraph)
     
-    if TYPE_CHECKING:
-        add_blender_object:bpy.types.Object | None
-    else:
-        add_blender_object:PointerProperty(
-            name = "Add Blender Object",
-            type = bpy.types.Object,
-            poll = mesh_poll,
-            description = "Select a Blender Object to add."
-        )
+    if mesh is None:
+        eval_obj.to_mesh_clear()
+        
+        return np.empty((0, 3), dtype = np.float32)
+    
+    vertex_count:int = len(mesh.vertices)
+    coords:np.ndarray = np.empty(vertex_count * 3, dtype = np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+    
+    if vertex_count >= HULL_REDUCTION_MIN_VERTICES and users > HULL_REDUCTION_COST * math.log2(vertex_count):
+        bm:bmesh.types.BMesh = bmesh.new()
+        bm.from_mesh(mesh)
+        bm.verts.index_update()
+        
+        hull:dict[str, list[Any]] = bmesh.ops.convex_hull(bm, input = bm.verts, use_existing_faces = False)
+        hull_indices:list[int] = [elem.index for elem in hull["geom"] if isinstance(elem, bmesh.types.BMVert)]
+        bm.free()
+        
+        if len(hull_indices) >= 4:
+            coords = coords[hull_indices]
+    
+    eval_obj.to_mesh_clear()
+    
+    return coords
 
-class ORTHOSCALE219_UL_ConfigList(UIList): # pylint: disable=invalid-name # noqa: N801
+def get_cached_local_coords(key:str, eval_obj:bpy.types.Object, depsgraph:bpy.types.Depsgraph, users:int = 1) -> np.ndarray:
     """
-        UI list class for displaying and managing OrthoScale219 configurations.
+        Returns the local-space coordinates for a geometry key, extracting them on a cache miss.
         
-        This class handles the rendering of configuration items in the Blender UI, supporting default, compact, and grid layouts.
-        It displays each configuration with a preset icon and allows for property editing without embossing.
+        Cached coordinates persist across compiles until on_depsgraph_update_post, on_frame_change_post, or on_load_post
+        invalidates them. Newly extracted coordinates are only cached while the cache stays within GEOMETRY_CACHE_MAX_MB;
+        beyond that they are returned without being kept, so large scenes do not hold a copy of every vertex buffer.
+        
+        Args:
+            key (str): The geometry key of the object, as returned by get_geometry_key.
+            eval_obj (bpy.types.Object): The evaluated object to extract coordinates from on a cache miss.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            users (int): The number of objects sharing the geometry, passed on to get_local_coords. Default: 1.
+        
+        Returns:
+            np.ndarray: An (N, 3) float32 array of local-space vertex coordinates.
     """
-    def draw_item(self:ORTHOSCALE219_UL_ConfigList, context:bpy.types.Context, layout:bpy.types.UILayout, data:Any, item:Any, icon:int, active_data:Any, active_propname:str, index:int, flt_flag:int) -> None: # noinspection PyUnusedLocal,PyMethodOverriding # pylint: disable=unused-argument,arguments-renamed # type: ignore[override] # noqa: F841,PLW0237
-        """
-            Draws an individual configuration item in the UI list.
-            
-            This method renders the item based on the layout type, using a property field for default/compact views or a centered
-            label for grid views. It displays the config_name property without embossing and with a 'PRESET' icon.
-            
-            Args:
-                self (ORTHOSCALE219_UL_ConfigList): The UI list instance.
-                context (bpy.types.Context): The current Blender context.
-                layout (bpy.types.UILayout): The UI layout to draw into.
-                data (Any): The data source (e.g., the settings containing the configs).
-                item (Any): The OrthoScale219ConfigProperties to draw.
-                icon (int): The icon ID (unused).
-                active_data (Any): The active data source (unused).
-                active_propname (str): The active property name (unused).
-                index (int): The index of the item in the list (unused).
-                flt_flag (int): Filter flag (unused).
-            
-            Returns:
-                None
-        """
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            layout.prop(
-                data = item,
-                property = "config_name",
-                text = "",
-                emboss = False,
-                icon = 'PRESET',
-            )
-        elif self.layout_type == 'GRID':
-            layout.alignment = 'CENTER'
-            layout.label(
-                text = "",
-                icon = 'PRESET',
-            )
+    coords:np.ndarray | None = ortho_scale_219_geometry_cache.get(key)
+    
+    if coords is None:
+        coords = get_local_coords(eval_obj, depsgraph, users = users)
+        cache_local_coords(key, coords, GEOMETRY_CACHE_MAX_MB)
+    
+    return coords
 
-class OrthoScale219Settings(PropertyGroup):
+def cache_local_coords(key:str, coords:np.ndarray, budget_mb:float) -> bool:
     """
-        Main property group for OrthoScale219 add-on settings.
+        Stores coordinates in the geometry cache if the cache stays within a memory budget.
         
-        This class manages a collection of configurations and tracks the active configuration index. It is attached to the
-        Blender scene for persistent storage across sessions.
+        Args:
+            key (str): The geometry key of the coordinates.
+            coords (np.ndarray): The coordinates to cache.
+            budget_mb (float): The maximum size of the geometry cache in megabytes, including already cached coordinates.
         
-        Attributes:
-            configs (bpy_prop_collection[OrthoScale219ConfigProperties]): Collection of all configurations.
-            active_config_index (int): Index of the active configuration in the configs collection. Default: 0.
+        Returns:
+            bool: True if the coordinates were cached, False if they did not fit.
     """
-    if TYPE_CHECKING:
-        configs:bpy_prop_collection[OrthoScale219ConfigProperties]
-    else:
-        configs:CollectionProperty(type = OrthoScale219ConfigProperties)
+    if ortho_scale_219_geometry_cache_bytes[0] + coords.nbytes > budget_mb * 2 ** 20:
+        return False
     
-    if TYPE_CHECKING:
-        active_config_index:int
-    else:
-        active_config_index:IntProperty()
+    previous:np.ndarray | None = ortho_scale_219_geometry_cache.get(key)
+    
+    if previous is not None:
+        ortho_scale_219_geometry_cache_bytes[0] -= previous.nbytes
+    
+    ortho_scale_219_geometry_cache[key] = coords
+    ortho_scale_219_geometry_cache_bytes[0] += coords.nbytes
+    
+    return True
 
-class OBJECT_OT_OrthoScale219AddConfig(Operator): # pylint: disable=invalid-name # noqa: N801
+def get_world_extents(key:str, eval_obj:bpy.types.Object, depsgraph:bpy.types.Depsgraph, users:int = 1) -> tuple[np.ndarray, np.ndarray] | None:
     """
-        Operator to add a new configuration to the OrthoScale219 settings.
+        Returns the cached world-space extents of an evaluated object.
         
-        This operator creates a new OrthoScale219ConfigProperties instance, assigns it a default name based on the current number
-        of configurations, adds it to the settings' collection, and sets it as the active configuration.
+        The extents are recomputed only when the object's geometry key or world matrix differ from the cached entry, or when
+        its geometry has been invalidated since. Only the extents are cached for geometry with a single user; its coordinates
+        are read, reduced, and dropped, since no other object will be bounded from them.
+        
+        Args:
+            key (str): The geometry key of the object, as returned by get_geometry_key.
+            eval_obj (bpy.types.Object): The evaluated object to bound.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            users (int): The number of objects sharing the geometry, passed on to get_local_coords. Default: 1.
+        
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: (min_co, max_co) as length-3 arrays in world space, or None if the object has
+                no vertices.
     """
-    bl_idname:str = "ortho_scale_219.add_config"
-    bl_label:str = "Add Config"
-    bl_description:str = "Add a new configuration."
-    bl_options:set[str] = {
-        'REGISTER',
-        'UNDO',
-    }
+    matrix:np.ndarray = np.array(eval_obj.matrix_world, dtype = np.float64)
+    matrix_key:tuple[float, ...] = tuple(matrix.ravel().tolist())
+    entry:tuple[str, tuple[float, ...], np.ndarray, np.ndarray] | None = ortho_scale_219_extents_cache.get(eval_obj.name_full)
     
-    def execute(self:OBJECT_OT_OrthoScale219AddConfig, context:bpy.types.Context)-> set[str]:
-        """
-            Executes the addition of a new configuration.
-            
-            This method retrieves the settings, adds a new config with a default name, and updates the active index.
-            
-            Args:
-                self (OBJECT_OT_OrthoScale219AddConfig): The operator instance.
-                context (bpy.types.Context): The current Blender context.
-            
-            Returns:
-                set[str]: {'FINISHED'} on success.
-        """
-        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
-        configs = settings.configs
-        new_config:OrthoScale219ConfigProperties = configs.add()
-        new_config.config_name = f"Config {len(configs)}"
-        settings.active_config_index = len(configs) - 1
-        
-        return {'FINISHED'}
+    if entry is not None and entry[0] == key and entry[1] == matrix_key:
+        return entry[2], entry[3]
+    
+    coords:np.ndarray | None = ortho_scale_219_geometry_cache.get(key)
+    
+    if coords is None:
+        coords = get_local_coords(eval_obj, depsgraph) if users == 1 else get_cached_local_coords(key, eval_obj, depsgraph, users = users)
+    
+    if not len(coords):
+        return None
+    
+    world_coords:np.ndarray = coords @ matrix[:3, :3].T + matrix[:3, 3]
+    min_co:np.ndarray = world_coords.min(axis = 0)
+    max_co:np.ndarray = world_coords.max(axis = 0)
+    ortho_scale_219_extents_cache[eval_obj.name_full] = (key, matrix_key, min_co, max_co)
+    
+    return min_co, max_co
 
-class OBJECT_OT_OrthoScale219RemoveConfig(Operator): # pylint: disable=invalid-name # noqa: N801
+def get_axis_aligned_linear(cam_matrix_inv:mathutils.Matrix) -> np.ndarray | None:
     """
-        Operator to remove the active configuration from the OrthoScale219 settings.
+        Detects cameras whose rotation is an exact permutation of the world axes.
         
-        This operator removes the configuration at the active index from the settings' collection and adjusts the active index to
-        the previous valid one (or 0 if none remain).
+        For cameras rotated by exact 90-degree steps (top, front, side, etc.), camera space is a permutation and sign flip (plus
+        uniform camera scale) of world space. Each camera axis then depends on exactly one world axis, so camera-space extents
+        follow directly from world-space extents.
+        
+        Args:
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+        
+        Returns:
+            np.ndarray | None: The 3x3 linear part of cam_matrix_inv with floating point noise snapped to zero, or None if the
+                camera is not axis-aligned.
+    """
+    linear:np.ndarray = np.array(cam_matrix_inv.to_3x3(), dtype = np.float64)
+    mask:np.ndarray = np.abs(linear) > AXIS_ALIGNED_TOLERANCE * np.abs(linear).max()
+    
+    if not ((mask.sum(axis = 0) == 1).all() and (mask.sum(axis = 1) == 1).all()):
+        return None
+    
+    return np.where(mask, linear, 0.0)
+
+def get_object_camera_bounds(objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """
+        Computes the camera-space extents of each object in a list.
+        
+        Objects are first grouped by geometry key so that the evaluated geometry of each shared mesh is extracted only once.
+        For axis-aligned cameras, the camera-space extents are taken directly from each object's cached world-space extents.
+        For arbitrary rotations, every object in a group costs a single matrix transform of the cached coordinates.
+        
+        Args:
+            objs (list[bpy.types.Object]): The objects to bound.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+        
+        Returns:
+            dict[str, tuple[np.ndarray, np.ndarray]]: (min_co, max_co) as length-3 arrays in camera space, keyed by object
+                name. Objects without vertices are omitted.
+    """
+    groups:dict[str, list[bpy.types.Object]] = {}
+    
+    for obj in objs:
+        groups.setdefault(get_geometry_key(obj), []).append(obj)
+    
+    cam_inv:np.ndarray = np.array(cam_matrix_inv, dtype = np.float64)
+    axis_linear:np.ndarray | None = get_axis_aligned_linear(cam_matrix_inv)
+    object_bounds:dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    
+    for key, group in groups.items():
+        eval_objs:list[bpy.types.Object] = [eval_obj for eval_obj in (depsgraph.objects.get(obj.name) for obj in group) if eval_obj is not None]
+        
+        for eval_obj in eval_objs:
+            if axis_linear is not None:
+                extents:tuple[np.ndarray, np.ndarray] | None = get_world_extents(key, eval_obj, depsgraph, users = len(eval_objs))
+                
+                if extents is None:
+                    continue
+                
+                obj_min:np.ndarray = np.where(axis_linear > 0, axis_linear * extents[0], axis_linear * extents[1]).sum(axis = 1) + cam_inv[:3, 3]
+                obj_max:np.ndarray = np.where(axis_linear > 0, axis_linear * extents[1], axis_linear * extents[0]).sum(axis = 1) + cam_inv[:3, 3]
+            else:
+                coords:np.ndarray = get_cached_local_coords(key, eval_obj, depsgraph, users = len(eval_objs))
+                
+                if not len(coords):
+                    continue
+                
+                matrix:np.ndarray = cam_inv @ np.array(eval_obj.matrix_world, dtype = np.float64)
+                cam_coords:np.ndarray = coords @ matrix[:3, :3].T + matrix[:3, 3]
+                obj_min = cam_coords.min(axis = 0)
+                obj_max = cam_coords.max(axis = 0)
+            
+            object_bounds[eval_obj.name] = (obj_min, obj_max)
+    
+    return object_bounds
+
+def reduce_camera_bounds(coords:np.ndarray, matrix:np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+        Transforms local coordinates into camera space and reduces them to their extents.
+        
+        Only NumPy runs here, which releases the GIL for the transform and the reductions, so this can run on a worker thread
+        while the main thread talks to Blender.
+        
+        Args:
+            coords (np.ndarray): An (N, 3) array of local coordinates, N > 0.
+            matrix (np.ndarray): The 4x4 local-to-camera matrix.
+        
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (min_co, max_co) as length-3 arrays in camera space.
+    """
+    cam_coords:np.ndarray = coords @ matrix[:3, :3].T + matrix[:3, 3]
+    
+    return cam_coords.min(axis = 0), cam_coords.max(axis = 0)
+
+def get_pipelined_object_bounds(objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """
+        Computes the camera-space extents of each object in a list, overlapping geometry extraction with reduction.
+        
+        The Blender API stays on the main thread, which extracts the coordinates of one object after another through the
+        geometry cache, while a single worker thread transforms and reduces the previous object's coordinates with
+        reduce_camera_bounds. At most two reductions are in flight: before the next object is extracted, the main thread waits
+        for all but the newest reduction. Results are merged in object order, so they equal those of get_object_camera_bounds, and for
+        many medium-sized objects the wall time approaches that of the extraction alone. Linked duplicates are grouped and
+        reduced to their convex hull as in get_object_camera_bounds. Axis-aligned cameras are passed on to
+        get_object_camera_bounds, whose cached world-space extents leave nothing worth reducing on a worker thread.
+        
+        Args:
+            objs (list[bpy.types.Object]): The objects to bound.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+        
+        Returns:
+            dict[str, tuple[np.ndarray, np.ndarray]]: (min_co, max_co) as length-3 arrays in camera space, keyed by object
+                name. Objects without vertices are omitted.
+    """
+    if get_axis_aligned_linear(cam_matrix_inv) is not None:
+        return get_object_camera_bounds(objs, depsgraph, cam_matrix_inv)
+    
+    groups:dict[str, list[bpy.types.Object]] = {}
+    
+    for obj in objs:
+        groups.setdefault(get_geometry_key(obj), []).append(obj)
+    
+    cam_inv:np.ndarray = np.array(cam_matrix_inv, dtype = np.float64)
+    futures:list[tuple[str, concurrent.futures.Future[tuple[np.ndarray, np.ndarray]]]] = []
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "OrthoScale219Reduce") as executor:
+        for key, group in groups.items():
+            eval_objs:list[bpy.types.Object] = [eval_obj for eval_obj in (depsgraph.objects.get(obj.name) for obj in group) if eval_obj is not None]
+            
+            for eval_obj in eval_objs:
+                if len(futures) >= 2:
+                    futures[-2][1].result()
+                
+                coords:np.ndarray = get_cached_local_coords(key, eval_obj, depsgraph, users = len(eval_objs))
+                
+                if not len(coords):
+                    continue
+                
+                futures.append((eval_obj.name, executor.submit(reduce_camera_bounds, coords, cam_inv @ np.array(eval_obj.matrix_world, dtype = np.float64))))
+    
+    return {name: future.result() for name, future in futures}
+
+def get_streamed_object_bounds(objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix, budget_mb:float) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """
+        Computes the camera-space extents of each object in a list while bounding the memory held for coordinates.
+        
+        Objects are evaluated one at a time, largest first by get_evaluated_point_count, so the biggest temporary allocations
+        happen before the geometry cache has grown. Evaluated meshes outside Edit Mode are read straight from the depsgraph instead of through a to_mesh
+        copy; every other type goes through get_local_coords, which frees its temporary mesh as soon as the coordinates are
+        read. The coordinates of each object are reduced to its extents and dropped right away, unless they fit in what is left
+        of the budget, in which case they are cached for later compiles. Convex hull reduction is skipped, since it builds a
+        second copy of the mesh. The resident memory is sampled after every object into ortho_scale_219_peak_rss_mb.
+        
+        Args:
+            objs (list[bpy.types.Object]): The objects to bound.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+            budget_mb (float): The maximum size of the geometry cache in megabytes, including already cached coordinates.
+        
+        Returns:
+            dict[str, tuple[np.ndarray, np.ndarray]]: (min_co, max_co) as length-3 arrays in camera space, keyed by object
+                name. Objects without vertices are omitted.
+    """
+    cam_inv:np.ndarray = np.array(cam_matrix_inv, dtype = np.float64)
+    object_bounds:dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    
+    for obj in sorted(objs, key = lambda obj: get_evaluated_point_count(obj, depsgraph), reverse = True):
+        eval_obj:bpy.types.Object | None = depsgraph.objects.get(obj.name)
+        
+        if eval_obj is None:
+            continue
+        
+        key:str = get_geometry_key(obj)
+        coords:np.ndarray | None = ortho_scale_219_geometry_cache.get(key)
+        
+        if coords is None:
+            if eval_obj.type == 'MESH' and obj.mode != 'EDIT':
+                mesh:bpy.types.Mesh = cast(bpy.types.Mesh, eval_obj.data)
+                coords = np.empty(len(mesh.vertices) * 3, dtype = np.float32)
+                mesh.vertices.foreach_get("co", coords)
+                coords = coords.reshape(-1, 3)
+            else:
+                coords = get_local_coords(eval_obj, depsgraph)
+            
+            cache_local_coords(key, coords, budget_mb)
+        
+        ortho_scale_219_peak_rss_mb[0] = max(ortho_scale_219_peak_rss_mb[0], get_memory_usage_mb()[0])
+        
+        if len(coords):
+            matrix:np.ndarray = cam_inv @ np.array(eval_obj.matrix_world, dtype = np.float64)
+            cam_coords:np.ndarray = coords @ matrix[:3, :3].T + matrix[:3, 3]
+            object_bounds[eval_obj.name] = (cam_coords.min(axis = 0), cam_coords.max(axis = 0))
+            del cam_coords
+        
+        del coords
+    
+    return object_bounds
+
+def get_camera_space_bounds(objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix, budget_mb:float | None = None) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+        Computes the combined camera-space extents of a list of objects.
+        
+        Args:
+            objs (list[bpy.types.Object]): The objects to bound.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+            budget_mb (float | None): If set, the objects are bounded by get_streamed_object_bounds with this geometry cache
+                budget in megabytes. Default: None.
+        
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: (min_co, max_co) as length-3 arrays in camera space, or None if the objects
+                have no vertices.
+    """
+    object_bounds:dict[str, tuple[np.ndarray, np.ndarray]]
+    
+    if budget_mb is None:
+        object_bounds = get_object_camera_bounds(objs, depsgraph, cam_matrix_inv)
+    else:
+        object_bounds = get_streamed_object_bounds(objs, depsgraph, cam_matrix_inv, budget_mb)
+    
+    if not object_bounds:
+        return None
+    
+    return np.min([bounds[0] for bounds in object_bounds.values()], axis = 0), np.max([bounds[1] for bounds in object_bounds.values()], axis = 0)
+
+def compute_framing(min_co:np.ndarray, max_co:np.ndarray, ppbu:float, edge_margin:float) -> tuple[int, int, float, mathutils.Vector, float, float]:
+    """
+        Computes the orthographic framing of camera-space extents.
+        
+        The resolution is rounded up to whole pixels and the orthographic scale is widened to match, so that exactly ppbu pixels
+        cover one Blender Unit. The camera is centered on the XY extents and pulled back so the closest geometry sits just past
+        the edge margin.
+        
+        Args:
+            min_co (np.ndarray): The minimum camera-space coordinates (x, y, z).
+            max_co (np.ndarray): The maximum camera-space coordinates (x, y, z).
+            ppbu (float): Pixels per Blender Unit.
+            edge_margin (float): Margin in Blender Units padded around the extents.
+        
+        Returns:
+            tuple[int, int, float, mathutils.Vector, float, float]: (res_x, res_y, ortho_scale, offset, clip_start, clip_end),
+                where offset is the camera-space translation to apply to the camera.
+    """
+    center_cam_x:float = (float(min_co[0]) + float(max_co[0])) / 2
+    center_cam_y:float = (float(min_co[1]) + float(max_co[1])) / 2
+    
+    if abs(center_cam_x) < 1e-6:
+        center_cam_x = 0
+    
+    if abs(center_cam_y) < 1e-6:
+        center_cam_y = 0
+    
+    view_width_bu:float = float(max_co[0] - min_co[0]) + 2 * edge_margin
+    view_height_bu:float = float(max_co[1] - min_co[1]) + 2 * edge_margin
+    
+    res_x:int = math.ceil(ppbu * view_width_bu)
+    res_y:int = math.ceil(ppbu * view_height_bu)
+    ortho_scale:float = max(res_x, res_y) / ppbu
+    
+    small:float = 0.001
+    target_closest:float = -(edge_margin + small)
+    k:float = float(max_co[2]) - target_closest
+    
+    new_min_z:float = float(min_co[2]) - k
+    
+    return res_x, res_y, ortho_scale, Vector((center_cam_x, center_cam_y, k)), small, -new_min_z + edge_margin
+
+def assign_if_changed(data:bpy.types.bpy_struct, **values:Any) -> None:
+    """
+        Assigns properties only where they differ from the given values.
+        
+        Every property assignment tags its data-block for a depsgraph update, which re-evaluates everything that depends on it
+        even if the value did not change. Skipping identical assignments keeps recompiles that change nothing free.
+        
+        Args:
+            data (bpy.types.bpy_struct): The struct to assign to.
+            **values (Any): The property values, keyed by property name.
+    """
+    for name, value in values.items():
+        if getattr(data, name) != value:
+            setattr(data, name, value)
+
+def apply_framing(scene:bpy.types.Scene, cam_obj:bpy.types.Object, framing:tuple[int, int, float, mathutils.Vector, float, float]) -> None:
+    """
+        Applies a framing computed by compute_framing to a camera and the scene's render resolution.
+        
+        Only properties that change are assigned, so reapplying an unchanged framing does not tag the camera or scene for a
+        depsgraph update.
+        
+        Args:
+            scene (bpy.types.Scene): The scene whose render resolution is set.
+            cam_obj (bpy.types.Object): The camera object to move and configure.
+            framing (tuple[int, int, float, mathutils.Vector, float, float]): The framing returned by compute_framing.
+    """
+    res_x, res_y, ortho_scale, offset, clip_start, clip_end = framing
+    
+    assign_if_changed(scene.render, resolution_x = res_x, resolution_y = res_y, resolution_percentage = 100)
+    
+    cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
+    assign_if_changed(cam_data, type = 'ORTHO', ortho_scale = ortho_scale, shift_x = 0, shift_y = 0)
+    
+    if offset.length > 1e-7:
+        cam_obj.location += cam_obj.matrix_world.to_3x3() @ offset
+    
+    assign_if_changed(cam_data, clip_start = clip_start, clip_end = clip_end)
+
+def get_world_coords(objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph) -> np.ndarray:
+    """
+        Gathers the world-space coordinates of a list of objects into a single array.
+        
+        Shared geometry is extracted once per geometry key and reduced to its convex hull when it has enough users, exactly as
+        in get_camera_space_bounds.
+        
+        Args:
+            objs (list[bpy.types.Object]): The objects to gather.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+        
+        Returns:
+            np.ndarray: An (N, 3) float64 array of world-space coordinates. Empty if the objects have no vertices.
+    """
+    groups:dict[str, list[bpy.types.Object]] = {}
+    
+    for obj in objs:
+        groups.setdefault(get_geometry_key(obj), []).append(obj)
+    
+    chunks:list[np.ndarray] = []
+    
+    for key, group in groups.items():
+        eval_objs:list[bpy.types.Object] = [eval_obj for eval_obj in (depsgraph.objects.get(obj.name) for obj in group) if eval_obj is not None]
+        
+        for eval_obj in eval_objs:
+            coords:np.ndarray = get_cached_local_coords(key, eval_obj, depsgraph, users = len(eval_objs))
+            
+            if not len(coords):
+                continue
+            
+            matrix:np.ndarray = np.array(eval_obj.matrix_world, dtype = np.float64)
+            chunks.append(coords @ matrix[:3, :3].T + matrix[:3, 3])
+    
+    if not chunks:
+        return np.empty((0, 3), dtype = np.float64)
+    
+    return np.concatenate(chunks)
+
+def get_multi_view_rotations(config:OrthoScale219ConfigProperties) -> list[mathutils.Matrix]:
+    """
+        Returns the world rotation of every view of a multi-view config.
+        
+        Views are spread evenly around the world Z axis, starting at multi_view_angle_offset, and each keeps the tilt of the
+        config's camera. An isometric config camera therefore yields the usual 4 or 8 isometric angles.
+        
+        Args:
+            config (OrthoScale219ConfigProperties): The multi-view config.
+        
+        Returns:
+            list[mathutils.Matrix]: One 3x3 rotation matrix per view.
+    """
+    base_rotation:mathutils.Matrix = config.camera.matrix_world.to_quaternion().to_matrix() if config.camera else mathutils.Matrix.Identity(3)
+    step:float = 2 * math.pi / config.multi_view_count
+    
+    return [mathutils.Matrix.Rotation(config.multi_view_angle_offset + index * step, 3, 'Z') @ base_rotation for index in range(config.multi_view_count)]
+
+def get_multi_view_bounds(world_coords:np.ndarray, rotations:list[mathutils.Matrix]) -> tuple[np.ndarray, np.ndarray]:
+    """
+        Projects world-space coordinates onto several camera rotations at once and returns the extents in each camera frame.
+        
+        All views are projected in a single batched matrix multiply per chunk of MULTI_VIEW_CHUNK_SIZE vertices, which keeps the
+        temporary (views, vertices, 3) array bounded in size.
+        
+        Args:
+            world_coords (np.ndarray): An (N, 3) array of world-space coordinates.
+            rotations (list[mathutils.Matrix]): The 3x3 world rotation of each view.
+        
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (min_co, max_co) as (views, 3) arrays of camera-space extents, with the camera at the
+                world origin.
+    """
+    stacked:np.ndarray = np.array([np.array(rotation, dtype = np.float64) for rotation in rotations])
+    min_co:np.ndarray = np.full((len(rotations), 3), np.inf)
+    max_co:np.ndarray = np.full((len(rotations), 3), -np.inf)
+    
+    for start in range(0, len(world_coords), MULTI_VIEW_CHUNK_SIZE):
+        cam_coords:np.ndarray = world_coords[None, start:start + MULTI_VIEW_CHUNK_SIZE] @ stacked
+        np.minimum(min_co, cam_coords.min(axis = 1), out = min_co)
+        np.maximum(max_co, cam_coords.max(axis = 1), out = max_co)
+    
+    return min_co, max_co
+
+def compile_multi_view(context:bpy.types.Context, config:OrthoScale219ConfigProperties, objs:list[bpy.types.Object]) -> list[tuple[bpy.types.Object, int, int]] | None:
+    """
+        Compiles every view of a multi-view config in one pass.
+        
+        The vertex data of the objects is pulled out of Blender once and projected onto all view rotations in a single batched
+        matrix multiply. A camera is created (or reused) per view, framed with compute_framing, and its resolution is stored on
+        the config's multi_view_cameras collection. Cameras left over from a previous, larger view count are removed. The first
+        view is applied to the scene afterward.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            config (OrthoScale219ConfigProperties): The multi-view config.
+            objs (list[bpy.types.Object]): The objects to frame.
+        
+        Returns:
+            list[tuple[bpy.types.Object, int, int]] | None: (camera, res_x, res_y) per view, or None if the objects have no
+                vertices.
+    """
+    depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
+    world_coords:np.ndarray = get_world_coords(objs, depsgraph)
+    
+    if not len(world_coords):
+        return None
+    
+    rotations:list[mathutils.Matrix] = get_multi_view_rotations(config)
+    min_co, max_co = get_multi_view_bounds(world_coords, rotations)
+    
+    while len(config.multi_view_cameras) > len(rotations):
+        stale_cam:bpy.types.Object | None = config.multi_view_cameras[-1].camera
+        config.multi_view_cameras.remove(len(config.multi_view_cameras) - 1)
+        
+        if stale_cam is not None:
+            stale_data:bpy.types.ID | None = stale_cam.data
+            bpy.data.objects.remove(stale_cam)
+            
+            if stale_data is not None and not stale_data.users:
+                bpy.data.cameras.remove(cast(bpy.types.Camera, stale_data))
+    
+    while len(config.multi_view_cameras) < len(rotations):
+        config.multi_view_cameras.add()
+    
+    views:list[tuple[bpy.types.Object, int, int]] = []
+    
+    for index, (view, rotation) in enumerate(zip(config.multi_view_cameras, rotations)):
+        view_cam:bpy.types.Object | None = view.camera
+        
+        if view_cam is None:
+            cam_data:bpy.types.Camera = cast(bpy.types.Camera, config.camera.data.copy()) if config.camera else bpy.data.cameras.new(f"{config.config_name} View {index + 1}")
+            view_cam = bpy.data.objects.new(f"{config.config_name} View {index + 1}", cam_data)
+            context.scene.collection.objects.link(view_cam)
+            view.camera = view_cam
+        
+        view_cam.matrix_world = rotation.to_4x4()
+        framing:tuple[int, int, float, mathutils.Vector, float, float] = compute_framing(min_co[index], max_co[index], config.pixels_per_blender_unit, config.edge_margin)
+        apply_framing(context.scene, view_cam, framing)
+        
+        view.res_x = framing[0]
+        view.res_y = framing[1]
+        views.append((view_cam, framing[0], framing[1]))
+    
+    context.scene.camera = views[0][0]
+    context.scene.render.resolution_x = views[0][1]
+    context.scene.render.resolution_y = views[0][2]
+    
+    return views
+
+class OrthoScale219SpatialIndex:
+    """
+        Uniform grid over the camera-space AABBs of a set of objects.
+        
+        Each object's XY extents are binned into every square cell they overlap, so rectangle queries only visit the cells the
+        rectangle covers instead of every object. Objects spanning more than max_cells_per_object cells are kept in a separate
+        oversized set that every query checks directly. The index is updated incrementally: objects can be inserted, moved, and
+        removed individually, and names marked dirty by on_depsgraph_update_post are refreshed by get_spatial_index on the next
+        query.
+        
+        Attributes:
+            frame_key (tuple[float, ...]): The camera rotation frame the extents were computed in.
+            cell_size (float): The width and height of a grid cell in Blender Units.
+            max_cells_per_object (int | None): Cell count above which an object is treated as oversized, or None for no limit.
+            names (set[str]): Every object name the index has been synced with, including objects without vertices.
+            bounds (dict[str, tuple[np.ndarray, np.ndarray]]): The (min_co, max_co) extents of each indexed object.
+            cells (dict[tuple[int, int], set[str]]): The names of the objects overlapping each non-empty cell.
+            dirty (set[str]): Names whose extents must be recomputed before the next query.
+    """
+    def __init__(self:OrthoScale219SpatialIndex, frame_key:tuple[float, ...], cell_size:float, max_cells_per_object:int | None = SPATIAL_INDEX_MAX_CELLS_PER_OBJECT) -> None:
+        """
+            Creates an empty spatial index.
+            
+            Args:
+                self (OrthoScale219SpatialIndex): The spatial index instance.
+                frame_key (tuple[float, ...]): The camera rotation frame the extents are computed in.
+                cell_size (float): The width and height of a grid cell in Blender Units.
+                max_cells_per_object (int | None): Cell count above which an object is treated as oversized, or None for no
+                    limit. Default: SPATIAL_INDEX_MAX_CELLS_PER_OBJECT.
+        """
+        self.frame_key:tuple[float, ...] = frame_key
+        self.cell_size:float = cell_size
+        self.max_cells_per_object:int | None = max_cells_per_object
+        self.names:set[str] = set()
+        self.bounds:dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self.cells:dict[tuple[int, int], set[str]] = {}
+        self.dirty:set[str] = set()
+        self._object_cells:dict[str, list[tuple[int, int]]] = {}
+        self._oversized:set[str] = set()
+    
+    def get_cell_range(self:OrthoScale219SpatialIndex, min_xy:Any, max_xy:Any) -> tuple[int, int, int, int]:
+        """
+            Returns the inclusive range of cells covered by a rectangle.
+            
+            Args:
+                self (OrthoScale219SpatialIndex): The spatial index instance.
+                min_xy (Any): The minimum corner of the rectangle.
+                max_xy (Any): The maximum corner of the rectangle.
+            
+            Returns:
+                tuple[int, int, int, int]: (min_x, min_y, max_x, max_y) cell indices.
+        """
+        min_x:int = math.floor(min_xy[0] / self.cell_size)
+        min_y:int = math.floor(min_xy[1] / self.cell_size)
+        
+        return min_x, min_y, max(math.ceil(max_xy[0] / self.cell_size) - 1, min_x), max(math.ceil(max_xy[1] / self.cell_size) - 1, min_y)
+    
+    def insert(self:OrthoScale219SpatialIndex, name:str, min_co:np.ndarray, max_co:np.ndarray) -> None:
+        """
+            Inserts an object, replacing any previous entry of the same name.
+            
+            Args:
+                self (OrthoScale219SpatialIndex): The spatial index instance.
+                name (str): The object name.
+                min_co (np.ndarray): The minimum camera-space coordinates of the object.
+                max_co (np.ndarray): The maximum camera-space coordinates of the object.
+        """
+        self.remove(name)
+        self.names.add(name)
+        self.bounds[name] = (min_co, max_co)
+        min_x, min_y, max_x, max_y = self.get_cell_range(min_co, max_co)
+        
+        if self.max_cells_per_object is not None and (max_x - min_x + 1) * (max_y - min_y + 1) > self.max_cells_per_object:
+            self._oversized.add(name)
+            
+            return
+        
+        object_cells:list[tuple[int, int]] = [(cell_x, cell_y) for cell_x in range(min_x, max_x + 1) for cell_y in range(min_y, max_y + 1)]
+        
+        for cell in object_cells:
+            self.cells.setdefault(cell, set()).add(name)
+        
+        self._object_cells[name] = object_cells
+    
+    def remove(self:OrthoScale219SpatialIndex, name:str) -> None:
+        """
+            Removes an object if it is indexed.
+            
+            Args:
+                self (OrthoScale219SpatialIndex): The spatial index instance.
+                name (str): The object name.
+        """
+        self.names.discard(name)
+        self.bounds.pop(name, None)
+        self._oversized.discard(name)
+        
+        for cell in self._object_cells.pop(name, ()):
+            members:set[str] = self.cells[cell]
+            members.discard(name)
+            
+            if not members:
+                del self.cells[cell]
+    
+    def query(self:OrthoScale219SpatialIndex, min_xy:Any, max_xy:Any) -> set[str]:
+        """
+            Returns the names of the objects whose extents overlap a rectangle.
+            
+            Args:
+                self (OrthoScale219SpatialIndex): The spatial index instance.
+                min_xy (Any): The minimum corner of the rectangle, in the index's camera rotation frame.
+                max_xy (Any): The maximum corner of the rectangle, in the index's camera rotation frame.
+            
+            Returns:
+                set[str]: The names of the overlapping objects.
+        """
+        min_x, min_y, max_x, max_y = self.get_cell_range(min_xy, max_xy)
+        candidates:set[str] = set(self._oversized)
+        
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self.cells):
+            for (cell_x, cell_y), members in self.cells.items():
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y:
+                    candidates |= members
+        else:
+            for cell_x in range(min_x, max_x + 1):
+                for cell_y in range(min_y, max_y + 1):
+                    candidates |= self.cells.get((cell_x, cell_y), set())
+        
+        return {name for name in candidates if self.bounds[name][0][0] <= max_xy[0] and self.bounds[name][1][0] >= min_xy[0] and self.bounds[name][0][1] <= max_xy[1] and self.bounds[name][1][1] >= min_xy[1]}
+    
+    def is_empty(self:OrthoScale219SpatialIndex, min_xy:Any, max_xy:Any) -> bool:
+        """
+            Returns whether no object's extents overlap a rectangle.
+            
+            Args:
+                self (OrthoScale219SpatialIndex): The spatial index instance.
+                min_xy (Any): The minimum corner of the rectangle, in the index's camera rotation frame.
+                max_xy (Any): The maximum corner of the rectangle, in the index's camera rotation frame.
+            
+            Returns:
+                bool: True if the rectangle is empty.
+        """
+        return not self.query(min_xy, max_xy)
+
+def get_spatial_index(context:bpy.types.Context, config:OrthoScale219ConfigProperties) -> OrthoScale219SpatialIndex | None:
+    """
+        Returns the spatial index of a configuration's objects, building or updating it as needed.
+        
+        Extents are kept in the rotation frame of the config's camera (its inverted world matrix without translation), so the
+        index stays valid when a compile only moves the camera. The index is rebuilt from scratch when the camera rotation
+        changes; otherwise only objects that were added, removed, or marked dirty by on_depsgraph_update_post are re-bounded.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            config (OrthoScale219ConfigProperties): The configuration to index.
+        
+        Returns:
+            OrthoScale219SpatialIndex | None: The up-to-date spatial index, or None if the config has no camera.
+    """
+    if config.camera is None:
+        return None
+    
+    frame_matrix:mathutils.Matrix = config.camera.matrix_world.inverted().to_3x3().to_4x4()
+    frame_key:tuple[float, ...] = tuple(value for row in frame_matrix for value in row)
+    index_key:str = f"{context.scene.name_full}:{config.path_from_id()}"
+    objs:dict[str, bpy.types.Object] = {obj.name:obj for obj in get_config_objects(config)}
+    depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
+    index:OrthoScale219SpatialIndex | None = ortho_scale_219_spatial_indices.get(index_key)
+    
+    if index is None or index.frame_key != frame_key:
+        object_bounds:dict[str, tuple[np.ndarray, np.ndarray]] = get_object_camera_bounds(list(objs.values()), depsgraph, frame_matrix)
+        sizes:list[float] = [float(max(bounds[1][0] - bounds[0][0], bounds[1][1] - bounds[0][1])) for bounds in object_bounds.values()]
+        cell_size:float = float(np.median(sizes)) if sizes else 0.0
+        index = OrthoScale219SpatialIndex(frame_key, cell_size if cell_size > 0 else 1.0)
+        
+        for name, bounds in object_bounds.items():
+            index.insert(name, bounds[0], bounds[1])
+        
+        index.names = set(objs)
+        ortho_scale_219_spatial_indices[index_key] = index
+        
+        return index
+    
+    for name in index.names - set(objs):
+        index.remove(name)
+    
+    refresh:list[bpy.types.Object] = [obj for name, obj in objs.items() if name not in index.names or name in index.dirty]
+    index.dirty.clear()
+    
+    if refresh:
+        object_bounds = get_object_camera_bounds(refresh, depsgraph, frame_matrix)
+        
+        for obj in refresh:
+            if obj.name in object_bounds:
+                index.insert(obj.name, object_bounds[obj.name][0], object_bounds[obj.name][1])
+            else:
+                index.remove(obj.name)
+                index.names.add(obj.name)
+    
+    return index
+
+def get_objects_in_frame(context:bpy.types.Context, config:OrthoScale219ConfigProperties) -> list[bpy.types.Object]:
+    """
+        Returns the objects of a configuration whose extents overlap the current orthographic frame of its camera.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            config (OrthoScale219ConfigProperties): The configuration to query.
+        
+        Returns:
+            list[bpy.types.Object]: The overlapping objects. Empty if the config has no camera.
+    """
+    index:OrthoScale219SpatialIndex | None = get_spatial_index(context, config)
+    
+    if index is None:
+        return []
+    
+    cam_data:bpy.types.Camera = cast(bpy.types.Camera, config.camera.data)
+    render:bpy.types.RenderSettings = context.scene.render
+    aspect:float = render.resolution_y / render.resolution_x if render.resolution_x else 1.0
+    half_width:float = cam_data.ortho_scale / 2 if aspect <= 1 else cam_data.ortho_scale / 2 / aspect
+    half_height:float = half_width * aspect
+    translation:mathutils.Vector = config.camera.matrix_world.inverted().translation
+    center_x:float = cam_data.shift_x * cam_data.ortho_scale - translation.x
+    center_y:float = cam_data.shift_y * cam_data.ortho_scale - translation.y
+    names:set[str] = index.query((center_x - half_width, center_y - half_height), (center_x + half_width, center_y + half_height))
+    
+    return [obj for obj in get_config_objects(config) if obj.name in names]
+
+def compile_tile_grid(context:bpy.types.Context, settings:OrthoScale219Settings) -> tuple[int, int] | None:
+    """
+        Compiles a fixed-pixel tile grid over the objects of every configuration.
+        
+        The global extents of all configured objects are computed once in the rotation frame of the tile camera. The plane is
+        divided into square tiles of tile_size pixels anchored at the world origin, so tile edges always fall on whole pixels
+        of the shared PPBU grid and tiles compiled at different times line up exactly. Each object's extents are binned into a
+        OrthoScale219SpatialIndex whose cells are the tiles, and only tiles covered by at least one object are emitted to
+        settings.tiles.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            settings (OrthoScale219Settings): The scene settings holding the configs and tile grid options.
+        
+        Returns:
+            tuple[int, int] | None: (emitted_tiles, skipped_empty_tiles), or None if the objects have no vertices.
+    """
+    objs:dict[str, bpy.types.Object] = {obj.name:obj for config in settings.configs for obj in get_config_objects(config)}
+    rotation:mathutils.Matrix = settings.tile_camera.matrix_world.to_quaternion().to_matrix()
+    scale:mathutils.Vector = settings.tile_camera.matrix_world.to_scale()
+    depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
+    object_bounds:dict[str, tuple[np.ndarray, np.ndarray]] = get_object_camera_bounds(list(objs.values()), depsgraph, rotation.transposed().to_4x4())
+    
+    if not object_bounds:
+        return None
+    
+    tile_bu:float = settings.tile_size / settings.tile_pixels_per_blender_unit
+    index:OrthoScale219SpatialIndex = OrthoScale219SpatialIndex(tuple(), tile_bu, max_cells_per_object = None)
+    
+    for name, bounds in object_bounds.items():
+        index.insert(name, bounds[0], bounds[1])
+    
+    occupied:list[tuple[int, int]] = sorted(index.cells)
+    occupied_cells:np.ndarray = np.array(occupied)
+    cell_range:np.ndarray = occupied_cells.max(axis = 0) - occupied_cells.min(axis = 0) + 1
+    
+    small:float = 0.001
+    max_z:float = max(float(bounds[1][2]) for bounds in object_bounds.values())
+    min_z:float = min(float(bounds[0][2]) for bounds in object_bounds.values())
+    
+    settings.tiles.clear()
+    
+    for tile_x, tile_y in occupied:
+        tile:OrthoScale219TileItem = settings.tiles.add()
+        tile.tile_x = tile_x
+        tile.tile_y = tile_y
+        tile.object_count = len(index.cells[(tile_x, tile_y)])
+        tile.location = rotation @ Vector(((tile_x + 0.5) * tile_bu, (tile_y + 0.5) * tile_bu, max_z + small))
+        tile.matrix = np.array(mathutils.Matrix.LocRotScale(tile.location, rotation, scale)).ravel().tolist()
+    
+    settings.tile_clip_end = max_z - min_z + 2 * small
+    settings.active_tile_index = 0
+    
+    return len(settings.tiles), int(cell_range.prod()) - len(settings.tiles)
+
+def get_point_count(obj:bpy.types.Object) -> int:
+    """
+        Returns the number of vertices or points stored in an object's data, without evaluating it.
+        
+        Args:
+            obj (bpy.types.Object): The object to count.
+        
+        Returns:
+            int: The vertex count of meshes, the point count of curves, point clouds, and hair curves, or 0 for text,
+                metaballs, and volumes, whose geometry only exists once evaluated.
+    """
+    data:bpy.types.ID | None = obj.data
+    
+    if isinstance(data, bpy.types.Mesh):
+        return len(data.vertices)
+    
+    if isinstance(data, bpy.types.Curve) and not isinstance(data, bpy.types.TextCurve):
+        return sum(len(spline.points) + len(spline.bezier_points) for spline in data.splines)
+    
+    if obj.type in {'POINTCLOUD', 'CURVES'}:
+        return len(data.points)
+    
+    return 0
+
+def get_evaluated_point_count(obj:bpy.types.Object, depsgraph:bpy.types.Depsgraph) -> int:
+    """
+        Estimates the number of coordinates reading an object's evaluated geometry allocates, without converting it to a mesh.
+        
+        Meshes outside Edit Mode, point clouds, and hair curves are counted from their evaluated data, so modifiers and
+        geometry nodes that generate or remove geometry are included. Objects whose coordinates are already in the geometry
+        cache allocate nothing. Curves, surfaces, text, and metaballs only have an evaluated mesh once converted, so they fall
+        back to get_point_count.
+        
+        Args:
+            obj (bpy.types.Object): The object to estimate.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+        
+        Returns:
+            int: The estimated number of coordinates, 8 for volumes, or 0 if the object is not evaluated or already cached.
+    """
+    eval_obj:bpy.types.Object | None = depsgraph.objects.get(obj.name)
+    
+    if eval_obj is None or get_geometry_key(obj) in ortho_scale_219_geometry_cache:
+        return 0
+    
+    if eval_obj.type == 'VOLUME':
+        return 8
+    
+    if eval_obj.type == 'MESH' and obj.mode != 'EDIT':
+        return len(cast(bpy.types.Mesh, eval_obj.data).vertices)
+    
+    if eval_obj.type in {'POINTCLOUD', 'CURVES'}:
+        return len(eval_obj.data.points)
+    
+    return get_point_count(obj)
+
+def get_triangle_count(obj:bpy.types.Object, depsgraph:bpy.types.Depsgraph) -> int:
+    """
+        Returns the number of primitives an object renders as: evaluated triangles, or points for point clouds and hair curves.
+        
+        Meshes read the triangulation Blender already caches on the evaluated mesh; curves, surfaces, text, and metaballs are
+        converted to a temporary evaluated mesh.
+        
+        Args:
+            obj (bpy.types.Object): The object to count.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+        
+        Returns:
+            int: The evaluated triangle count, the point count of point clouds and hair curves, or 0 for volumes.
+    """
+    if obj.type == 'VOLUME':
+        return 0
+    
+    if obj.type in {'POINTCLOUD', 'CURVES'}:
+        return get_point_count(obj)
+    
+    eval_obj:bpy.types.Object = obj.evaluated_get(depsgraph)
+    
+    if obj.type == 'MESH':
+        return len(cast(bpy.types.Mesh, eval_obj.data).loop_triangles)
+    
+    mesh:bpy.types.Mesh | None = eval_obj.to_mesh(depsgraph = depsgraph)
+    count:int = 0
+    
+    if mesh is not None:
+        mesh.calc_loop_triangles()
+        count = len(mesh.loop_triangles)
+    
+    eval_obj.to_mesh_clear()
+    
+    return count
+
+def get_render_samples(scene:bpy.types.Scene) -> int:
+    """
+        Returns the samples per pixel the scene's render engine takes.
+        
+        Args:
+            scene (bpy.types.Scene): The scene.
+        
+        Returns:
+            int: Cycles samples, EEVEE render samples, or 1 for other engines.
+    """
+    if scene.render.engine == 'CYCLES' and hasattr(scene, "cycles"):
+        return max(1, int(getattr(scene, "cycles").samples))
+    
+    if scene.render.engine.startswith('BLENDER_EEVEE'):
+        return max(1, scene.eevee.taa_render_samples)
+    
+    return 1
+
+def get_render_pixels(scene:bpy.types.Scene, res_x:int, res_y:int) -> float:
+    """
+        Returns the number of pixels a render at the given resolution shades, after the resolution percentage and border.
+        
+        Args:
+            scene (bpy.types.Scene): The scene, whose render settings apply.
+            res_x (int): The resolution width.
+            res_y (int): The resolution height.
+        
+        Returns:
+            float: The shaded pixel count.
+    """
+    render:bpy.types.RenderSettings = scene.render
+    pixels:float = res_x * res_y * (render.resolution_percentage / 100) ** 2
+    
+    if render.use_border:
+        pixels *= max(0.0, render.border_max_x - render.border_min_x) * max(0.0, render.border_max_y - render.border_min_y)
+    
+    return pixels
+
+def get_render_history_path() -> str:
+    """
+        Returns the path of the local render history.
+        
+        Returns:
+            str: The ORTHO_SCALE_219_RENDER_HISTORY environment variable if set, so render farm nodes can share one history,
+                otherwise RENDER_HISTORY_FILE_NAME in Blender's user config directory.
+    """
+    return os.environ.get("ORTHO_SCALE_219_RENDER_HISTORY") or os.path.join(bpy.utils.user_resource('CONFIG'), RENDER_HISTORY_FILE_NAME)
+
+def load_render_history() -> list[dict[str, Any]]:
+    """
+        Returns the entries of the local render history, cached until the file changes.
+        
+        The cache is keyed on the file's modification time in nanoseconds, size, and inode, so a history that another process
+        rewrites within the timestamp resolution of the file system is still reloaded; os.replace always gives it a new inode.
+        
+        Returns:
+            list[dict[str, Any]]: The recorded renders, oldest first; empty if there is no readable history.
+    """
+    path:str = get_render_history_path()
+    
+    try:
+        stat:os.stat_result = os.stat(path)
+    except OSError:
+        return []
+    
+    version:tuple[int, int, int] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached:tuple[tuple[int, int, int], list[dict[str, Any]]] | None = ortho_scale_219_render_history.get(path)
+    
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    try:
+        with open(path, encoding = "utf-8") as history_file:
+            entries:list[dict[str, Any]] = json.load(history_file)
+    except (OSError, ValueError):
+        entries = []
+    
+    ortho_scale_219_render_history[path] = (version, entries)
+    
+    return entries
+
+def record_render(entry:dict[str, Any]) -> None:
+    """
+        Appends a render to the local render history, keeping the newest RENDER_HISTORY_MAX_ENTRIES.
+        
+        The history is rewritten through a temporary file and os.replace, so a crash never leaves it half written, and the
+        cache of load_render_history is updated with the written entries.
+        
+        Args:
+            entry (dict[str, Any]): The render: engine, pixels, samples, triangles, seconds, peak_mb, config, and time.
+    """
+    path:str = get_render_history_path()
+    entries:list[dict[str, Any]] = [*load_render_history(), entry][-RENDER_HISTORY_MAX_ENTRIES:]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok = True)
+    
+    with open(f"{path}.{os.getpid()}.tmp", "w", encoding = "utf-8") as history_file:
+        json.dump(entries, history_file)
+    
+    os.replace(f"{path}.{os.getpid()}.tmp", path)
+    stat:os.stat_result = os.stat(path)
+    ortho_scale_219_render_history[path] = ((stat.st_mtime_ns, stat.st_size, stat.st_ino), entries)
+
+def fit_render_model(features:np.ndarray, targets:np.ndarray) -> np.ndarray:
+    """
+        Fits a linear model to history features by least squares, falling back to the first feature alone.
+        
+        With fewer entries than features, the system is underdetermined, so only the first feature is fitted, as a ratio.
+        
+        Args:
+            features (np.ndarray): An (N, F) array of features per recorded render; the first feature is the dominant one.
+            targets (np.ndarray): The N recorded values.
+        
+        Returns:
+            np.ndarray: The F coefficients.
+    """
+    coefficients:np.ndarray = np.zeros(features.shape[1])
+    
+    if len(targets) < features.shape[1]:
+        coefficients[0] = float(targets.sum()) / max(float(features[:, 0].sum()), 1e-9)
+    else:
+        scale:np.ndarray = np.maximum(np.abs(features).max(axis = 0), 1e-9)
+        coefficients = np.linalg.lstsq(features / scale, targets, rcond = None)[0] / scale
+    
+    return coefficients
+
+def estimate_render_cost(scene:bpy.types.Scene, config:OrthoScale219ConfigProperties) -> dict[str, float] | None:
+    """
+        Predicts the render time and peak memory of a compiled configuration from the local render history.
+        
+        Render time is modeled as a linear function of shaded pixels times samples, evaluated triangles, and a constant, and
+        peak memory as a constant plus linear terms in shaded pixels and triangles. Both are fitted by least squares over
+        the recorded renders of the scene's engine, so the estimate calibrates itself to the machine as renders are
+        recorded. Multi-view configs sum the time of their views and take the largest peak.
+        
+        Args:
+            scene (bpy.types.Scene): The scene that owns the config.
+            config (OrthoScale219ConfigProperties): The compiled configuration.
+        
+        Returns:
+            dict[str, float] | None: seconds, peak_mb, and renders (the number of recorded renders the fit is based on), or
+                None if no render with the scene's engine has been recorded yet.
+    """
+    entries:list[dict[str, Any]] = [entry for entry in load_render_history() if entry.get("engine") == scene.render.engine]
+    
+    if not entries:
+        return None
+    
+    history:np.ndarray = np.array([(entry["pixels"], entry["samples"], entry["triangles"], entry["seconds"], entry["peak_mb"]) for entry in entries], dtype = np.float64)
+    ones:np.ndarray = np.ones(len(history))
+    time_model:np.ndarray = fit_render_model(np.column_stack((history[:, 0] * history[:, 1], history[:, 2], ones)), history[:, 3])
+    memory_model:np.ndarray = fit_render_model(np.column_stack((ones, history[:, 0], history[:, 2])), history[:, 4])
+    
+    if config.use_multi_view:
+        resolutions:list[tuple[int, int]] = [(view.res_x, view.res_y) for view in config.multi_view_cameras if view.camera is not None]
+    else:
+        resolutions = [(scene.render.resolution_x, scene.render.resolution_y)]
+    
+    samples:int = get_render_samples(scene)
+    triangles:int = config.summary_triangle_count
+    seconds:float = 0.0
+    peak_mb:float = 0.0
+    
+    for res_x, res_y in resolutions:
+        pixels:float = get_render_pixels(scene, res_x, res_y)
+        seconds += max(0.0, float(time_model @ (pixels * samples, triangles, 1.0)))
+        peak_mb = max(peak_mb, float(memory_model @ (1.0, pixels, triangles)))
+    
+    return {
+        "seconds": seconds,
+        "peak_mb": peak_mb,
+        "renders": float(len(entries)),
+    }
+
+def update_config_summary(context:bpy.types.Context, config:OrthoScale219ConfigProperties, objs:list[bpy.types.Object], seconds:float, memory_before:tuple[float, float], recount:bool = True) -> None:
+    """
+        Stores the summary shown in the panel on the config, so redraws never recompute it.
+        
+        The peak resident memory of the compile is the process peak if the compile raised it. Otherwise the compile stayed
+        below an earlier peak, and the highest resident memory sampled before, during (streaming compiles only), and after the
+        compile is stored instead. The evaluated triangle count and the render estimate of estimate_render_cost are stored
+        too; counting triangles converts every non-mesh object, so it is skipped when recount is off.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context, whose scene owns the config.
+            config (OrthoScale219ConfigProperties): The compiled configuration.
+            objs (list[bpy.types.Object]): The objects that were compiled.
+            seconds (float): The wall time of the compile.
+            memory_before (tuple[float, float]): get_memory_usage_mb() taken at the start of the compile.
+            recount (bool): Whether to count the evaluated triangles again. Compiles that found the stored result up to date
+                pass False and keep the count of the compile that stored it. Default: True.
+    """
+    memory_after:tuple[float, float] = get_memory_usage_mb()
+    
+    config.summary_object_count = len(objs)
+    config.summary_vertex_count = sum(get_point_count(obj) for obj in objs)
+    config.summary_compile_seconds = seconds
+    config.summary_compiled_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    config.summary_peak_rss_mb = memory_after[1] if memory_after[1] > memory_before[1] else max(memory_before[0], memory_after[0], ortho_scale_219_peak_rss_mb[0])
+    
+    if recount:
+        depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
+        config.summary_triangle_count = sum(get_triangle_count(obj, depsgraph) for obj in objs)
+    
+    estimate:dict[str, float] | None = estimate_render_cost(context.scene, config)
+    config.summary_estimate_renders = int(estimate["renders"]) if estimate is not None else 0
+    config.summary_estimate_seconds = estimate["seconds"] if estimate is not None else 0.0
+    config.summary_estimate_peak_mb = estimate["peak_mb"] if estimate is not None else 0.0
+
+def get_geometry_fingerprint(obj:bpy.types.Object, memo:dict[str, str] | None = None) -> str:
+    """
+        Returns a fingerprint of an object's geometry that can be compared across sessions without evaluating it.
+        
+        Only meshes whose evaluated geometry equals their mesh data, i.e. without modifiers or shape keys, can be fingerprinted
+        from the data alone. Their fingerprint is the vertex count plus a BLAKE2b hash of the vertex positions.
+        
+        Args:
+            obj (bpy.types.Object): The object to fingerprint.
+            memo (dict[str, str] | None): Fingerprints already computed in the same pass, keyed by get_geometry_key, so linked
+                duplicates hash their shared mesh only once. Default: None.
+        
+        Returns:
+            str: The fingerprint, or an empty string if the object's geometry can only be known by evaluating it.
+    """
+    if obj.type != 'MESH' or obj.modifiers or obj.mode == 'EDIT':
+        return ""
+    
+    mesh:bpy.types.Mesh = cast(bpy.types.Mesh, obj.data)
+    
+    if mesh.shape_keys is not None:
+        return ""
+    
+    geometry_key:str = get_geometry_key(obj)
+    
+    if memo is not None and geometry_key in memo:
+        return memo[geometry_key]
+    
+    coords:np.ndarray = np.empty(len(mesh.vertices) * 3, dtype = np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    fingerprint:str = f"{len(mesh.vertices)}:{hashlib.blake2b(coords.tobytes(), digest_size = 16).hexdigest()}"
+    
+    if memo is not None:
+        memo[geometry_key] = fingerprint
+    
+    return fingerprint
+
+def is_compile_up_to_date(scene:bpy.types.Scene, config:OrthoScale219ConfigProperties, objs:list[bpy.types.Object], cam_obj:bpy.types.Object, fingerprints:dict[str, str]) -> bool:
+    """
+        Checks whether the compile result stored in a configuration still matches the scene, so compiling would change nothing.
+        
+        Args:
+            scene (bpy.types.Scene): The scene that owns the config.
+            config (OrthoScale219ConfigProperties): The configuration to check.
+            objs (list[bpy.types.Object]): The configuration's valid objects.
+            cam_obj (bpy.types.Object): The configuration's camera.
+            fingerprints (dict[str, str]): The geometry fingerprints of objs, keyed by object name.
+        
+        Returns:
+            bool: True if every object has an unchanged fingerprint and matrix, and the camera, framing settings, and render
+                resolution are those written by the stored compile.
+    """
+    cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
+    
+    if len(config.cached_bounds) != len(objs) or cam_data.type != 'ORTHO' or scene.render.resolution_percentage != 100:
+        return False
+    
+    if (scene.render.resolution_x, scene.render.resolution_y) != tuple(config.cached_resolution):
+        return False
+    
+    if not np.allclose(config.cached_framing, (config.pixels_per_blender_unit, config.edge_margin, cam_data.ortho_scale)):
+        return False
+    
+    if not np.allclose(config.cached_camera_matrix, np.array(cam_obj.matrix_world).ravel(), atol = 1e-5):
+        return False
+    
+    entries:dict[str, OrthoScale219BoundsItem] = {entry.source_object.name: entry for entry in config.cached_bounds if entry.source_object is not None}
+    
+    for obj in objs:
+        entry:OrthoScale219BoundsItem | None = entries.get(obj.name)
+        
+        if entry is None or not fingerprints[obj.name] or entry.fingerprint != fingerprints[obj.name]:
+            return False
+        
+        if not np.allclose(entry.matrix, np.array(obj.matrix_world).ravel(), atol = 1e-5):
+            return False
+    
+    return True
+
+def get_persisted_object_bounds(config:OrthoScale219ConfigProperties, objs:list[bpy.types.Object], fingerprints:dict[str, str], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix, budget_mb:float | None = None, pipelined:bool = False) -> tuple[dict[str, tuple[np.ndarray, np.ndarray]], int]:
+    """
+        Computes the camera-space extents of each object, reusing the extents stored in the configuration where possible.
+        
+        Stored extents are kept in the camera's linear frame, without its translation, so they stay valid after the compile
+        moves the camera. They are reused for objects whose fingerprint and world matrix are unchanged, as long as the camera's
+        rotation and scale are unchanged too. All other objects are bounded by get_object_camera_bounds, by
+        get_streamed_object_bounds if budget_mb is set, or by get_pipelined_object_bounds if pipelined is set.
+        
+        Args:
+            config (OrthoScale219ConfigProperties): The configuration holding the stored extents.
+            objs (list[bpy.types.Object]): The objects to bound.
+            fingerprints (dict[str, str]): The geometry fingerprints of objs, keyed by object name.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+            budget_mb (float | None): The geometry cache budget for streaming, or None to bound normally. Default: None.
+            pipelined (bool): Whether to overlap extraction and reduction when not streaming. Default: False.
+        
+        Returns:
+            tuple[dict[str, tuple[np.ndarray, np.ndarray]], int]: The (min_co, max_co) camera-space extents keyed by object name,
+                and the number of objects whose extents were reused. Objects without vertices are omitted.
+    """
+    cam_inv:np.ndarray = np.array(cam_matrix_inv, dtype = np.float64)
+    object_bounds:dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    missing:list[bpy.types.Object] = objs
+    
+    if len(config.cached_camera_linear) == 9 and np.allclose(config.cached_camera_linear, cam_inv[:3, :3].ravel(), atol = 1e-6):
+        entries:dict[str, OrthoScale219BoundsItem] = {entry.source_object.name: entry for entry in config.cached_bounds if entry.source_object is not None}
+        missing = []
+        
+        for obj in objs:
+            entry:OrthoScale219BoundsItem | None = entries.get(obj.name)
+            
+            if entry is None or not fingerprints[obj.name] or entry.fingerprint != fingerprints[obj.name] or not np.allclose(entry.matrix, np.array(obj.matrix_world).ravel(), atol = 1e-5):
+                missing.append(obj)
+            elif not entry.is_empty:
+                object_bounds[obj.name] = (np.array(entry.min_co) + cam_inv[:3, 3], np.array(entry.max_co) + cam_inv[:3, 3])
+    
+    reused:int = len(objs) - len(missing)
+    
+    if missing:
+        if budget_mb is None and pipelined:
+            object_bounds.update(get_pipelined_object_bounds(missing, depsgraph, cam_matrix_inv))
+        elif budget_mb is None:
+            object_bounds.update(get_object_camera_bounds(missing, depsgraph, cam_matrix_inv))
+        else:
+            object_bounds.update(get_streamed_object_bounds(missing, depsgraph, cam_matrix_inv, budget_mb))
+    
+    return object_bounds, reused
+
+def store_compile_result(config:OrthoScale219ConfigProperties, objs:list[bpy.types.Object], fingerprints:dict[str, str], object_bounds:dict[str, tuple[np.ndarray, np.ndarray]], cam_obj:bpy.types.Object, framing:tuple[int, int, float, mathutils.Vector, float, float]) -> None:
+    """
+        Stores a compile result in the configuration, so it is saved with the .blend file.
+        
+        Must be called before apply_framing, since the stored extents are taken relative to the camera's current matrix and the
+        stored camera matrix is the one apply_framing is about to produce.
+        
+        Args:
+            config (OrthoScale219ConfigProperties): The compiled configuration.
+            objs (list[bpy.types.Object]): The compiled objects.
+            fingerprints (dict[str, str]): The geometry fingerprints of objs, keyed by object name.
+            object_bounds (dict[str, tuple[np.ndarray, np.ndarray]]): The camera-space extents keyed by object name.
+            cam_obj (bpy.types.Object): The camera being framed.
+            framing (tuple[int, int, float, mathutils.Vector, float, float]): The framing returned by compute_framing.
+    """
+    cam_inv:np.ndarray = np.array(cam_obj.matrix_world.inverted(), dtype = np.float64)
+    config.cached_bounds.clear()
+    
+    for obj in objs:
+        entry:OrthoScale219BoundsItem = config.cached_bounds.add()
+        entry.source_object = obj
+        entry.fingerprint = fingerprints[obj.name]
+        entry.matrix = np.array(obj.matrix_world).ravel().tolist()
+        bounds:tuple[np.ndarray, np.ndarray] | None = object_bounds.get(obj.name)
+        entry.is_empty = bounds is None
+        
+        if bounds is not None:
+            entry.min_co = (bounds[0] - cam_inv[:3, 3]).tolist()
+            entry.max_co = (bounds[1] - cam_inv[:3, 3]).tolist()
+    
+    cam_matrix:mathutils.Matrix = cam_obj.matrix_world.copy()
+    cam_matrix.translation += cam_obj.matrix_world.to_3x3() @ framing[3]
+    
+    config.cached_camera_linear = cam_inv[:3, :3].ravel().tolist()
+    config.cached_camera_matrix = np.array(cam_matrix).ravel().tolist()
+    config.cached_resolution = (framing[0], framing[1])
+    config.cached_framing = (config.pixels_per_blender_unit, config.edge_margin, framing[2])
+
+def get_dedicated_camera(context:bpy.types.Context, config:OrthoScale219ConfigProperties, reset:bool = False) -> bpy.types.Object:
+    """
+        Returns the dedicated ortho camera of a configuration, creating it on first use.
+        
+        The dedicated camera gets its own copy of the source camera's data, so it keeps settings such as the sensor, depth of
+        field, and custom properties, while the source camera's type, lens, and shift are never touched. It follows the
+        source camera's transform: the source matrix is copied onto it whenever it differs from the one it was last copied
+        from, and left alone otherwise, so the framing offset of the last compile is kept and recompiling an unchanged setup
+        mutates nothing.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            config (OrthoScale219ConfigProperties): The configuration, whose camera must be set.
+            reset (bool): Whether to copy the source matrix even if it is unchanged, for compiles that bounded the objects
+                in the source camera's frame. Default: False.
+        
+        Returns:
+            bpy.types.Object: The dedicated ortho camera.
+    """
+    source:bpy.types.Object = cast(bpy.types.Object, config.camera)
+    ortho_cam:bpy.types.Object | None = config.ortho_camera
+    
+    if ortho_cam is None:
+        cam_data:bpy.types.Camera = cast(bpy.types.Camera, source.data.copy())
+        cam_data.name = f"{source.name} Ortho"
+        ortho_cam = bpy.data.objects.new(f"{source.name} Ortho", cam_data)
+        (source.users_collection or (context.scene.collection,))[0].objects.link(ortho_cam)
+        config.ortho_camera = ortho_cam
+        config.ortho_source_matrix = [0.0] * 16
+    
+    source_matrix:np.ndarray = np.array(source.matrix_world).ravel()
+    
+    if reset or not np.allclose(config.ortho_source_matrix, source_matrix, atol = 1e-6):
+        ortho_cam.matrix_world = source.matrix_world
+        config.ortho_source_matrix = source_matrix.tolist()
+    
+    return ortho_cam
+
+def activate_dedicated_camera(context:bpy.types.Context, config:OrthoScale219ConfigProperties, reset:bool = False) -> bpy.types.Object:
+    """
+        Makes the dedicated ortho camera of a configuration the scene camera, remembering the source shot's resolution first.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            config (OrthoScale219ConfigProperties): The configuration, whose camera must be set.
+            reset (bool): Passed on to get_dedicated_camera. Default: False.
+        
+        Returns:
+            bpy.types.Object: The dedicated ortho camera.
+    """
+    if context.scene.camera == config.camera:
+        config.source_resolution = (context.scene.render.resolution_x, context.scene.render.resolution_y)
+    
+    ortho_cam:bpy.types.Object = get_dedicated_camera(context, config, reset = reset)
+    
+    if context.scene.camera != ortho_cam:
+        context.scene.camera = ortho_cam
+    
+    return ortho_cam
+
+def get_render_camera(config:OrthoScale219ConfigProperties) -> bpy.types.Object | None:
+    """
+        Returns the camera a compiled single-view configuration renders through.
+        
+        Args:
+            config (OrthoScale219ConfigProperties): The configuration.
+        
+        Returns:
+            bpy.types.Object | None: The dedicated ortho camera if the config uses one and it exists, otherwise the config's
+                camera.
+    """
+    if config.use_dedicated_camera and config.ortho_camera is not None:
+        return config.ortho_camera
+    
+    return config.camera
+
+def get_isolation_objects(config:OrthoScale219ConfigProperties) -> list[bpy.types.Object]:
+    """
+        Returns the objects an isolated render of a configuration contains.
+        
+        Args:
+            config (OrthoScale219ConfigProperties): The configuration.
+        
+        Returns:
+            list[bpy.types.Object]: The config's objects, its render camera and multi-view cameras, and every object of its
+                isolation lights collection, without duplicates.
+    """
+    objs:list[bpy.types.Object] = get_config_objects(config)
+    objs.extend(obj for obj in (get_render_camera(config), *(view.camera for view in config.multi_view_cameras)) if obj is not None)
+    
+    if config.isolation_lights is not None:
+        objs.extend(config.isolation_lights.all_objects)
+    
+    return list(dict.fromkeys(objs))
+
+def get_isolation_collection(scene:bpy.types.Scene) -> bpy.types.Collection | None:
+    """
+        Returns the isolation collection of a scene, which begin_isolation tags with a custom property.
+        
+        Args:
+            scene (bpy.types.Scene): The scene.
+        
+        Returns:
+            bpy.types.Collection | None: The isolation collection, or None if the scene is not isolated.
+    """
+    return next((child for child in scene.collection.children if child.get("ortho_scale_219_isolation")), None)
+
+def begin_isolation(context:bpy.types.Context, config:OrthoScale219ConfigProperties) -> bpy.types.ViewLayer:
+    """
+        Makes the scene render only the objects of a configuration, through a temporary view layer.
+        
+        The isolation view layer and its collection are created on first use and reused afterwards: isolating another config
+        only links and unlinks the objects that differ, so batch renders of many configs in one scene pay the setup once. Every
+        collection except the isolation collection is excluded from the view layer, so excluded objects are never evaluated
+        for the render. Objects linked directly to the scene collection cannot be excluded and are hidden from rendering
+        instead. The isolation view layer is the only one enabled for rendering and, in the UI, becomes the window's view
+        layer. end_isolation restores all of this.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context, whose scene owns the config.
+            config (OrthoScale219ConfigProperties): The configuration to isolate.
+        
+        Returns:
+            bpy.types.ViewLayer: The isolation view layer.
+    """
+    scene:bpy.types.Scene = context.scene
+    state:dict[str, Any] | None = ortho_scale_219_isolation_states.get(scene.name)
+    
+    if state is None:
+        state = {
+            "use": {view_layer.name: view_layer.use for view_layer in scene.view_layers},
+            "hidden": [],
+            "window_view_layer": context.window.view_layer.name if context.window is not None else "",
+        }
+        ortho_scale_219_isolation_states[scene.name] = state
+    
+    collection:bpy.types.Collection | None = get_isolation_collection(scene)
+    
+    if collection is None:
+        collection = bpy.data.collections.new(ISOLATION_NAME)
+        collection["ortho_scale_219_isolation"] = True
+        scene.collection.children.link(collection)
+    
+    wanted:list[bpy.types.Object] = get_isolation_objects(config)
+    names:set[str] = {obj.name for obj in wanted}
+    
+    for obj in list(collection.objects):
+        if obj.name not in names:
+            collection.objects.unlink(obj)
+    
+    for obj in wanted:
+        if collection.objects.get(obj.name) is None:
+            collection.objects.link(obj)
+    
+    for name in state["hidden"]:
+        obj:bpy.types.Object | None = bpy.data.objects.get(name)
+        
+        if obj is not None and name in names:
+            obj.hide_render = False
+    
+    state["hidden"] = [name for name in state["hidden"] if name not in names]
+    
+    for obj in scene.collection.objects:
+        if obj.name not in names and not obj.hide_render:
+            obj.hide_render = True
+            state["hidden"].append(obj.name)
+    
+    view_layer:bpy.types.ViewLayer | None = scene.view_layers.get(ISOLATION_NAME)
+    
+    if view_layer is None:
+        view_layer = scene.view_layers.new(ISOLATION_NAME)
+    
+    for layer_collection in view_layer.layer_collection.children:
+        exclude:bool = layer_collection.collection != collection
+        
+        if layer_collection.exclude != exclude:
+            layer_collection.exclude = exclude
+    
+    for other in scene.view_layers:
+        if other.use != (other == view_layer):
+            other.use = other == view_layer
+    
+    if context.window is not None and context.window.scene == scene:
+        context.window.view_layer = view_layer
+    
+    return view_layer
+
+def end_isolation(context:bpy.types.Context) -> bool:
+    """
+        Tears down the isolation of the scene: removes its view layer and collection and restores what begin_isolation changed.
+        
+        Isolation left behind in a saved file is torn down too, re-enabling every other view layer for rendering; objects of
+        the scene collection hidden in the earlier session stay hidden.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context, whose scene is isolated.
+        
+        Returns:
+            bool: True if the scene was isolated, False otherwise.
+    """
+    scene:bpy.types.Scene = context.scene
+    state:dict[str, Any] | None = ortho_scale_219_isolation_states.pop(scene.name, None)
+    view_layer:bpy.types.ViewLayer | None = scene.view_layers.get(ISOLATION_NAME)
+    collection:bpy.types.Collection | None = get_isolation_collection(scene)
+    
+    if state is None and view_layer is None and collection is None:
+        return False
+    
+    if state is None:
+        for other in scene.view_layers:
+            if other != view_layer:
+                other.use = True
+    else:
+        for name in state["hidden"]:
+            obj:bpy.types.Object | None = bpy.data.objects.get(name)
+            
+            if obj is not None:
+                obj.hide_render = False
+        
+        for other in scene.view_layers:
+            if other.name in state["use"]:
+                other.use = state["use"][other.name]
+        
+        if context.window is not None and context.window.scene == scene and state["window_view_layer"] in scene.view_layers:
+            context.window.view_layer = scene.view_layers[state["window_view_layer"]]
+    
+    if view_layer is not None and len(scene.view_layers) > 1:
+        if context.window is not None and context.window.view_layer == view_layer:
+            context.window.view_layer = next(other for other in scene.view_layers if other != view_layer)
+        
+        scene.view_layers.remove(view_layer)
+    
+    if collection is not None:
+        bpy.data.collections.remove(collection)
+    
+    return True
+
+def compile_config(context:bpy.types.Context, config:OrthoScale219ConfigProperties, report:Callable[[set[str], str], Any]) -> bool:
+    """
+        Compiles a configuration: bounds its objects, frames its camera, and sets the render resolution.
+        
+        This is the body of the compile operator without the operator machinery, so scripts and the batch driver can compile
+        any config of any scene directly. Multi-view configs are compiled through compile_multi_view.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context, whose scene owns the config.
+            config (OrthoScale219ConfigProperties): The configuration to compile.
+            report (Callable[[set[str], str], Any]): Receives status messages, with the same signature as Operator.report.
+        
+        Returns:
+            bool: True on success, False on validation errors.
+        
+        Notes:
+            Reports ERROR for no objects/camera/vertices.
+            Reports WARNING for objects behind the camera.
+            Reports INFO on completion with setup details.
+            The config's summary, including the peak resident memory, is updated on success.
+            Streaming configs bound single-view compiles through get_streamed_object_bounds.
+            Single-view compiles store their result in the config, reuse stored extents of unchanged objects, and return
+            without touching the scene if is_compile_up_to_date.
+            Configs with use_dedicated_camera frame their dedicated ortho camera instead of the source camera and make it the
+            scene camera, remembering the resolution of the source camera's shot first.
+            Configs with use_occupancy run the occupancy pre-pass of update_occupancy on single-view compiles, and up-to-date
+            compiles only when the grid resolution changed. All other compiles switch the render border off, so the trimmed
+            border of an earlier compile does not crop this config's render.
+            Compiling leaves the render passes the config declares alone; run_batch_job applies them for its renders only.
+    """
+    start:float = time.perf_counter()
+    memory_before:tuple[float, float] = get_memory_usage_mb()
+    ortho_scale_219_peak_rss_mb[0] = 0.0
+    objs:list[bpy.types.Object] = get_config_objects(config)
+    
+    if not objs:
+        report({'ERROR'}, "No valid objects in the active config's list!")
+        
+        return False
+    
+    cam_obj:bpy.types.Object | None = config.camera
+    
+    if cam_obj is None or cam_obj.type != 'CAMERA':
+        report({'ERROR'}, "No valid camera selected in active config.")
+        
+        return False
+    
+    if config.use_multi_view or not (config.use_occupancy and config.use_occupancy_border):
+        assign_if_changed(context.scene.render, use_border = False)
+    
+    if config.use_multi_view:
+        views:list[tuple[bpy.types.Object, int, int]] | None = compile_multi_view(context, config, objs)
+        
+        if views is None:
+            report({'ERROR'}, "No valid vertices found in objects!")
+            
+            return False
+        
+        update_config_summary(context, config, objs, time.perf_counter() - start, memory_before)
+        report({'INFO'}, f"OrthoScale219 multi-view compiling complete: {len(views)} view(s), " + ", ".join(f"{view_cam.name} {res_x}x{res_y}" for view_cam, res_x, res_y in views))
+        
+        return True
+    
+    if config.use_dedicated_camera:
+        cam_obj = activate_dedicated_camera(context, config)
+    
+    depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
+    fingerprint_memo:dict[str, str] = {}
+    fingerprints:dict[str, str] = {obj.name: get_geometry_fingerprint(obj, fingerprint_memo) for obj in objs}
+    cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
+    
+    if is_compile_up_to_date(context.scene, config, objs, cam_obj, fingerprints):
+        if config.use_occupancy and config.summary_occupancy_resolution != config.occupancy_resolution:
+            update_occupancy(context, config, objs, depsgraph, cam_obj.matrix_world.inverted(), (cam_data.shift_x * cam_data.ortho_scale, cam_data.shift_y * cam_data.ortho_scale), context.scene.render.resolution_x, context.scene.render.resolution_y, cam_data.ortho_scale)
+        elif config.use_occupancy and config.use_occupancy_border:
+            apply_occupancy_border(context.scene, config)
+        
+        update_config_summary(context, config, objs, time.perf_counter() - start, memory_before, recount = False)
+        report({'INFO'}, f"OrthoScale219 compile is up to date: Resolution {config.cached_resolution[0]}x{config.cached_resolution[1]}, Orthographic Scale {cam_data.ortho_scale}")
+        
+        return True
+    
+    cam_matrix_inv:mathutils.Matrix = cam_obj.matrix_world.inverted()
+    object_bounds, reused = get_persisted_object_bounds(config, objs, fingerprints, depsgraph, cam_matrix_inv, budget_mb = config.streaming_budget_mb if config.use_streaming else None, pipelined = config.use_pipelined)
+    
+    if not object_bounds:
+        report({'ERROR'}, "No valid vertices found in objects!")
+        
+        return False
+    
+    min_co:np.ndarray = np.min([bounds[0] for bounds in object_bounds.values()], axis = 0)
+    max_co:np.ndarray = np.max([bounds[1] for bounds in object_bounds.values()], axis = 0)
+    
+    if max_co[2] > 0:
+        report({'WARNING'}, "Some objects are behind the camera; they may not render correctly.")
+    
+    framing:tuple[int, int, float, mathutils.Vector, float, float] = compute_framing(min_co, max_co, config.pixels_per_blender_unit, config.edge_margin)
+    store_compile_result(config, objs, fingerprints, object_bounds, cam_obj, framing)
+    
+    if config.use_occupancy:
+        update_occupancy(context, config, objs, depsgraph, cam_matrix_inv, (framing[3].x, framing[3].y), framing[0], framing[1], framing[2])
+    
+    apply_framing(context.scene, cam_obj, framing)
+    
+    update_config_summary(context, config, objs, time.perf_counter() - start, memory_before)
+    
+    report({'INFO'}, f"OrthoScale219 camera compiling complete: Resolution {framing[0]}x{framing[1]}, Orthographic Scale {cam_data.ortho_scale}, Pixels Per Blender Unit {config.pixels_per_blender_unit}, Clip Start/End {cam_data.clip_start}/{cam_data.clip_end}, Reused {reused}/{len(objs)} Stored Extents, Peak RSS {config.summary_peak_rss_mb:.0f} MB" + (f", Empty {config.summary_empty_fraction:.0%}" if config.use_occupancy else ""))
+    
+    return True
+
+def get_local_triangles(eval_obj:bpy.types.Object, depsgraph:bpy.types.Depsgraph) -> np.ndarray | None:
+    """
+        Extracts the local-space triangles of an evaluated object from a temporary evaluated mesh.
+        
+        Meshes without faces, such as unbeveled curves, return their edges as degenerate triangles instead.
+        
+        Args:
+            eval_obj (bpy.types.Object): The evaluated object to extract triangles from.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+        
+        Returns:
+            np.ndarray | None: An (N, 3, 3) float32 array of triangle corners, or None for volumes, point clouds, and hair
+                curves, which have no faces.
+    """
+    if eval_obj.type in {'VOLUME', 'POINTCLOUD', 'CURVES'}:
+        return None
+    
+    mesh:bpy.types.Mesh | None = eval_obj.to_mesh(depsgraph = depsgraph)
+    
+    if mesh is None:
+        eval_obj.to_mesh_clear()
+        
+        return np.empty((0, 3, 3), dtype = np.float32)
+    
+    coords:np.ndarray = np.empty(len(mesh.vertices) * 3, dtype = np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    mesh.calc_loop_triangles()
+    
+    if mesh.loop_triangles:
+        indices:np.ndarray = np.empty(len(mesh.loop_triangles) * 3, dtype = np.int32)
+        mesh.loop_triangles.foreach_get("vertices", indices)
+        indices = indices.reshape(-1, 3)
+    else:
+        indices = np.empty(len(mesh.edges) * 2, dtype = np.int32)
+        mesh.edges.foreach_get("vertices", indices)
+        indices = indices.reshape(-1, 2)[:, [0, 1, 1]]
+    
+    eval_obj.to_mesh_clear()
+    
+    return coords.reshape(-1, 3)[indices]
+
+def rasterize_triangles(triangles:np.ndarray, occupancy:np.ndarray) -> None:
+    """
+        Marks every cell of an occupancy grid that a 2D triangle overlaps, conservatively.
+        
+        Triangles within a single cell mark it directly. Larger triangles are expanded into one candidate per cell of their
+        bounding box, in chunks of MULTI_VIEW_CHUNK_SIZE candidates, and a candidate cell is kept unless one of the triangle's
+        edges separates it from the triangle. Together with the bounding box this is the separating axis test, so a cell is
+        marked exactly when it touches the triangle and a long diagonal triangle does not fill its whole bounding box.
+        Degenerate triangles (edges) keep the cells their line passes through.
+        
+        Args:
+            triangles (np.ndarray): An (N, 3, 2) array of triangle corners in cell units, x along columns and y along rows.
+            occupancy (np.ndarray): The (rows, columns) boolean grid to mark, modified in place.
+    """
+    rows, columns = occupancy.shape
+    low:np.ndarray = np.floor(triangles.min(axis = 1)).astype(np.int64)
+    high:np.ndarray = np.floor(triangles.max(axis = 1)).astype(np.int64)
+    inside:np.ndarray = (high[:, 0] >= 0) & (high[:, 1] >= 0) & (low[:, 0] < columns) & (low[:, 1] < rows)
+    triangles, low, high = triangles[inside], low[inside], high[inside]
+    low = np.maximum(low, 0)
+    high = np.minimum(high, (columns - 1, rows - 1))
+    spans:np.ndarray = high - low + 1
+    counts:np.ndarray = spans[:, 0] * spans[:, 1]
+    single:np.ndarray = counts == 1
+    occupancy[low[single, 1], low[single, 0]] = True
+    
+    remaining:np.ndarray = np.flatnonzero(~single)
+    
+    while remaining.size:
+        chunk_end:int = max(1, int(np.searchsorted(np.cumsum(counts[remaining]), MULTI_VIEW_CHUNK_SIZE, side = 'right')))
+        chunk:np.ndarray = remaining[:chunk_end]
+        remaining = remaining[chunk_end:]
+        
+        chunk_counts:np.ndarray = counts[chunk]
+        candidate:np.ndarray = np.repeat(chunk, chunk_counts)
+        offsets:np.ndarray = np.arange(candidate.size) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        cell_x:np.ndarray = low[candidate, 0] + offsets % spans[candidate, 0]
+        cell_y:np.ndarray = low[candidate, 1] + offsets // spans[candidate, 0]
+        keep:np.ndarray = np.ones(candidate.size, dtype = bool)
+        corners:np.ndarray = triangles[candidate]
+        
+        for edge in range(3):
+            start:np.ndarray = corners[:, edge]
+            edge_vector:np.ndarray = corners[:, (edge + 1) % 3] - start
+            normal:np.ndarray = np.stack((-edge_vector[:, 1], edge_vector[:, 0]), axis = 1)
+            side:np.ndarray = np.sign(np.einsum('ij,ij->i', normal, corners[:, (edge + 2) % 3] - start))
+            highest:np.ndarray = normal[:, 0] * (cell_x + (normal[:, 0] > 0) - start[:, 0]) + normal[:, 1] * (cell_y + (normal[:, 1] > 0) - start[:, 1])
+            lowest:np.ndarray = normal[:, 0] * (cell_x + (normal[:, 0] < 0) - start[:, 0]) + normal[:, 1] * (cell_y + (normal[:, 1] < 0) - start[:, 1])
+            keep &= ((side < 0) | (highest >= -1e-6)) & ((side > 0) | (lowest <= 1e-6))
+        
+        occupancy[cell_y[keep], cell_x[keep]] = True
+
+def compute_occupancy(objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix, frame_min:tuple[float, float], frame_max:tuple[float, float], resolution:int) -> np.ndarray:
+    """
+        Rasterizes the projected triangles of objects into a coarse occupancy grid of an orthographic frame.
+        
+        This is the occupancy pre-pass: it extends the camera-space projection of the compile from vertices to triangles, so
+        empty corners inside the bounding box (L-shaped buildings, diagonal roads) show up as empty cells. Objects without
+        faces mark the cells of their projected bounding rectangle.
+        
+        Args:
+            objs (list[bpy.types.Object]): The objects to rasterize.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera.
+            frame_min (tuple[float, float]): The camera-space (x, y) of the frame's bottom-left corner.
+            frame_max (tuple[float, float]): The camera-space (x, y) of the frame's top-right corner.
+            resolution (int): Cells along the longer side of the frame.
+        
+        Returns:
+            np.ndarray: A (rows, columns) boolean grid, row 0 at the bottom of the frame, True where geometry is.
+    """
+    size:np.ndarray = np.maximum(np.subtract(frame_max, frame_min), 1e-9)
+    columns:int = max(1, round(resolution * size[0] / size.max()))
+    rows:int = max(1, round(resolution * size[1] / size.max()))
+    occupancy:np.ndarray = np.zeros((rows, columns), dtype = bool)
+    scale:np.ndarray = np.array((columns, rows)) / size
+    
+    for obj in objs:
+        eval_obj:bpy.types.Object = obj.evaluated_get(depsgraph)
+        matrix:np.ndarray = np.array(cam_matrix_inv @ eval_obj.matrix_world, dtype = np.float64)[:2]
+        triangles:np.ndarray | None = get_local_triangles(eval_obj, depsgraph)
+        
+        if triangles is None:
+            coords:np.ndarray = get_local_coords(eval_obj, depsgraph)
+            
+            if not len(coords):
+                continue
+            
+            projected:np.ndarray = coords @ matrix[:, :3].T + matrix[:, 3]
+            low, high = projected.min(axis = 0), projected.max(axis = 0)
+            rectangle:np.ndarray = np.array((low, (high[0], low[1]), high, (low[0], high[1])))
+            cells:np.ndarray = ((rectangle - frame_min) * scale)[np.array([[0, 1, 2], [0, 2, 3]])]
+        else:
+            cells = ((triangles @ matrix[:, :3].T + matrix[:, 3]) - frame_min) * scale
+        
+        rasterize_triangles(cells, occupancy)
+    
+    return occupancy
+
+def update_occupancy(context:bpy.types.Context, config:OrthoScale219ConfigProperties, objs:list[bpy.types.Object], depsgraph:bpy.types.Depsgraph, cam_matrix_inv:mathutils.Matrix, frame_center:tuple[float, float], res_x:int, res_y:int, ortho_scale:float) -> None:
+    """
+        Runs the occupancy pre-pass of a compiled configuration and stores its empty fraction and border on the config.
+        
+        With use_occupancy_border, the render border is set to the occupied cells (with cropping off, so the image keeps its
+        full size and framing) or switched off if every edge of the frame is occupied. The grid is conservative, so no
+        geometry is ever trimmed.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            config (OrthoScale219ConfigProperties): The compiled configuration.
+            objs (list[bpy.types.Object]): The configuration's objects.
+            depsgraph (bpy.types.Depsgraph): The evaluated depsgraph.
+            cam_matrix_inv (mathutils.Matrix): The inverted world matrix of the camera the frame is centered in.
+            frame_center (tuple[float, float]): The camera-space (x, y) of the frame center.
+            res_x (int): The render resolution width.
+            res_y (int): The render resolution height.
+            ortho_scale (float): The orthographic scale of the camera.
+    """
+    half_width:float = ortho_scale / 2 * res_x / max(res_x, res_y, 1)
+    half_height:float = ortho_scale / 2 * res_y / max(res_x, res_y, 1)
+    occupancy:np.ndarray = compute_occupancy(objs, depsgraph, cam_matrix_inv, (frame_center[0] - half_width, frame_center[1] - half_height), (frame_center[0] + half_width, frame_center[1] + half_height), config.occupancy_resolution)
+    rows, columns = occupancy.shape
+    occupied_rows:np.ndarray = np.flatnonzero(occupancy.any(axis = 1))
+    occupied_columns:np.ndarray = np.flatnonzero(occupancy.any(axis = 0))
+    
+    config.summary_empty_fraction = 1.0 - float(occupancy.mean())
+    config.summary_occupancy_resolution = config.occupancy_resolution
+    config.occupancy_border = (occupied_columns[0] / columns, occupied_rows[0] / rows, (occupied_columns[-1] + 1) / columns, (occupied_rows[-1] + 1) / rows) if occupied_rows.size else (0.0, 0.0, 1.0, 1.0)
+    
+    if config.use_occupancy_border:
+        apply_occupancy_border(context.scene, config)
+
+def apply_occupancy_border(scene:bpy.types.Scene, config:OrthoScale219ConfigProperties) -> None:
+    """
+        Sets the render border to the occupancy border stored on a configuration, assigning only what changes.
+        
+        Args:
+            scene (bpy.types.Scene): The scene whose render border is set.
+            config (OrthoScale219ConfigProperties): The configuration whose occupancy pre-pass has run.
+    """
+    border:tuple[float, ...] = tuple(config.occupancy_border)
+    
+    if border == (0.0, 0.0, 1.0, 1.0):
+        assign_if_changed(scene.render, use_border = False)
+    else:
+        assign_if_changed(scene.render, use_border = True, use_crop_to_border = False, border_min_x = border[0], border_min_y = border[1], border_max_x = border[2], border_max_y = border[3])
+
+def apply_render_passes(scene:bpy.types.Scene, config:OrthoScale219ConfigProperties) -> dict[str, Any] | None:
+    """
+        Enables the view layer passes and multilayer EXR output of the passes a configuration declares, for one render.
+        
+        All passes come out of the same render, so every map lines up pixel for pixel with the compiled framing. Passes are
+        only ever enabled, never disabled, on every view layer that is used for rendering. Configs that declare more than
+        color switch the output to a 32-bit float multilayer EXR, so depth and object indices are stored exactly. Config
+        objects without a pass index get their position in the config's list, so the object index pass tells them apart.
+        Everything changed here is recorded in the returned state, which restore_render_passes puts back after the render.
+        
+        Args:
+            scene (bpy.types.Scene): The scene the configuration renders.
+            config (OrthoScale219ConfigProperties): The configuration whose render_passes to enable.
+        
+        Returns:
+            dict[str, Any] | None: The previous pass settings per view layer, the previous output format, and the names of
+                the objects that were given a pass index, or None if the config only declares color and nothing changed.
+    """
+    if not config.render_passes - {'COLOR'}:
+        return None
+    
+    image_settings:bpy.types.ImageFormatSettings = scene.render.image_settings
+    state:dict[str, Any] = {
+        "view_layers": {},
+        "image_settings": {"file_format": image_settings.file_format, "color_mode": image_settings.color_mode, "color_depth": image_settings.color_depth},
+        "pass_index": [],
+    }
+    
+    for view_layer in scene.view_layers:
+        if view_layer.use:
+            state["view_layers"][view_layer.name] = {RENDER_PASSES[key][0]: getattr(view_layer, RENDER_PASSES[key][0]) for key in config.render_passes}
+            assign_if_changed(view_layer, **{RENDER_PASSES[key][0]: True for key in config.render_passes})
+    
+    assign_if_changed(image_settings, file_format = 'OPEN_EXR_MULTILAYER', color_depth = '32')
+    
+    if 'OBJECT_INDEX' in config.render_passes:
+        for index, obj in enumerate(get_config_objects(config)):
+            if obj.pass_index == 0:
+                obj.pass_index = index + 1
+                state["pass_index"].append(obj.name)
+    
+    return state
+
+def restore_render_passes(scene:bpy.types.Scene, state:dict[str, Any] | None) -> None:
+    """
+        Restores the pass settings, output format, and pass indices that apply_render_passes changed.
+        
+        Args:
+            scene (bpy.types.Scene): The rendered scene.
+            state (dict[str, Any] | None): The state returned by apply_render_passes; None restores nothing.
+    """
+    if state is None:
+        return
+    
+    for name, values in state["view_layers"].items():
+        view_layer:bpy.types.ViewLayer | None = scene.view_layers.get(name)
+        
+        if view_layer is not None:
+            assign_if_changed(view_layer, **values)
+    
+    assign_if_changed(scene.render.image_settings, **state["image_settings"])
+    
+    for name in state["pass_index"]:
+        obj:bpy.types.Object | None = bpy.data.objects.get(name)
+        
+        if obj is not None:
+            obj.pass_index = 0
+
+def get_memory_usage_mb() -> tuple[float, float]:
+    """
+        Returns the current and peak resident memory of the Blender process.
+        
+        Returns:
+            tuple[float, float]: (current_mb, peak_mb). The current value is only available on Linux and the peak value only
+                where the resource module exists; unavailable values are 0.0.
+    """
+    current_mb:float = 0.0
+    peak_mb:float = 0.0
+    
+    try:
+        with open("/proc/self/statm", encoding = "ascii") as statm:
+            current_mb = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    if resource is not None:
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+    
+    return current_mb, peak_mb
+
+def measure_compile_undo(context:bpy.types.Context, iterations:int = 1000) -> dict[str, dict[str, float]]:
+    """
+        Measures the time and memory growth of repeated compiles of the active config with and without undo pushes.
+        
+        The 'OPERATOR_UNDO' run invokes the compile operator the way a button press does, with use_compile_undo on, and pushes
+        one global undo step per compile. The 'OPERATOR_NO_UNDO' run invokes it with use_compile_undo off, and the 'DIRECT' run
+        calls compile_config; neither pushes undo steps. use_compile_undo is restored afterwards. Run it from the Python console
+        of an interactive session; background sessions have no undo stack, so all runs behave the same there.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            iterations (int): The number of compiles per run. Default: 1000.
+        
+        Returns:
+            dict[str, dict[str, float]]: {'OPERATOR_UNDO': ..., 'OPERATOR_NO_UNDO': ..., 'DIRECT': ...}, each with seconds,
+                seconds_per_compile, and rss_growth_mb.
+    """
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+    config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+    use_compile_undo:bool = settings.use_compile_undo
+    results:dict[str, dict[str, float]] = {}
+    
+    try:
+        for mode in ('OPERATOR_UNDO', 'OPERATOR_NO_UNDO', 'DIRECT'):
+            settings.use_compile_undo = mode == 'OPERATOR_UNDO'
+            rss_before:float = get_memory_usage_mb()[0]
+            start:float = time.perf_counter()
+            
+            for _ in range(iterations):
+                if mode == 'DIRECT':
+                    compile_config(context, config, lambda report_type, message: None)
+                else:
+                    bpy.ops.render.ortho_scale_219_compile('INVOKE_DEFAULT')
+            
+            seconds:float = time.perf_counter() - start
+            results[mode] = {
+                "seconds": seconds,
+                "seconds_per_compile": seconds / max(1, iterations),
+                "rss_growth_mb": get_memory_usage_mb()[0] - rss_before,
+            }
+    finally:
+        settings.use_compile_undo = use_compile_undo
+    
+    return results
+
+def push_compile_undo(context:bpy.types.Context, message:str) -> bool:
+    """
+        Pushes a global undo step after a compile from the panel, unless the scene's use_compile_undo is off.
+        
+        The compile operators do not carry the 'UNDO' option, whose undo push cannot be turned off, and push their step through
+        here instead, only when invoked from the panel. Scripted calls run execute directly and never push a step, like
+        operators with the 'UNDO' option called from scripts.
+        
+        Args:
+            context (bpy.types.Context): The current Blender context.
+            message (str): The name of the undo step.
+        
+        Returns:
+            bool: True if an undo step was pushed, False if undo pushes are turned off or unavailable, as in background mode.
+    """
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+    
+    if not settings.use_compile_undo or not bpy.ops.ed.undo_push.poll():
+        return False
+    
+    bpy.ops.ed.undo_push(message = message)
+    
+    return True
+
+def prune_stale_objects(config:OrthoScale219ConfigProperties) -> int:
+    """
+        Removes the object items of a configuration whose object was deleted or is no longer of a supported type.
+        
+        Args:
+            config (OrthoScale219ConfigProperties): The configuration to validate.
+        
+        Returns:
+            int: The number of removed items.
+    """
+    stale:list[int] = [index for index, item in enumerate(config.blender_objects) if item.mesh_object is None or not mesh_poll(config, item.mesh_object)]
+    
+    for index in reversed(stale):
+        config.blender_objects.remove(index)
+    
+    if stale:
+        config.active_object_index = min(config.active_object_index, max(0, len(config.blender_objects) - 1))
+    
+    return len(stale)
+
+def prune_all_configs() -> int:
+    """
+        Removes stale object items from every configuration of every scene in one pass.
+        
+        Returns:
+            int: The number of removed items.
+    """
+    removed:int = 0
+    
+    for scene in bpy.data.scenes:
+        settings:OrthoScale219Settings | None = getattr(scene, "ortho_scale_219_settings", None)
+        
+        if settings is not None:
+            removed += sum(prune_stale_objects(config) for config in settings.configs)
+    
+    ortho_scale_219_object_count[0] = len(bpy.data.objects)
+    
+    return removed
+
+def prune_all_configs_timer() -> None:
+    """
+        Timer callback that prunes stale object items outside of the depsgraph handler that detected the removal.
+    """
+    prune_all_configs()
+
+def clear_geometry_cache() -> None:
+    """
+        Clears all cached geometry, extents, and spatial indices.
+    """
+    ortho_scale_219_geometry_cache.clear()
+    ortho_scale_219_geometry_cache_bytes[0] = 0
+    ortho_scale_219_extents_cache.clear()
+    ortho_scale_219_spatial_indices.clear()
+
+@persistent
+def on_depsgraph_update_post(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph) -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+    """
+        Invalidates cached geometry for objects and data whose geometry changed, marks moved or reshaped objects dirty in every
+        spatial index, and schedules pruning of stale object items when objects were removed.
+        
+        Args:
+            scene (bpy.types.Scene): The scene that was updated (unused).
+            depsgraph (bpy.types.Depsgraph): The depsgraph holding the list of updates.
+        
+        Notes:
+            When the number of objects in the file drops, stale object items are pruned from a timer, since ID properties should
+            not be edited while the depsgraph is being updated.
+    """
+    object_count:int = len(bpy.data.objects)
+    
+    if object_count < ortho_scale_219_object_count[0] and not bpy.app.timers.is_registered(prune_all_configs_timer):
+        bpy.app.timers.register(prune_all_configs_timer, first_interval = 0.0)
+    
+    ortho_scale_219_object_count[0] = object_count
+    
+    if ortho_scale_219_spatial_indices:
+        updated_objects:set[str] = {update.id.original.name for update in depsgraph.updates if isinstance(update.id, bpy.types.Object) and (update.is_updated_transform or update.is_updated_geometry)}
+        
+        for index in ortho_scale_219_spatial_indices.values():
+            index.dirty |= updated_objects & index.names
+    
+    if not ortho_scale_219_geometry_cache and not ortho_scale_219_extents_cache:
+        return
+    
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        
+        id_data:bpy.types.ID = update.id.original
+        keys:set[str] = set()
+        
+        if isinstance(id_data, bpy.types.Object):
+            keys.add(f"OBJECT:{id_data.name_full}")
+            keys.add(get_geometry_key(id_data))
+            ortho_scale_219_extents_cache.pop(id_data.name_full, None)
+        else:
+            keys.add(f"DATA:{id_data.name_full}")
+        
+        for key in keys:
+            coords:np.ndarray | None = ortho_scale_219_geometry_cache.pop(key, None)
+            
+            if coords is not None:
+                ortho_scale_219_geometry_cache_bytes[0] -= coords.nbytes
+        
+        for name in [name for name, entry in ortho_scale_219_extents_cache.items() if entry[0] in keys]:
+            del ortho_scale_219_extents_cache[name]
+
+@persistent
+def on_frame_change_post(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph | None = None) -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+    """
+        Clears cached geometry when the frame changes, since animated geometry is not reported as a depsgraph update.
+        
+        Args:
+            scene (bpy.types.Scene): The scene whose frame changed (unused).
+            depsgraph (bpy.types.Depsgraph | None): The evaluated depsgraph (unused).
+    """
+    clear_geometry_cache()
+
+@persistent
+def on_load_post(filepath:str = "") -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+    """
+        Clears cached geometry and prunes stale object items from every configuration when a new file is loaded.
+        
+        The isolation states of the previous file are dropped too; isolation saved in the loaded file can still be ended.
+        
+        Args:
+            filepath (str): The path of the loaded file (unused).
+    """
+    clear_geometry_cache()
+    prune_all_configs()
+    ortho_scale_219_isolation_states.clear()
+
+@persistent
+def on_render_pre(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph | None = None) -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+    """
+        Starts timing a render if the scene records its renders and the scene camera belongs to a compiled configuration.
+        
+        Args:
+            scene (bpy.types.Scene): The scene being rendered.
+            depsgraph (bpy.types.Depsgraph | None): The evaluated depsgraph (unused).
+    """
+    ortho_scale_219_pending_render.clear()
+    settings:OrthoScale219Settings | None = getattr(scene, "ortho_scale_219_settings", None)
+    
+    if settings is None or not settings.use_render_history or scene.camera is None:
+        return
+    
+    for config in settings.configs:
+        if config.summary_compiled_at and (get_render_camera(config) == scene.camera or any(view.camera == scene.camera for view in config.multi_view_cameras)):
+            ortho_scale_219_pending_render.update({
+                "engine": scene.render.engine,
+                "pixels": get_render_pixels(scene, scene.render.resolution_x, scene.render.resolution_y),
+                "samples": get_render_samples(scene),
+                "triangles": config.summary_triangle_count,
+                "config": config.config_name,
+                "peak_mb": 0.0,
+                "start": time.perf_counter(),
+            })
+            
+            return
+
+@persistent
+def on_render_stats(stats:str) -> None:
+    """
+        Tracks the peak memory Blender reports in the render statistics of a timed render.
+        
+        Args:
+            stats (str): The render statistics line, e.g. "Fra:1 | Mem:17.44M (Peak 17.45M) | Time:00:00.10 | ...".
+    """
+    match:re.Match[str] | None = re.search(r"Peak[ :]*([\d.]+)([KMG])", stats)
+    
+    if ortho_scale_219_pending_render and match is not None:
+        peak_mb:float = float(match.group(1)) * {"K": 1 / 1024, "M": 1.0, "G": 1024.0}[match.group(2)]
+        ortho_scale_219_pending_render["peak_mb"] = max(ortho_scale_219_pending_render["peak_mb"], peak_mb)
+
+@persistent
+def on_render_post(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph | None = None) -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+    """
+        Records a timed render in the render history.
+        
+        Renders whose statistics never reported a peak are recorded with the peak resident memory of the process instead.
+        
+        Args:
+            scene (bpy.types.Scene): The rendered scene (unused).
+            depsgraph (bpy.types.Depsgraph | None): The evaluated depsgraph (unused).
+    """
+    if not ortho_scale_219_pending_render:
+        return
+    
+    entry:dict[str, Any] = dict(ortho_scale_219_pending_render)
+    ortho_scale_219_pending_render.clear()
+    entry["seconds"] = time.perf_counter() - entry.pop("start")
+    entry["peak_mb"] = entry["peak_mb"] or get_memory_usage_mb()[1]
+    entry["time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    
+    try:
+        record_render(entry)
+    except OSError:
+        pass
+
+@persistent
+def on_render_cancel(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph | None = None) -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+    """
+        Drops the timing of a cancelled render, which would skew the render history.
+        
+        Args:
+            scene (bpy.types.Scene): The scene whose render was cancelled (unused).
+            depsgraph (bpy.types.Depsgraph | None): The evaluated depsgraph (unused).
+    """
+    ortho_scale_219_pending_render.clear()
+
+class OrthoScale219ObjectItem(PropertyGroup):
+    """
+        Property group representing a single mesh object item in an OrthoScale219 configuration.
+        
+        This class stores a pointer to a geometry object that will be used for bounding box calculations during the orthographic
+        camera compilation. It is designed to be part of a collection in the configuration properties.
+        
+        Attributes:
+            mesh_object (bpy.types.Object): Pointer to the mesh, curve, text, metaball, point cloud, or volume object used for
+                bounding box calculations. The property keeps its original name so existing files load unchanged.
+    """
+    if TYPE_CHECKING:
+        mesh_object:bpy.types.Object
+    else:
+        mesh_object:PointerProperty(
+            name = "Object",
+            type = bpy.types.Object,
+            poll = mesh_poll
+        )
+
+class ORTHOSCALE219_UL_ObjectList(UIList): # pylint: disable=invalid-name # noqa: N801
+    """
+        UI list class for displaying and managing mesh object items in an OrthoScale219 configuration.
+        
+        This class handles the rendering of object items in the Blender UI, supporting default, compact, and grid layouts. It
+        displays each item with an object data icon and allows for property editing without embossing. Filtering by name and
+        object type and sorting by name are computed in bulk in filter_items with the UI_UL_list helpers, so lists with
+        thousands of items only pay for the rows that are actually drawn.
+    """
+    if TYPE_CHECKING:
+        filter_object_type:str
+    else:
+        filter_object_type:EnumProperty(
+            name = "Object Type",
+            description = "Only show items whose object is of this type.",
+            items = [
+                ('ALL', "All Types", "Show every item"),
+                ('MESH', "Mesh", "Show mesh objects"),
+                ('CURVE', "Curve", "Show curve objects"),
+                ('SURFACE', "Surface", "Show surface objects"),
+                ('FONT', "Text", "Show text objects"),
+                ('META', "Metaball", "Show metaball objects"),
+                ('POINTCLOUD', "Point Cloud", "Show point cloud objects"),
+                ('CURVES', "Hair Curves", "Show hair curves objects"),
+                ('VOLUME', "Volume", "Show volume objects"),
+                ('MISSING', "Missing", "Show items whose object was deleted or never set"),
+            ],
+            default = 'ALL',
+        )
+    
+    def draw_filter(self:ORTHOSCALE219_UL_ObjectList, context:bpy.types.Context, layout:bpy.types.UILayout) -> None: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+        """
+            Draws the filter options: name search, invert, object type, and name sorting.
+            
+            Args:
+                self (ORTHOSCALE219_UL_ObjectList): The UI list instance.
+                context (bpy.types.Context): The current Blender context.
+                layout (bpy.types.UILayout): The UI layout to draw into.
+        """
+        row:bpy.types.UILayout = layout.row(align = True)
+        row.prop(
+            data = self,
+            property = "filter_name",
+            text = "",
+        )
+        row.prop(
+            data = self,
+            property = "use_filter_invert",
+            text = "",
+            icon = 'ARROW_LEFTRIGHT',
+        )
+        row = layout.row(align = True)
+        row.prop(
+            data = self,
+            property = "filter_object_type",
+            text = "",
+        )
+        row.prop(
+            data = self,
+            property = "use_filter_sort_alpha",
+            text = "",
+            icon = 'SORTALPHA',
+        )
+        row.prop(
+            data = self,
+            property = "use_filter_sort_reverse",
+            text = "",
+            icon = 'SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC',
+        )
+    
+    def filter_items(self:ORTHOSCALE219_UL_ObjectList, context:bpy.types.Context, data:Any, propname:str) -> tuple[list[int], list[int]]: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+        """
+            Filters and sorts all items of the list in one pass.
+            
+            Args:
+                self (ORTHOSCALE219_UL_ObjectList): The UI list instance.
+                context (bpy.types.Context): The current Blender context.
+                data (Any): The config containing the objects.
+                propname (str): The name of the collection property.
+            
+            Returns:
+                tuple[list[int], list[int]]: The filter flags and the new order; empty lists mean no filtering or sorting.
+            
+            Notes:
+                Inverting the filter and reversing the order are applied by Blender.
+        """
+        objs:list[bpy.types.Object | None] = [item.mesh_object for item in getattr(data, propname)]
+        flt_flags:list[int] = bpy.types.UI_UL_list.filter_items_by_name(self.filter_name, self.bitflag_filter_item, objs, "name")
+        
+        if self.filter_object_type != 'ALL':
+            flt_flags = flt_flags or [self.bitflag_filter_item] * len(objs)
+            
+            for index, obj in enumerate(objs):
+                obj_type:str = 'MISSING' if obj is None or obj.name not in bpy.data.objects else obj.type
+                
+                if obj_type != self.filter_object_type:
+                    flt_flags[index] &= ~self.bitflag_filter_item
+        
+        flt_neworder:list[int] = bpy.types.UI_UL_list.sort_items_by_name(objs, "name") if self.use_filter_sort_alpha else []
+        
+        return flt_flags, flt_neworder
+    
+    def draw_item(self:ORTHOSCALE219_UL_ObjectList, context:bpy.types.Context, layout:bpy.types.UILayout, data:Any, item:Any, icon:int, active_data:Any, active_propname:str, index:int, flt_flag:int) -> None: # noinspection PyUnusedLocal,PyMethodOverriding # pylint: disable=unused-argument,arguments-renamed # type: ignore[override] # noqa: F841,PLW0237
+        """
+            Draws an individual mesh object item in the UI list.
+            
+            This method renders the item based on the layout type, using a property field for default/compact views or a centered
+            label for grid views. It displays the mesh_object property without embossing and with an 'OBJECT_DATA' icon.
+            
+            Args:
+                self (ORTHOSCALE219_UL_ObjectList): The UI list instance.
+                context (bpy.types.Context): The current Blender context.
+                layout (bpy.types.UILayout): The UI layout to draw into.
+                data (Any): The data source (e.g., the config containing the objects).
+                item (Any): The OrthoScale219ObjectItem to draw.
+                icon (int): The icon ID (unused).
+                active_data (Any): The active data source (unused).
+                active_propname (str): The active property name (unused).
+                index (int): The index of the item in the list (unused).
+                flt_flag (int): Filter flag (unused).
+            
+            Returns:
+                None
+        """
+        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            layout.prop(
+                data = item,
+                property = "mesh_object",
+                text = "",
+                emboss = False,
+                icon = 'OBJECT_DATA',
+            )
+        elif self.layout_type == 'GRID':
+            layout.alignment = 'CENTER'
+            layout.label(
+                text = "",
+                icon = 'OBJECT_DATA',
+            )
+
+class OrthoScale219BoundsItem(PropertyGroup):
+    """
+        Property group storing the compiled extents of a single object of an OrthoScale219 configuration.
+        
+        The extents are stored in the camera's linear frame, without its translation, together with the fingerprint and world
+        matrix of the object they were computed from, so later compiles and other sessions can reuse them.
+        
+        Attributes:
+            source_object (bpy.types.Object): The object that was bounded.
+            fingerprint (str): The geometry fingerprint from get_geometry_fingerprint; empty if it could not be fingerprinted.
+            matrix (list[float]): The object's world matrix, flattened row by row.
+            is_empty (bool): Whether the object had no vertices.
+            min_co (list[float]): The minimum extents in the camera's linear frame.
+            max_co (list[float]): The maximum extents in the camera's linear frame.
+    """
+    if TYPE_CHECKING:
+        source_object:bpy.types.Object | None
+    else:
+        source_object:PointerProperty(
+            name = "Object",
+            type = bpy.types.Object,
+        )
+    
+    if TYPE_CHECKING:
+        fingerprint:str
+    else:
+        fingerprint:StringProperty(
+            name = "Fingerprint",
+            default = "",
+        )
+    
+    if TYPE_CHECKING:
+        matrix:list[float]
+    else:
+        matrix:FloatVectorProperty(
+            name = "Matrix",
+            size = 16,
+        )
+    
+    if TYPE_CHECKING:
+        is_empty:bool
+    else:
+        is_empty:BoolProperty(
+            name = "Empty",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        min_co:list[float]
+    else:
+        min_co:FloatVectorProperty(
+            name = "Min",
+            size = 3,
+        )
+    
+    if TYPE_CHECKING:
+        max_co:list[float]
+    else:
+        max_co:FloatVectorProperty(
+            name = "Max",
+            size = 3,
+        )
+
+class OrthoScale219ViewItem(PropertyGroup):
+    """
+        Property group representing a single generated view of a multi-view OrthoScale219 configuration.
+        
+        This class stores the camera created for the view along with the render resolution computed for it by the last compile.
+        
+        Attributes:
+            camera (bpy.types.Object): The camera generated for this view.
+            res_x (int): The compiled horizontal resolution of this view.
+            res_y (int): The compiled vertical resolution of this view.
+    """
+    if TYPE_CHECKING:
+        camera:bpy.types.Object | None
+    else:
+        camera:PointerProperty(
+            name = "Camera",
+            type = bpy.types.Object,
+            poll = camera_poll,
+        )
+    
+    if TYPE_CHECKING:
+        res_x:int
+    else:
+        res_x:IntProperty(
+            name = "Resolution X",
+        )
+    
+    if TYPE_CHECKING:
+        res_y:int
+    else:
+        res_y:IntProperty(
+            name = "Resolution Y",
+        )
+
+class OrthoScale219ConfigProperties(PropertyGroup):
+    """
+        Property group containing all settings for a single OrthoScale219 configuration.
+        
+        This class holds configuration-specific properties such as the name, pixels per Blender unit, edge margin, selected
+        camera, list of mesh objects, and related indices. It serves as an entry in the main settings' collection of
+        configurations.
+    """
+    if TYPE_CHECKING:
+        config_name:str
+    else:
+        config_name:StringProperty(
+            name = "Config Name",
+            description = "Name of this configuration.",
+            default = "Config"
+        )
+    
+    if TYPE_CHECKING:
+        pixels_per_blender_unit:float
+    else:
+        pixels_per_blender_unit:FloatProperty(
+            name = "Pixels per Blender Unit",
+            description = "Pixels per Blender Unit (higher = more detail and larger files)",
+            default = 10.0,
+            min = 1.0,
+        )
+    
+    if TYPE_CHECKING:
+        edge_margin:float
+    else:
+        edge_margin:FloatProperty(
+            name = "Margin (In Blender Units)",
+            description = "Margin (in Blender Units) that will be padded around the edge of the render.",
+            default = 1.0,
+            min = 0.0,
+        )
+    
+    if TYPE_CHECKING:
+        camera:bpy.types.Object | None
+    else:
+        camera:PointerProperty(
+            name = "Camera",
+            type = bpy.types.Object,
+            poll = camera_poll,
+            description = "Select the camera to use."
+        )
+    
+    if TYPE_CHECKING:
+        blender_objects:bpy_prop_collection[OrthoScale219ObjectItem]
+    else:
+        blender_objects:CollectionProperty(
+            type = OrthoScale219ObjectItem
+        )
+    
+    if TYPE_CHECKING:
+        active_object_index:int
+    else:
+        active_object_index:IntProperty()
+    
+    if TYPE_CHECKING:
+        add_blender_object:bpy.types.Object | None
+    else:
+        add_blender_object:PointerProperty(
+            name = "Add Blender Object",
+            type = bpy.types.Object,
+            poll = mesh_poll,
+            description = "Select a Blender Object to add."
+        )
+    
+    if TYPE_CHECKING:
+        use_multi_view:bool
+    else:
+        use_multi_view:BoolProperty(
+            name = "Multi-View",
+            description = "Compile several views spread evenly around the world Z axis, each keeping the tilt of the selected camera.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        multi_view_count:int
+    else:
+        multi_view_count:IntProperty(
+            name = "Views",
+            description = "Number of views to compile (e.g. 4 or 8 for isometric asset renders).",
+            default = 4,
+            min = 1,
+            max = 64,
+        )
+    
+    if TYPE_CHECKING:
+        multi_view_angle_offset:float
+    else:
+        multi_view_angle_offset:FloatProperty(
+            name = "Angle Offset",
+            description = "Rotation around the world Z axis of the first view, relative to the selected camera.",
+            default = 0.0,
+            subtype = 'ANGLE',
+        )
+    
+    if TYPE_CHECKING:
+        multi_view_cameras:bpy_prop_collection[OrthoScale219ViewItem]
+    else:
+        multi_view_cameras:CollectionProperty(
+            type = OrthoScale219ViewItem
+        )
+    
+    if TYPE_CHECKING:
+        use_dedicated_camera:bool
+    else:
+        use_dedicated_camera:BoolProperty(
+            name = "Dedicated Ortho Camera",
+            description = "Frame a separate orthographic camera that follows this config's camera, leaving the camera itself untouched for perspective renders.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        ortho_camera:bpy.types.Object | None
+    else:
+        ortho_camera:PointerProperty(
+            name = "Ortho Camera",
+            description = "Dedicated orthographic camera created by the compile. Cleared to create a new one.",
+            type = bpy.types.Object,
+            poll = camera_poll,
+        )
+    
+    if TYPE_CHECKING:
+        ortho_source_matrix:list[float]
+    else:
+        ortho_source_matrix:FloatVectorProperty(
+            name = "Ortho Source Matrix",
+            description = "World matrix of this config's camera when it was last copied onto the dedicated ortho camera.",
+            size = 16,
+        )
+    
+    if TYPE_CHECKING:
+        source_resolution:list[int]
+    else:
+        source_resolution:IntVectorProperty(
+            name = "Source Resolution",
+            description = "Render resolution of the source camera's shot, restored when switching back to it.",
+            size = 2,
+        )
+    
+    if TYPE_CHECKING:
+        use_isolation:bool
+    else:
+        use_isolation:BoolProperty(
+            name = "Render Isolated",
+            description = "Render this config in batch renders through a temporary view layer that contains only its objects, its cameras, and the isolation lights, so the rest of the scene is neither evaluated nor traced. Isolate does the same for interactive renders.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        isolation_lights:bpy.types.Collection | None
+    else:
+        isolation_lights:PointerProperty(
+            name = "Lights",
+            description = "Collection of lights, or any other objects, rendered along with this config's objects when rendering isolated.",
+            type = bpy.types.Collection,
+        )
+    
+    if TYPE_CHECKING:
+        render_passes:set[str]
+    else:
+        render_passes:EnumProperty(
+            name = "Outputs",
+            description = "Maps every batch render of this config writes. Anything beyond color enables the matching view layer passes for the render and writes all of them from one render into a multilayer EXR; the scene's own passes and output format are restored afterwards.",
+            items = [(key, label, f"Write the {pass_name} pass") for key, (_, pass_name, label) in RENDER_PASSES.items()],
+            default = {'COLOR'},
+            options = {'ENUM_FLAG'},
+        )
+    
+    if TYPE_CHECKING:
+        split_passes:bool
+    else:
+        split_passes:BoolProperty(
+            name = "Split Passes",
+            description = "After batch renders, also write every declared pass to its own EXR file next to the multilayer EXR, on parallel threads. Requires OpenImageIO.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        cached_bounds:bpy_prop_collection[OrthoScale219BoundsItem]
+    else:
+        cached_bounds:CollectionProperty(
+            type = OrthoScale219BoundsItem
+        )
+    
+    if TYPE_CHECKING:
+        cached_camera_linear:list[float]
+    else:
+        cached_camera_linear:FloatVectorProperty(
+            name = "Cached Camera Linear",
+            description = "Rotation and scale of the inverted camera matrix the stored extents were computed in.",
+            size = 9,
+        )
+    
+    if TYPE_CHECKING:
+        cached_camera_matrix:list[float]
+    else:
+        cached_camera_matrix:FloatVectorProperty(
+            name = "Cached Camera Matrix",
+            description = "World matrix of the camera written by the last compile.",
+            size = 16,
+        )
+    
+    if TYPE_CHECKING:
+        cached_resolution:list[int]
+    else:
+        cached_resolution:IntVectorProperty(
+            name = "Cached Resolution",
+            description = "Render resolution written by the last compile.",
+            size = 2,
+        )
+    
+    if TYPE_CHECKING:
+        cached_framing:list[float]
+    else:
+        cached_framing:FloatVectorProperty(
+            name = "Cached Framing",
+            description = "Pixels per Blender Unit, edge margin, and orthographic scale of the last compile.",
+            size = 3,
+        )
+    
+    if TYPE_CHECKING:
+        use_streaming:bool
+    else:
+        use_streaming:BoolProperty(
+            name = "Streaming Bounds",
+            description = "Bound objects one at a time, largest first, and only cache geometry within the memory budget. Lowers peak memory for heavy scenes at the cost of slower recompiles.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        streaming_budget_mb:float
+    else:
+        streaming_budget_mb:FloatProperty(
+            name = "Cache Budget (MB)",
+            description = "Maximum memory in megabytes kept for cached coordinates in streaming mode. 0 caches nothing.",
+            default = 512.0,
+            min = 0.0,
+        )
+    
+    if TYPE_CHECKING:
+        use_pipelined:bool
+    else:
+        use_pipelined:BoolProperty(
+            name = "Pipelined",
+            description = "Extract the next object's geometry while a worker thread reduces the previous one. Speeds up compiles of many medium-sized objects; ignored in streaming mode.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        use_occupancy:bool
+    else:
+        use_occupancy:BoolProperty(
+            name = "Occupancy Pre-Pass",
+            description = "After compiling, rasterize the objects' triangles into a coarse occupancy grid of the frame and report how much of the frame is empty.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        occupancy_resolution:int
+    else:
+        occupancy_resolution:IntProperty(
+            name = "Cells",
+            description = "Occupancy grid cells along the longer side of the frame.",
+            default = 64,
+            min = 4,
+            max = 1024,
+        )
+    
+    if TYPE_CHECKING:
+        use_occupancy_border:bool
+    else:
+        use_occupancy_border:BoolProperty(
+            name = "Trim Border",
+            description = "Set the render border to the occupied cells of the occupancy grid, so empty margins are not rendered. The image keeps its full size.",
+            default = False,
+        )
+    
+    if TYPE_CHECKING:
+        occupancy_border:list[float]
+    else:
+        occupancy_border:FloatVectorProperty(
+            name = "Occupancy Border",
+            description = "Render border (min x, min y, max x, max y) around the occupied cells of the last occupancy pre-pass.",
+            size = 4,
+            default = (0.0, 0.0, 1.0, 1.0),
+        )
+    
+    if TYPE_CHECKING:
+        summary_occupancy_resolution:int
+    else:
+        summary_occupancy_resolution:IntProperty(
+            name = "Occupancy Resolution",
+            description = "Occupancy grid cells along the longer side of the last occupancy pre-pass; 0 if it has not run.",
+            default = 0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_empty_fraction:float
+    else:
+        summary_empty_fraction:FloatProperty(
+            name = "Empty Fraction",
+            description = "Fraction of the frame's occupancy cells that no object covers, from the last occupancy pre-pass.",
+            default = 0.0,
+            subtype = 'FACTOR',
+        )
+    
+    if TYPE_CHECKING:
+        summary_object_count:int
+    else:
+        summary_object_count:IntProperty(
+            name = "Object Count",
+            description = "Number of objects bounded by the last compile.",
+            default = 0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_vertex_count:int
+    else:
+        summary_vertex_count:IntProperty(
+            name = "Vertex Count",
+            description = "Total vertices of the objects bounded by the last compile.",
+            default = 0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_compile_seconds:float
+    else:
+        summary_compile_seconds:FloatProperty(
+            name = "Compile Time",
+            description = "Wall time of the last compile in seconds.",
+            default = 0.0,
+            subtype = 'TIME_ABSOLUTE',
+            unit = 'TIME_ABSOLUTE',
+        )
+    
+    if TYPE_CHECKING:
+        summary_peak_rss_mb:float
+    else:
+        summary_peak_rss_mb:FloatProperty(
+            name = "Peak Memory (MB)",
+            description = "Peak resident memory of Blender during the last compile, in megabytes; 0 where it cannot be measured.",
+            default = 0.0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_triangle_count:int
+    else:
+        summary_triangle_count:IntProperty(
+            name = "Triangle Count",
+            description = "Evaluated triangles (points for point clouds and hair curves) of the objects bounded by the last compile.",
+            default = 0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_estimate_seconds:float
+    else:
+        summary_estimate_seconds:FloatProperty(
+            name = "Estimated Render Time",
+            description = "Render time predicted from the local render history at the last compile, in seconds.",
+            default = 0.0,
+            subtype = 'TIME_ABSOLUTE',
+            unit = 'TIME_ABSOLUTE',
+        )
+    
+    if TYPE_CHECKING:
+        summary_estimate_peak_mb:float
+    else:
+        summary_estimate_peak_mb:FloatProperty(
+            name = "Estimated Peak Memory (MB)",
+            description = "Peak render memory predicted from the local render history at the last compile, in megabytes.",
+            default = 0.0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_estimate_renders:int
+    else:
+        summary_estimate_renders:IntProperty(
+            name = "Estimate Renders",
+            description = "Recorded renders the estimate is fitted to; 0 if there is no render history for the engine yet.",
+            default = 0,
+        )
+    
+    if TYPE_CHECKING:
+        summary_compiled_at:str
+    else:
+        summary_compiled_at:StringProperty(
+            name = "Compiled At",
+            description = "Local date and time of the last compile; empty if never compiled.",
+            default = "",
+        )
+
+class ORTHOSCALE219_UL_ConfigList(UIList): # pylint: disable=invalid-name # noqa: N801
+    """
+        UI list class for displaying and managing OrthoScale219 configurations.
+        
+        This class handles the rendering of configuration items in the Blender UI, supporting default, compact, and grid layouts.
+        It displays each configuration with a preset icon and allows for property editing without embossing.
+    """
+    def draw_item(self:ORTHOSCALE219_UL_ConfigList, context:bpy.types.Context, layout:bpy.types.UILayout, data:Any, item:Any, icon:int, active_data:Any, active_propname:str, index:int, flt_flag:int) -> None: # noinspection PyUnusedLocal,PyMethodOverriding # pylint: disable=unused-argument,arguments-renamed # type: ignore[override] # noqa: F841,PLW0237
+        """
+            Draws an individual configuration item in the UI list.
+            
+            This method renders the item based on the layout type, using a property field for default/compact views or a centered
+            label for grid views. It displays the config_name property without embossing and with a 'PRESET' icon.
+            
+            Args:
+                self (ORTHOSCALE219_UL_ConfigList): The UI list instance.
+                context (bpy.types.Context): The current Blender context.
+                layout (bpy.types.UILayout): The UI layout to draw into.
+                data (Any): The data source (e.g., the settings containing the configs).
+                item (Any): The OrthoScale219ConfigProperties to draw.
+                icon (int): The icon ID (unused).
+                active_data (Any): The active data source (unused).
+                active_propname (str): The active property name (unused).
+                index (int): The index of the item in the list (unused).
+                flt_flag (int): Filter flag (unused).
+            
+            Returns:
+                None
+        """
+        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            layout.prop(
+                data = item,
+                property = "config_name",
+                text = "",
+                emboss = False,
+                icon = 'PRESET',
+            )
+        elif self.layout_type == 'GRID':
+            layout.alignment = 'CENTER'
+            layout.label(
+                text = "",
+                icon = 'PRESET',
+            )
+
+class OrthoScale219TileItem(PropertyGroup):
+    """
+        Property group representing a single non-empty tile of the OrthoScale219 tile grid.
+        
+        Attributes:
+            tile_x (int): The column of the tile in the global grid.
+            tile_y (int): The row of the tile in the global grid.
+            location (mathutils.Vector): The world-space location of the tile camera for this tile.
+            matrix (list[float]): The world matrix of the tile camera for this tile, with the rotation of the compile.
+            object_count (int): The number of configured objects whose extents overlap this tile.
+    """
+    if TYPE_CHECKING:
+        tile_x:int
+    else:
+        tile_x:IntProperty(
+            name = "Tile X",
+        )
+    
+    if TYPE_CHECKING:
+        tile_y:int
+    else:
+        tile_y:IntProperty(
+            name = "Tile Y",
+        )
+    
+    if TYPE_CHECKING:
+        location:mathutils.Vector
+    else:
+        location:FloatVectorProperty(
+            name = "Location",
+            size = 3,
+            subtype = 'TRANSLATION',
+        )
+    
+    if TYPE_CHECKING:
+        matrix:list[float]
+    else:
+        matrix:FloatVectorProperty(
+            name = "Matrix",
+            description = "World matrix of the tile camera for this tile, including the camera rotation the grid was compiled with.",
+            size = 16,
+        )
+    
+    if TYPE_CHECKING:
+        object_count:int
+    else:
+        object_count:IntProperty(
+            name = "Object Count",
+        )
+
+class OrthoScale219Settings(PropertyGroup):
+    """
+        Main property group for OrthoScale219 add-on settings.
+        
+        This class manages a collection of configurations and tracks the active configuration index. It is attached to the
+        Blender scene for persistent storage across sessions.
+        
+        Attributes:
+            configs (bpy_prop_collection[OrthoScale219ConfigProperties]): Collection of all configurations.
+            active_config_index (int): Index of the active configuration in the configs collection. Default: 0.
+            tile_camera (bpy.types.Object): Camera used to orient and render the tile grid.
+            tile_pixels_per_blender_unit (float): Pixels per Blender Unit shared by every tile. Default: 10.0.
+            tile_size (int): Width and height of every tile in pixels. Default: 512.
+            tiles (bpy_prop_collection[OrthoScale219TileItem]): The non-empty tiles of the last tile grid compile.
+            active_tile_index (int): Index of the tile applied by the apply tile operator. Default: 0.
+            tile_clip_end (float): Clip end shared by every tile of the last tile grid compile.
+            use_compile_undo (bool): Whether compiles from the panel push a global undo step. Default: True.
+            use_render_history (bool): Whether renders through compiled cameras are recorded in the render history. Default: False.
+    """
+    if TYPE_CHECKING:
+        configs:bpy_prop_collection[OrthoScale219ConfigProperties]
+    else:
+        configs:CollectionProperty(type = OrthoScale219ConfigProperties)
+    
+    if TYPE_CHECKING:
+        active_config_index:int
+    else:
+        active_config_index:IntProperty()
+    
+    if TYPE_CHECKING:
+        tile_camera:bpy.types.Object | None
+    else:
+        tile_camera:PointerProperty(
+            name = "Tile Camera",
+            type = bpy.types.Object,
+            poll = camera_poll,
+            description = "Camera whose rotation orients the tile grid and which is moved onto each tile."
+        )
+    
+    if TYPE_CHECKING:
+        tile_pixels_per_blender_unit:float
+    else:
+        tile_pixels_per_blender_unit:FloatProperty(
+            name = "Pixels per Blender Unit",
+            description = "Pixels per Blender Unit shared by every tile of the grid.",
+            default = 10.0,
+            min = 1.0,
+        )
+    
+    if TYPE_CHECKING:
+        tile_size:int
+    else:
+        tile_size:IntProperty(
+            name = "Tile Size (Pixels)",
+            description = "Width and height of every tile in pixels.",
+            default = 512,
+            min = 1,
+        )
+    
+    if TYPE_CHECKING:
+        tiles:bpy_prop_collection[OrthoScale219TileItem]
+    else:
+        tiles:CollectionProperty(type = OrthoScale219TileItem)
+    
+    if TYPE_CHECKING:
+        active_tile_index:int
+    else:
+        active_tile_index:IntProperty(
+            name = "Tile",
+            min = 0,
+        )
+    
+    if TYPE_CHECKING:
+        tile_clip_end:float
+    else:
+        tile_clip_end:FloatProperty(
+            name = "Tile Clip End",
+        )
+    
+    if TYPE_CHECKING:
+        use_compile_undo:bool
+    else:
+        use_compile_undo:BoolProperty(
+            name = "Undo Steps",
+            description = "Push a global undo step for every compile from the panel. Turn off in huge scenes, where every undo push copies the scene's undo memory and slows compiling down; compiles then cannot be undone.",
+            default = True,
+        )
+    
+    if TYPE_CHECKING:
+        use_render_history:bool
+    else:
+        use_render_history:BoolProperty(
+            name = "Record Renders",
+            description = "Time every render through a compiled camera of this scene and record it in the local render history, which calibrates the render estimates. The history is written to Blender's user config directory, or the file named by the ORTHO_SCALE_219_RENDER_HISTORY environment variable.",
+            default = False,
+        )
+
+class OBJECT_OT_OrthoScale219AddConfig(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to add a new configuration to the OrthoScale219 settings.
+        
+        This operator creates a new OrthoScale219ConfigProperties instance, assigns it a default name based on the current number
+        of configurations, adds it to the settings' collection, and sets it as the active configuration.
+    """
+    bl_idname:str = "ortho_scale_219.add_config"
+    bl_label:str = "Add Config"
+    bl_description:str = "Add a new configuration."
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219AddConfig, context:bpy.types.Context)-> set[str]:
+        """
+            Executes the addition of a new configuration.
+            
+            This method retrieves the settings, adds a new config with a default name, and updates the active index.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219AddConfig): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        configs = settings.configs
+        new_config:OrthoScale219ConfigProperties = configs.add()
+        new_config.config_name = f"Config {len(configs)}"
+        settings.active_config_index = len(configs) - 1
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219RemoveConfig(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to remove the active configuration from the OrthoScale219 settings.
+        
+        This operator removes the configuration at the active index from the settings' collection and adjusts the active index to
+        the previous valid one (or 0 if none remain).
     """
     bl_idname:str = "ortho_scale_219.remove_config"
     bl_label:str = "Remove Config"
@@ -337,520 +3470,2106 @@ class OBJECT_OT_OrthoScale219RemoveConfig(Operator): # pylint: disable=invalid-n
         'UNDO',
     }
     
-    def execute(self:OBJECT_OT_OrthoScale219RemoveConfig, context:bpy.types.Context)-> set[str]:
+    def execute(self:OBJECT_OT_OrthoScale219RemoveConfig, context:bpy.types.Context)-> set[str]:
+        """
+            Executes the removal of the active configuration.
+            
+            This method retrieves the settings, removes the config at the active index if valid, and adjusts the active index.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219RemoveConfig): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        index:int = settings.active_config_index
+        
+        if 0 <= index < len(settings.configs):
+            settings.configs.remove(index)
+            settings.active_config_index = max(0, index - 1)
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219AddObject(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to add a selected mesh object to the active configuration's object list.
+        
+        This operator checks for an active configuration, verifies the selected object is not already in the list, adds it as a
+        new OrthoScale219ObjectItem if valid, and clears the add object pointer. Reports warnings for invalid states like no
+        object selected or duplicates.
+    """
+    bl_idname:str = "ortho_scale_219.add_blender_object"
+    bl_label:str = "Add Object"
+    bl_description:str = "Add the selected object to the active config's list"
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219AddObject, context:bpy.types.Context)-> set[str]:
+        """
+            Executes the addition of a selected object to the active config's list.
+            
+            This method validates the active config, checks for duplicates, adds the object if valid, and clears the temporary
+            pointer.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219AddObject): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success (even if duplicate), or {'CANCELLED'} if no active config.
+            
+            Notes:
+                Reports WARNING via self.report if no object selected, duplicate, or no active config.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'WARNING'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        
+        if config.add_blender_object:
+            for item in config.blender_objects:
+                if item.mesh_object == config.add_blender_object:
+                    self.report({'WARNING'}, "Object already in the list!")
+                    config.add_blender_object = None
+                    
+                    return {'FINISHED'}
+            
+            item:OrthoScale219ObjectItem = config.blender_objects.add()
+            item.mesh_object = config.add_blender_object
+            config.add_blender_object = None
+        else:
+            self.report({'WARNING'}, "No object selected to add.")
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219AddSelectedObjects(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to add all currently selected mesh objects to the active configuration's object list.
+        
+        This operator checks for an active configuration, iterates over selected objects, filters for mesh types not already in
+        the list, adds them as new OrthoScale219ObjectItem instances, and reports the number added or info if none were eligible.
+    """
+    bl_idname:str = "ortho_scale_219.add_selected_objects"
+    bl_label:str = "Add All Selected Objects"
+    bl_description:str = "Add all currently selected geometry objects to the active config's list"
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219AddSelectedObjects, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the addition of all selected mesh objects to the active config's list.
+            
+            This method validates the active config, filters and adds eligible geometry objects, and reports the result.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219AddSelectedObjects): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if no active config.
+            
+            Notes:
+                Reports INFO via self.report on the number of objects added or if none were eligible.
+                Reports WARNING if no active config.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'WARNING'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        added_count:int = 0
+        
+        for obj in context.selected_objects:
+            if obj.type not in SUPPORTED_OBJECT_TYPES:
+                continue
+            if any(item.mesh_object == obj for item in config.blender_objects):
+                continue
+            
+            item:OrthoScale219ObjectItem = config.blender_objects.add()
+            item.mesh_object = obj
+            added_count += 1
+        
+        if added_count > 0:
+            self.report({'INFO'}, f"Added {added_count} object(s) to the list.")
+        else:
+            self.report({'INFO'}, "No new geometry objects to add (already in list or none selected).")
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219RemoveObject(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to remove the selected object from the active configuration's object list.
+        
+        This operator checks for an active configuration, removes the object item at the active object index, and adjusts the
+        active object index to the previous valid one (or 0 if none remain).
+    """
+    bl_idname:str = "ortho_scale_219.remove_object"
+    bl_label:str = "Remove Object"
+    bl_description:str = "Remove the selected object from the active config's list"
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219RemoveObject, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the removal of the selected object from the active config's list.
+            
+            This method validates the active config, removes the object at the active index if valid, and adjusts the index.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219RemoveObject): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if no active config.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        index:int = config.active_object_index
+        
+        if 0 <= index < len(config.blender_objects):
+            config.blender_objects.remove(index)
+            config.active_object_index = max(0, index - 1)
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219PruneObjects(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to remove deleted or unsupported objects from the object lists of every configuration.
+        
+        Stale items are also pruned automatically when a file is loaded and when objects are deleted; this operator runs the
+        same validation pass on demand.
+    """
+    bl_idname:str = "ortho_scale_219.prune_objects"
+    bl_label:str = "Remove Missing Objects"
+    bl_description:str = "Remove deleted or unsupported objects from every config's list"
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219PruneObjects, context:bpy.types.Context) -> set[str]: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+        """
+            Executes the validation pass over every configuration.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219PruneObjects): The operator instance.
+                context (bpy.types.Context): The current Blender context (unused).
+            
+            Returns:
+                set[str]: {'FINISHED'}.
+        """
+        self.report({'INFO'}, f"OrthoScale219 removed {prune_all_configs()} stale object(s)")
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219CompileCamera(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to set up the orthographic camera and render settings based on the active configuration.
+        
+        This operator validates the active configuration, selected camera, and mesh objects; computes the bounding box in camera
+        space; adjusts camera position, orthographic scale, clip planes, and render resolution; and applies padding margins. It
+        reports errors for invalid states, warnings for objects behind the camera, and info on completion.
+    """
+    bl_idname:str = "render.ortho_scale_219_compile"
+    bl_label:str = "Compile Camera"
+    bl_description:str = "Applies all the configuration settings to the camera."
+    bl_options:set[str] = {
+        'REGISTER',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219CompileCamera, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the compilation of the camera and render settings.
+            
+            This method validates inputs, computes the bounding box, adjusts camera and render properties, and reports status.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileCamera): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} on validation errors.
+            
+            Notes:
+                Reports ERROR via self.report for no config/objects/camera/vertices.
+                Reports WARNING for objects behind the camera or invalid states.
+                Reports INFO on completion with setup details.
+                Delegates to compile_config, which reports the remaining errors, warnings, and info.
+                Pushes an undo step through push_compile_undo when invoked from the panel, unless the scene's use_compile_undo is
+                off. Scripted calls, which run execute directly, never push one.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'ERROR'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        
+        if not compile_config(context, config, self.report):
+            return {'CANCELLED'}
+        
+        if self.options.is_invoke:
+            push_compile_undo(context, self.bl_label)
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219CompileAll(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to compile every configuration of the scene as a single undo step.
+        
+        Compiling configs one by one from the UI pushes a global undo step per compile, which is slow and grows memory in large
+        scenes. This operator compiles all configs through compile_config inside one operator call, so the whole batch is
+        undone or redone at once.
+    """
+    bl_idname:str = "render.ortho_scale_219_compile_all"
+    bl_label:str = "Compile All Configs"
+    bl_description:str = "Compile every configuration as a single undo step."
+    bl_options:set[str] = {
+        'REGISTER',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219CompileAll, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the compilation of every configuration.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileAll): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} if at least one config compiled, or {'CANCELLED'} otherwise.
+            
+            Notes:
+                Only errors and warnings of the individual compiles are reported, followed by an INFO summary.
+                Pushes one undo step for all configs through push_compile_undo when invoked from the panel, unless
+                use_compile_undo is off. Scripted calls never push one.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        compiled:int = 0
+        
+        for config in settings.configs:
+            def report(report_type:set[str], message:str, config_name:str = config.config_name) -> None:
+                """
+                    Forwards errors and warnings of a single compile, prefixed with the config name.
+                    
+                    Args:
+                        report_type (set[str]): The report type, e.g. {'ERROR'}.
+                        message (str): The message.
+                        config_name (str): The name of the config being compiled.
+                """
+                if 'INFO' not in report_type:
+                    self.report({'WARNING'}, f"{config_name}: {message}")
+            
+            compiled += compile_config(context, config, report)
+        
+        self.report({'INFO'}, f"OrthoScale219 compiled {compiled} of {len(settings.configs)} config(s)")
+        
+        if not compiled:
+            return {'CANCELLED'}
+        
+        if self.options.is_invoke:
+            push_compile_undo(context, self.bl_label)
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219CompileCameraModal(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Cancellable version of the compile operator for huge scenes.
+        
+        This operator bounds the active configuration's objects in time-sliced batches driven by a modal timer, one geometry
+        group at a time, so the UI stays responsive and shows progress. Pressing Esc cancels the compile. The camera and render
+        settings are only modified once every batch has been bounded, so a cancelled compile leaves the scene exactly as it
+        was; geometry bounded before cancelling stays cached and speeds up the next compile. The scene can be edited between
+        batches: objects are kept by name and looked up again every tick, deleted objects are skipped, the compile starts over
+        when the camera moves, and it cancels when the config or its camera is removed.
+    """
+    bl_idname:str = "render.ortho_scale_219_compile_modal"
+    bl_label:str = "Compile Camera (Cancellable)"
+    bl_description:str = "Compile the camera in time-sliced batches with progress reporting. Press Esc to cancel."
+    bl_options:set[str] = {
+        'REGISTER',
+    }
+    
+    def invoke(self:OBJECT_OT_OrthoScale219CompileCameraModal, context:bpy.types.Context, event:bpy.types.Event) -> set[str]: # noinspection PyUnusedLocal # pylint: disable=unused-argument # noqa: F841
+        """
+            Validates the active configuration, groups its objects into batches, and starts the modal timer.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileCameraModal): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+                event (bpy.types.Event): The invoking event (unused).
+            
+            Returns:
+                set[str]: {'RUNNING_MODAL'} on success, or {'CANCELLED'} on validation errors.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'ERROR'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        objs:list[bpy.types.Object] = get_config_objects(config)
+        
+        if not objs:
+            self.report({'ERROR'}, "No valid objects in the active config's list!")
+            
+            return {'CANCELLED'}
+        
+        cam_obj:bpy.types.Object | None = config.camera
+        
+        if cam_obj is None or cam_obj.type != 'CAMERA':
+            self.report({'ERROR'}, "No valid camera selected in active config.")
+            
+            return {'CANCELLED'}
+        
+        groups:dict[str, list[bpy.types.Object]] = {}
+        
+        for obj in objs:
+            groups.setdefault(get_geometry_key(obj), []).append(obj)
+        
+        self._start:float = time.perf_counter()
+        self._memory_before:tuple[float, float] = get_memory_usage_mb()
+        ortho_scale_219_peak_rss_mb[0] = 0.0
+        self._config_index:int = settings.active_config_index
+        self._config_name:str = config.config_name
+        self._batches:list[list[str]] = [[obj.name for obj in group] for group in groups.values()]
+        self._next_batch:int = 0
+        self._cam_matrix_inv:mathutils.Matrix = cam_obj.matrix_world.inverted()
+        self._min_co:np.ndarray = np.full(3, np.inf)
+        self._max_co:np.ndarray = np.full(3, -np.inf)
+        self._object_bounds:dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._fingerprints:dict[str, str] = {}
+        self._fingerprint_memo:dict[str, str] = {}
+        
+        wm:bpy.types.WindowManager = context.window_manager
+        self._timer:bpy.types.Timer = wm.event_timer_add(0.01, window = context.window)
+        wm.progress_begin(0, len(self._batches))
+        wm.modal_handler_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    def modal(self:OBJECT_OT_OrthoScale219CompileCameraModal, context:bpy.types.Context, event:bpy.types.Event) -> set[str]:
+        """
+            Bounds batches until the time slice runs out, and finishes or cancels the compile.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileCameraModal): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+                event (bpy.types.Event): The current event.
+            
+            Returns:
+                set[str]: {'RUNNING_MODAL'} while batches remain, {'PASS_THROUGH'} for unrelated events, {'FINISHED'} once
+                    compiled, or {'CANCELLED'} if Esc was pressed, the config or its camera was removed, or the objects have
+                    no vertices.
+        """
+        if event.type == 'ESC':
+            self.cancel(context)
+            self.report({'WARNING'}, "OrthoScale219 compiling cancelled; the scene was left unchanged.")
+            
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER' or event.timer != self._timer:
+            return {'PASS_THROUGH'}
+        
+        config:OrthoScale219ConfigProperties | None = self.get_config(context)
+        cam_obj:bpy.types.Object | None = config.camera if config is not None else None
+        
+        if config is None or cam_obj is None or cam_obj.type != 'CAMERA':
+            self.cancel(context)
+            self.report({'ERROR'}, "OrthoScale219 compiling cancelled; the config or its camera was removed.")
+            
+            return {'CANCELLED'}
+        
+        cam_matrix_inv:mathutils.Matrix = cam_obj.matrix_world.inverted()
+        
+        if cam_matrix_inv != self._cam_matrix_inv:
+            self._cam_matrix_inv = cam_matrix_inv
+            self._next_batch = 0
+            self._min_co.fill(np.inf)
+            self._max_co.fill(-np.inf)
+            self._object_bounds.clear()
+        
+        depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
+        deadline:float = time.perf_counter() + MODAL_TIME_SLICE
+        
+        while self._next_batch < len(self._batches) and time.perf_counter() < deadline:
+            objs:list[bpy.types.Object] = [obj for obj in (bpy.data.objects.get(name) for name in self._batches[self._next_batch]) if obj is not None]
+            
+            for obj in objs:
+                self._fingerprints[obj.name] = get_geometry_fingerprint(obj, self._fingerprint_memo)
+            
+            for name, bounds in get_object_camera_bounds(objs, depsgraph, self._cam_matrix_inv).items():
+                self._object_bounds[name] = bounds
+                np.minimum(self._min_co, bounds[0], out = self._min_co)
+                np.maximum(self._max_co, bounds[1], out = self._max_co)
+            
+            self._next_batch += 1
+        
+        context.window_manager.progress_update(self._next_batch)
+        context.workspace.status_text_set(f"OrthoScale219: compiling {self._next_batch}/{len(self._batches)} geometry group(s), Esc to cancel")
+        
+        if self._next_batch < len(self._batches):
+            return {'RUNNING_MODAL'}
+        
+        self.cancel(context)
+        
+        return self.finish(context)
+    
+    def finish(self:OBJECT_OT_OrthoScale219CompileCameraModal, context:bpy.types.Context) -> set[str]:
+        """
+            Applies the accumulated bounds to the camera and render settings.
+            
+            Multi-view configs are compiled through compile_multi_view, which reuses the geometry cached by the batches. The
+            occupancy pre-pass does not run here, so the render border is switched off. Like compile_config, single-view
+            compiles store their result in the config, and the config's summary is updated on success.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileCameraModal): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if the config is gone or the objects have no vertices.
+        """
+        config:OrthoScale219ConfigProperties | None = self.get_config(context)
+        
+        if config is None or config.camera is None:
+            self.report({'ERROR'}, "OrthoScale219 compiling cancelled; the config or its camera was removed.")
+            
+            return {'CANCELLED'}
+        
+        if not np.isfinite(self._min_co).all():
+            self.report({'ERROR'}, "No valid vertices found in objects!")
+            
+            return {'CANCELLED'}
+        
+        assign_if_changed(context.scene.render, use_border = False)
+        objs:list[bpy.types.Object] = [obj for obj in (bpy.data.objects.get(name) for batch in self._batches for name in batch) if obj is not None and obj.name in self._fingerprints]
+        
+        if config.use_multi_view:
+            views:list[tuple[bpy.types.Object, int, int]] | None = compile_multi_view(context, config, objs)
+            
+            if views is None:
+                self.report({'ERROR'}, "No valid vertices found in objects!")
+                
+                return {'CANCELLED'}
+            
+            update_config_summary(context, config, objs, time.perf_counter() - self._start, self._memory_before)
+            push_compile_undo(context, self.bl_label)
+            self.report({'INFO'}, f"OrthoScale219 multi-view compiling complete: {len(views)} view(s)")
+            
+            return {'FINISHED'}
+        
+        if self._max_co[2] > 0:
+            self.report({'WARNING'}, "Some objects are behind the camera; they may not render correctly.")
+        
+        framing:tuple[int, int, float, mathutils.Vector, float, float] = compute_framing(self._min_co, self._max_co, config.pixels_per_blender_unit, config.edge_margin)
+        cam_obj:bpy.types.Object = activate_dedicated_camera(context, config, reset = True) if config.use_dedicated_camera else config.camera
+        store_compile_result(config, objs, self._fingerprints, self._object_bounds, cam_obj, framing)
+        apply_framing(context.scene, cam_obj, framing)
+        update_config_summary(context, config, objs, time.perf_counter() - self._start, self._memory_before)
+        push_compile_undo(context, self.bl_label)
+        
+        self.report({'INFO'}, f"OrthoScale219 camera compiling complete: Resolution {framing[0]}x{framing[1]}, Orthographic Scale {framing[2]}")
+        
+        return {'FINISHED'}
+    
+    def get_config(self:OBJECT_OT_OrthoScale219CompileCameraModal, context:bpy.types.Context) -> OrthoScale219ConfigProperties | None:
+        """
+            Looks up the configuration being compiled again, since configs may have been removed between ticks.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileCameraModal): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                OrthoScale219ConfigProperties | None: The configuration, or None if it no longer exists at its index.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if self._config_index < len(settings.configs) and settings.configs[self._config_index].config_name == self._config_name:
+            return settings.configs[self._config_index]
+        
+        return None
+    
+    def cancel(self:OBJECT_OT_OrthoScale219CompileCameraModal, context:bpy.types.Context) -> None:
+        """
+            Removes the modal timer and clears the progress indicator and status text.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileCameraModal): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+        """
+        wm:bpy.types.WindowManager = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+class OBJECT_OT_OrthoScale219ApplyView(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to apply a compiled view of the active multi-view configuration to the scene.
+        
+        This operator sets the scene camera to the view's generated camera and the render resolution to the view's compiled
+        resolution, so that the view can be rendered without recompiling.
+    """
+    bl_idname:str = "render.ortho_scale_219_apply_view"
+    bl_label:str = "Apply View"
+    bl_description:str = "Set the scene camera and resolution to this compiled view."
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    if TYPE_CHECKING:
+        view_index:int
+    else:
+        view_index:IntProperty(
+            name = "View Index",
+            min = 0,
+        )
+    
+    def execute(self:OBJECT_OT_OrthoScale219ApplyView, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the application of a compiled view.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219ApplyView): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if there is no active config or compiled view.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'ERROR'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        
+        if not self.view_index < len(config.multi_view_cameras) or config.multi_view_cameras[self.view_index].camera is None:
+            self.report({'ERROR'}, "View has not been compiled.")
+            
+            return {'CANCELLED'}
+        
+        view:OrthoScale219ViewItem = config.multi_view_cameras[self.view_index]
+        context.scene.camera = view.camera
+        context.scene.render.resolution_x = view.res_x
+        context.scene.render.resolution_y = view.res_y
+        context.scene.render.resolution_percentage = 100
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219SwitchCamera(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to switch the scene between the active configuration's dedicated ortho camera and its source camera.
+        
+        Switching only changes the scene camera and render resolution; neither camera is modified, so alternating between
+        perspective and orthographic passes costs nothing beyond the resolution change.
+    """
+    bl_idname:str = "render.ortho_scale_219_switch_camera"
+    bl_label:str = "Switch Camera"
+    bl_description:str = "Make the dedicated ortho camera or the source camera the scene camera, with its resolution."
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    if TYPE_CHECKING:
+        mode:str
+    else:
+        mode:EnumProperty(
+            name = "Mode",
+            items = [
+                ('ORTHO', "Ortho", "Render through the dedicated ortho camera at the compiled resolution"),
+                ('SOURCE', "Source", "Render through the config's camera at the resolution it had before compiling"),
+            ],
+            default = 'ORTHO',
+        )
+    
+    def execute(self:OBJECT_OT_OrthoScale219SwitchCamera, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the camera switch.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219SwitchCamera): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if there is no active config or the camera is missing.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'ERROR'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        target:bpy.types.Object | None = config.ortho_camera if self.mode == 'ORTHO' else config.camera
+        resolution:tuple[int, int] = tuple(config.cached_resolution) if self.mode == 'ORTHO' else tuple(config.source_resolution)
+        
+        if target is None:
+            self.report({'ERROR'}, "The dedicated ortho camera has not been compiled." if self.mode == 'ORTHO' else "No valid camera selected in active config.")
+            
+            return {'CANCELLED'}
+        
+        if self.mode == 'ORTHO' and context.scene.camera == config.camera:
+            config.source_resolution = (context.scene.render.resolution_x, context.scene.render.resolution_y)
+        
+        if context.scene.camera != target:
+            context.scene.camera = target
+        
+        if min(resolution) > 0:
+            assign_if_changed(context.scene.render, resolution_x = resolution[0], resolution_y = resolution[1])
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219Isolate(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to isolate the active configuration for rendering, or to end the isolation of the scene.
+        
+        Isolating makes the temporary view layer of begin_isolation the window's view layer, so F12 renders only the config's
+        objects, cameras, and isolation lights. Ending it restores the scene through end_isolation.
+    """
+    bl_idname:str = "render.ortho_scale_219_isolate"
+    bl_label:str = "Isolate"
+    bl_description:str = "Render only the active config's objects, cameras, and lights through a temporary view layer, or end the isolation."
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    if TYPE_CHECKING:
+        mode:str
+    else:
+        mode:EnumProperty(
+            name = "Mode",
+            items = [
+                ('BEGIN', "Isolate", "Render only the active config's objects, cameras, and lights"),
+                ('END', "End", "Remove the isolation view layer and render the whole scene again"),
+            ],
+            default = 'BEGIN',
+        )
+    
+    def execute(self:OBJECT_OT_OrthoScale219Isolate, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the isolation change.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219Isolate): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if there is no active config to isolate or nothing to end.
+        """
+        if self.mode == 'END':
+            if not end_isolation(context):
+                self.report({'WARNING'}, "The scene is not isolated.")
+                
+                return {'CANCELLED'}
+            
+            return {'FINISHED'}
+        
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            self.report({'ERROR'}, "No active config selected.")
+            
+            return {'CANCELLED'}
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        view_layer:bpy.types.ViewLayer = begin_isolation(context, config)
+        self.report({'INFO'}, f"OrthoScale219 isolated {config.config_name}: {len(view_layer.objects)} object(s) in {view_layer.name}")
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219CompileTiles(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to compile the tile grid over the objects of every configuration.
+        
+        This operator validates the tile camera and delegates to compile_tile_grid, reporting how many tiles were emitted and
+        how many empty tiles were skipped.
+    """
+    bl_idname:str = "render.ortho_scale_219_compile_tiles"
+    bl_label:str = "Compile Tiles"
+    bl_description:str = "Divide the objects of every configuration into fixed-pixel tiles, skipping empty tiles."
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219CompileTiles, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the compilation of the tile grid.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219CompileTiles): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if there is no valid tile camera or no vertices.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if settings.tile_camera is None or settings.tile_camera.type != 'CAMERA':
+            self.report({'ERROR'}, "No valid tile camera selected.")
+            
+            return {'CANCELLED'}
+        
+        result:tuple[int, int] | None = compile_tile_grid(context, settings)
+        
+        if result is None:
+            self.report({'ERROR'}, "No valid vertices found in objects!")
+            
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"OrthoScale219 tile compiling complete: {result[0]} tile(s) of {settings.tile_size}x{settings.tile_size}, {result[1]} empty tile(s) skipped")
+        
+        return {'FINISHED'}
+
+class OBJECT_OT_OrthoScale219ApplyTile(Operator): # pylint: disable=invalid-name # noqa: N801
+    """
+        Operator to apply the active compiled tile to the tile camera and render settings.
+        
+        This operator moves the tile camera onto the tile with the rotation the grid was compiled with, so a camera rotated
+        since still frames the tile, sets the orthographic scale and clip planes shared by every tile, and sets the render
+        resolution to the tile size.
+    """
+    bl_idname:str = "render.ortho_scale_219_apply_tile"
+    bl_label:str = "Apply Tile"
+    bl_description:str = "Move the tile camera onto the active tile and set the render resolution to the tile size."
+    bl_options:set[str] = {
+        'REGISTER',
+        'UNDO',
+    }
+    
+    def execute(self:OBJECT_OT_OrthoScale219ApplyTile, context:bpy.types.Context) -> set[str]:
+        """
+            Executes the application of the active tile.
+            
+            Args:
+                self (OBJECT_OT_OrthoScale219ApplyTile): The operator instance.
+                context (bpy.types.Context): The current Blender context.
+            
+            Returns:
+                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if there is no tile camera or compiled tile.
+        """
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        if settings.tile_camera is None or not 0 <= settings.active_tile_index < len(settings.tiles):
+            self.report({'ERROR'}, "No compiled tile to apply.")
+            
+            return {'CANCELLED'}
+        
+        tile:OrthoScale219TileItem = settings.tiles[settings.active_tile_index]
+        cam_obj:bpy.types.Object = settings.tile_camera
+        cam_obj.matrix_world = mathutils.Matrix(np.array(tile.matrix).reshape(4, 4).tolist())
+        
+        cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
+        cam_data.type = 'ORTHO'
+        cam_data.ortho_scale = settings.tile_size / settings.tile_pixels_per_blender_unit
+        cam_data.shift_x = 0
+        cam_data.shift_y = 0
+        cam_data.clip_start = 0.001
+        cam_data.clip_end = settings.tile_clip_end
+        
+        scene:bpy.types.Scene = context.scene
+        scene.camera = cam_obj
+        scene.render.resolution_x = settings.tile_size
+        scene.render.resolution_y = settings.tile_size
+        scene.render.resolution_percentage = 100
+        scene.render.use_border = False
+        
+        self.report({'INFO'}, f"OrthoScale219 applied tile ({tile.tile_x}, {tile.tile_y}) with {tile.object_count} object(s)")
+        
+        return {'FINISHED'}
+
+class RENDER_PT_OrthoScale219Panel(Panel): # pylint: disable=invalid-name # noqa: N801
+    """
+        Panel in the Render properties for configuring OrthoScale219 settings.
+        
+        This panel displays UI elements for managing configurations, selecting cameras and objects, adjusting pixels per unit and
+        margins, and executing the setup operator. It is collapsible and located in the Properties window under Render context.
+    """
+    bl_label:str = "OrthoScale219"
+    bl_idname:str = "RENDER_PT_ortho_scale_219"
+    bl_space_type:str = 'PROPERTIES'
+    bl_region_type:str = 'WINDOW'
+    bl_context:str = "render"
+    bl_options:set[str] = {'DEFAULT_CLOSED'}
+    
+    def draw(self:RENDER_PT_OrthoScale219Panel, context:bpy.types.Context):
+        """
+            Draws the UI elements for the OrthoScale219 panel.
+            
+            This method lays out boxes, rows, columns, labels, property fields, template lists, and operators for configurations,
+            cameras, objects, and settings. It conditionally renders elements based on the active configuration index.
+        """
+        layout:bpy.types.UILayout = self.layout
+        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        
+        box:bpy.types.UILayout = layout.box()
+        row:bpy.types.UILayout = box.row()
+        col:bpy.types.UILayout = row.column()
+        col.label(text = "Configurations:")
+        col.template_list(
+            listtype_name = "ORTHOSCALE219_UL_ConfigList",
+            list_id = "ortho_scale_219_configs",
+            dataptr = settings,
+            propname = "configs",
+            active_dataptr = settings,
+            active_propname = "active_config_index",
+            rows = 2,
+        )
+        sub:bpy.types.UILayout = row.column(align = True)
+        sub.operator(
+            operator = "ortho_scale_219.add_config",
+            text = "",
+            icon = 'ADD',
+        )
+        sub.operator(
+            operator = "ortho_scale_219.remove_config",
+            text = "",
+            icon = 'REMOVE',
+        )
+        
+        if not 0 <= settings.active_config_index < len(settings.configs):
+            return
+        
+        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        
+        layout.separator()
+        col = layout.column()
+        col.label(text = "Camera:")
+        col.prop(
+            data = config,
+            property = "camera",
+            text = "",
+            icon = 'CAMERA_DATA',
+        )
+        row = col.row(align = True)
+        row.prop(
+            data = config,
+            property = "use_dedicated_camera",
+        )
+        
+        if config.use_dedicated_camera and config.ortho_camera is not None:
+            row.operator(
+                operator = "render.ortho_scale_219_switch_camera",
+                text = "",
+                icon = 'VIEW_ORTHO',
+            ).mode = 'ORTHO'
+            row.operator(
+                operator = "render.ortho_scale_219_switch_camera",
+                text = "",
+                icon = 'VIEW_PERSPECTIVE',
+            ).mode = 'SOURCE'
+        
+        layout.separator()
+        
+        box = layout.box()
+        box.label(text = "Objects:")
+        row = box.row()
+        col = row.column()
+        col.template_list(
+            listtype_name = "ORTHOSCALE219_UL_ObjectList",
+            list_id = "ortho_scale_219_objects",
+            dataptr = config,
+            propname = "blender_objects",
+            active_dataptr = config,
+            active_propname = "active_object_index",
+            rows = 3,
+        )
+        sub = row.column(align = True)
+        box.separator()
+        sub.operator(
+            operator = "ortho_scale_219.remove_object",
+            text = "",
+            icon = 'REMOVE',
+        )
+        sub = box.row(align = True)
+        sub.prop(
+            data = config,
+            property = "add_blender_object",
+            text = "",
+        )
+        sub.operator(
+            operator = "ortho_scale_219.add_blender_object",
+            text = "",
+            icon = 'ADD',
+        )
+        row = box.row(align = True)
+        row.operator(
+            operator = "ortho_scale_219.add_selected_objects"
+        )
+        row.operator(
+            operator = "ortho_scale_219.prune_objects",
+            text = "",
+            icon = 'BRUSH_DATA',
+        )
+        
+        if config.summary_compiled_at:
+            box.label(
+                text = f"{config.summary_object_count} object(s), {config.summary_vertex_count:,} vertices, compiled in {config.summary_compile_seconds:.3f}s at {config.summary_compiled_at}, peak {config.summary_peak_rss_mb:.0f} MB",
+                icon = 'INFO',
+            )
+            
+            row = box.row()
+            
+            if config.summary_estimate_renders:
+                row.label(
+                    text = f"Estimated render {config.summary_estimate_seconds:.1f}s, peak {config.summary_estimate_peak_mb:.0f} MB (from {config.summary_estimate_renders} render(s))",
+                    icon = 'TIME',
+                )
+            else:
+                row.label(
+                    text = f"{config.summary_triangle_count:,} triangles; " + ("render once to calibrate the estimate" if settings.use_render_history else "record renders to calibrate the estimate"),
+                    icon = 'TIME',
+                )
+            
+            row.prop(
+                data = settings,
+                property = "use_render_history",
+                text = "",
+                icon = 'REC',
+            )
+            
+            if config.use_occupancy and config.summary_occupancy_resolution:
+                box.label(
+                    text = f"{config.summary_empty_fraction:.0%} of the frame is empty",
+                    icon = 'SELECT_SUBTRACT',
+                )
+        else:
+            box.label(
+                text = f"{len(config.blender_objects)} object(s), not compiled yet",
+                icon = 'INFO',
+            )
+        
+        layout.separator()
+        layout.prop(
+            data = config,
+            property = "pixels_per_blender_unit",
+        )
+        layout.prop(
+            data = config,
+            property = "edge_margin",
+        )
+        row = layout.row(align = True)
+        row.prop(
+            data = config,
+            property = "use_streaming",
+        )
+        sub = row.row(align = True)
+        sub.enabled = config.use_streaming
+        sub.prop(
+            data = config,
+            property = "streaming_budget_mb",
+        )
+        sub = row.row(align = True)
+        sub.enabled = not config.use_streaming
+        sub.prop(
+            data = config,
+            property = "use_pipelined",
+            toggle = True,
+        )
+        row = layout.row(align = True)
+        row.prop(
+            data = config,
+            property = "use_occupancy",
+        )
+        sub = row.row(align = True)
+        sub.enabled = config.use_occupancy
+        sub.prop(
+            data = config,
+            property = "occupancy_resolution",
+        )
+        sub.prop(
+            data = config,
+            property = "use_occupancy_border",
+            toggle = True,
+        )
+        row = layout.row(align = True)
+        row.prop(
+            data = config,
+            property = "use_isolation",
+        )
+        row.prop(
+            data = config,
+            property = "isolation_lights",
+            text = "",
+            icon = 'LIGHT',
+        )
+        row.operator(
+            operator = "render.ortho_scale_219_isolate",
+            text = "",
+            icon = 'HIDE_ON',
+        ).mode = 'BEGIN'
+        row.operator(
+            operator = "render.ortho_scale_219_isolate",
+            text = "",
+            icon = 'HIDE_OFF',
+        ).mode = 'END'
+        row = layout.row(align = True)
+        row.prop(
+            data = config,
+            property = "render_passes",
+        )
+        row.prop(
+            data = config,
+            property = "split_passes",
+            text = "",
+            icon = 'RENDERLAYERS',
+        )
+        layout.separator()
+        
+        box = layout.box()
+        box.prop(
+            data = config,
+            property = "use_multi_view",
+        )
+        
+        if config.use_multi_view:
+            row = box.row(align = True)
+            row.prop(
+                data = config,
+                property = "multi_view_count",
+            )
+            row.prop(
+                data = config,
+                property = "multi_view_angle_offset",
+            )
+            
+            for index, view in enumerate(config.multi_view_cameras):
+                if view.camera is None:
+                    continue
+                
+                row = box.row()
+                row.label(
+                    text = f"{view.camera.name}: {view.res_x}x{view.res_y}",
+                    icon = 'CAMERA_DATA',
+                )
+                row.operator(
+                    operator = "render.ortho_scale_219_apply_view",
+                    text = "",
+                    icon = 'RESTRICT_RENDER_OFF',
+                ).view_index = index
+        
+        layout.separator()
+        
+        row = layout.row()
+        row.scale_x = 3.0
+        row.scale_y = 3.0
+        row.operator(operator = "render.ortho_scale_219_compile")
+        row = layout.row(align = True)
+        row.operator(
+            operator = "render.ortho_scale_219_compile_modal",
+            icon = 'TIME',
+        )
+        row.operator(
+            operator = "render.ortho_scale_219_compile_all",
+            icon = 'PRESET',
+        )
+        row.prop(
+            data = settings,
+            property = "use_compile_undo",
+            text = "",
+            icon = 'LOOP_BACK',
+        )
+
+class RENDER_PT_OrthoScale219TileGridPanel(Panel): # pylint: disable=invalid-name # noqa: N801
+    """
+        Sub-panel of the OrthoScale219 panel for compiling and applying the shared tile grid.
+    """
+    bl_label:str = "Tile Grid"
+    bl_idname:str = "RENDER_PT_ortho_scale_219_tile_grid"
+    bl_parent_id:str = "RENDER_PT_ortho_scale_219"
+    bl_space_type:str = 'PROPERTIES'
+    bl_region_type:str = 'WINDOW'
+    bl_context:str = "render"
+    bl_options:set[str] = {'DEFAULT_CLOSED'}
+    
+    def draw(self:RENDER_PT_OrthoScale219TileGridPanel, context:bpy.types.Context):
         """
-            Executes the removal of the active configuration.
-            
-            This method retrieves the settings, removes the config at the active index if valid, and adjusts the active index.
-            
-            Args:
-                self (OBJECT_OT_OrthoScale219RemoveConfig): The operator instance.
-                context (bpy.types.Context): The current Blender context.
-            
-            Returns:
-                set[str]: {'FINISHED'} on success.
+            Draws the tile camera, PPBU, and tile size settings along with the compile and apply tile operators.
         """
+        layout:bpy.types.UILayout = self.layout
         settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
-        index:int = settings.active_config_index
         
-        if 0 <= index < len(settings.configs):
-            settings.configs.remove(index)
-            settings.active_config_index = max(0, index - 1)
+        layout.prop(
+            data = settings,
+            property = "tile_camera",
+            icon = 'CAMERA_DATA',
+        )
+        layout.prop(
+            data = settings,
+            property = "tile_pixels_per_blender_unit",
+        )
+        layout.prop(
+            data = settings,
+            property = "tile_size",
+        )
+        layout.operator(operator = "render.ortho_scale_219_compile_tiles")
         
-        return {'FINISHED'}
+        if not settings.tiles:
+            return
+        
+        layout.label(text = f"{len(settings.tiles)} non-empty tile(s)")
+        row:bpy.types.UILayout = layout.row(align = True)
+        row.prop(
+            data = settings,
+            property = "active_tile_index",
+        )
+        row.operator(
+            operator = "render.ortho_scale_219_apply_tile",
+            text = "",
+            icon = 'RESTRICT_RENDER_OFF',
+        )
 
-class OBJECT_OT_OrthoScale219AddObject(Operator): # pylint: disable=invalid-name # noqa: N801
+def get_rna_fingerprint(data:bpy.types.bpy_struct | None) -> list[Any]:
     """
-        Operator to add a selected mesh object to the active configuration's object list.
+        Returns the values of every plain property of an RNA struct, for hashing.
         
-        This operator checks for an active configuration, verifies the selected object is not already in the list, adds it as a
-        new OrthoScale219ObjectItem if valid, and clears the add object pointer. Reports warnings for invalid states like no
-        object selected or duplicates.
+        Pointer and collection properties are skipped, as are the names in RENDER_CACHE_IGNORED_PROPERTIES, which never change
+        what is rendered (output paths and node editor layout).
+        
+        Args:
+            data (bpy.types.bpy_struct | None): The struct to read.
+        
+        Returns:
+            list[Any]: (identifier, value) pairs with arrays converted to lists; empty if data is None.
     """
-    bl_idname:str = "ortho_scale_219.add_blender_object"
-    bl_label:str = "Add Object"
-    bl_description:str = "Add the selected object to the active config's list"
-    bl_options:set[str] = {
-        'REGISTER',
-        'UNDO',
-    }
+    if data is None:
+        return []
     
-    def execute(self:OBJECT_OT_OrthoScale219AddObject, context:bpy.types.Context)-> set[str]:
-        """
-            Executes the addition of a selected object to the active config's list.
-            
-            This method validates the active config, checks for duplicates, adds the object if valid, and clears the temporary
-            pointer.
-            
-            Args:
-                self (OBJECT_OT_OrthoScale219AddObject): The operator instance.
-                context (bpy.types.Context): The current Blender context.
-            
-            Returns:
-                set[str]: {'FINISHED'} on success (even if duplicate), or {'CANCELLED'} if no active config.
-            
-            Notes:
-                Reports WARNING via self.report if no object selected, duplicate, or no active config.
-        """
-        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+    values:list[Any] = []
+    
+    for prop in data.bl_rna.properties:
+        if prop.type in {'POINTER', 'COLLECTION'} or prop.identifier in RENDER_CACHE_IGNORED_PROPERTIES:
+            continue
         
-        if not 0 <= settings.active_config_index < len(settings.configs):
-            self.report({'WARNING'}, "No active config selected.")
-            
-            return {'CANCELLED'}
+        value:Any = getattr(data, prop.identifier, None)
+        values.append((prop.identifier, list(value) if getattr(prop, "is_array", False) else value))
+    
+    return values
+
+def get_material_fingerprint(material:bpy.types.Material | bpy.types.World | None) -> list[Any]:
+    """
+        Returns a hashable description of a material or world: its settings, nodes, node inputs, links, and image files.
         
-        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        Args:
+            material (bpy.types.Material | bpy.types.World | None): The material or world to describe.
         
-        if config.add_blender_object:
-            for item in config.blender_objects:
-                if item.mesh_object == config.add_blender_object:
-                    self.report({'WARNING'}, "Object already in the list!")
-                    config.add_blender_object = None
-                    
-                    return {'FINISHED'}
-            
-            item:OrthoScale219ObjectItem = config.blender_objects.add()
-            item.mesh_object = config.add_blender_object
-            config.add_blender_object = None
-        else:
-            self.report({'WARNING'}, "No object selected to add.")
+        Returns:
+            list[Any]: The description; empty if material is None.
+    """
+    if material is None:
+        return []
+    
+    return [material.name_full, get_rna_fingerprint(material), get_node_tree_fingerprint(material.node_tree)]
+
+def get_node_tree_fingerprint(node_tree:bpy.types.NodeTree | None) -> list[Any]:
+    """
+        Returns a hashable description of a shader or compositor node tree: its nodes, node inputs, links, and image files.
         
-        return {'FINISHED'}
+        Args:
+            node_tree (bpy.types.NodeTree | None): The node tree to describe.
+        
+        Returns:
+            list[Any]: The description; empty if node_tree is None.
+    """
+    if node_tree is None:
+        return []
+    
+    fingerprint:list[Any] = []
+    
+    for node in node_tree.nodes:
+        inputs:list[Any] = []
+        
+        for socket in node.inputs:
+            value:Any = getattr(socket, "default_value", None)
+            inputs.append((socket.identifier, list(value) if hasattr(value, "__len__") and not isinstance(value, str) else value))
+        
+        image:bpy.types.Image | None = getattr(node, "image", None)
+        image_file:list[Any] = []
+        
+        if image is not None:
+            image_path:str = bpy.path.abspath(image.filepath, library = image.library)
+            image_file = [image_path, os.path.getmtime(image_path) if os.path.exists(image_path) else image.is_dirty]
+        
+        fingerprint.append((node.name, node.bl_idname, get_rna_fingerprint(node), inputs, image_file))
+    
+    fingerprint.append(sorted((link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier) for link in node_tree.links))
+    
+    return fingerprint
 
-class OBJECT_OT_OrthoScale219AddSelectedObjects(Operator): # pylint: disable=invalid-name # noqa: N801
+def get_render_cache_key(scene:bpy.types.Scene, config:OrthoScale219ConfigProperties, view_cam:bpy.types.Object) -> str:
     """
-        Operator to add all currently selected mesh objects to the active configuration's object list.
+        Returns the content address of a config render: a hash of everything that determines the rendered image.
         
-        This operator checks for an active configuration, iterates over selected objects, filters for mesh types not already in
-        the list, adds them as new OrthoScale219ObjectItem instances, and reports the number added or info if none were eligible.
+        The key covers the camera (matrix and camera settings, which include the orthographic scale and clip planes), the
+        render, image, color management, and engine settings (which include the resolution), the Workbench display and shading
+        settings, the compositor node tree, the settings and passes of every view layer used for rendering, the current frame,
+        the world, each config object's world matrix, render visibility, pass index, geometry, and materials, and the name,
+        type, matrix, and data settings of every other visible object in the scene, or of every other object of
+        get_isolation_objects for isolated configs. Geometry is fingerprinted with get_geometry_fingerprint where possible and
+        by hashing the evaluated coordinates otherwise, once per geometry key, so linked duplicates are hashed once. Edits to the geometry of objects outside the config are not detected;
+        isolate configs when that matters.
+        
+        Args:
+            scene (bpy.types.Scene): The scene being rendered.
+            config (OrthoScale219ConfigProperties): The compiled configuration.
+            view_cam (bpy.types.Object): The camera the view is rendered through.
+        
+        Returns:
+            str: The hex digest of the key.
     """
-    bl_idname:str = "ortho_scale_219.add_selected_objects"
-    bl_label:str = "Add All Selected Objects"
-    bl_description:str = "Add all currently selected mesh objects to the active config's list"
-    bl_options:set[str] = {
-        'REGISTER',
-        'UNDO',
-    }
+    depsgraph:bpy.types.Depsgraph = bpy.context.evaluated_depsgraph_get()
+    objs:list[bpy.types.Object] = get_config_objects(config)
+    names:set[str] = {obj.name for obj in objs}
+    key:list[Any] = [
+        np.array(view_cam.matrix_world).round(6).tolist(),
+        get_rna_fingerprint(view_cam.data),
+        get_rna_fingerprint(scene.render),
+        get_rna_fingerprint(scene.render.image_settings),
+        get_rna_fingerprint(scene.view_settings),
+        get_rna_fingerprint(scene.eevee),
+        get_rna_fingerprint(getattr(scene, "cycles", None)),
+        get_rna_fingerprint(scene.display),
+        get_rna_fingerprint(scene.display.shading),
+        scene.use_nodes,
+        get_node_tree_fingerprint(scene.node_tree) if scene.use_nodes else [],
+        scene.frame_current,
+        get_material_fingerprint(scene.world),
+    ]
     
-    def execute(self:OBJECT_OT_OrthoScale219AddSelectedObjects, context:bpy.types.Context) -> set[str]:
-        """
-            Executes the addition of all selected mesh objects to the active config's list.
-            
-            This method validates the active config, filters and adds eligible meshes, and reports the result.
-            
-            Args:
-                self (OBJECT_OT_OrthoScale219AddSelectedObjects): The operator instance.
-                context (bpy.types.Context): The current Blender context.
+    for view_layer in scene.view_layers:
+        if view_layer.use:
+            key.append((get_rna_fingerprint(view_layer), get_rna_fingerprint(view_layer.eevee), get_rna_fingerprint(getattr(view_layer, "cycles", None))))
+    
+    fingerprint_memo:dict[str, str] = {}
+    coords_memo:dict[str, str] = {}
+    
+    for obj in objs:
+        fingerprint:str = get_geometry_fingerprint(obj, fingerprint_memo)
+        eval_obj:bpy.types.Object | None = depsgraph.objects.get(obj.name)
+        
+        if not fingerprint and eval_obj is not None:
+            geometry_key:str = get_geometry_key(obj)
             
-            Returns:
-                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if no active config.
+            if geometry_key not in coords_memo:
+                coords_memo[geometry_key] = hashlib.blake2b(get_local_coords(eval_obj, depsgraph).tobytes(), digest_size = 16).hexdigest()
             
-            Notes:
-                Reports INFO via self.report on the number of objects added or if none were eligible.
-                Reports WARNING if no active config.
-        """
-        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+            fingerprint = coords_memo[geometry_key]
         
-        if not 0 <= settings.active_config_index < len(settings.configs):
-            self.report({'WARNING'}, "No active config selected.")
-            
-            return {'CANCELLED'}
+        key.append((obj.name, np.array(obj.matrix_world).round(6).tolist(), obj.hide_render, obj.pass_index, fingerprint, [get_material_fingerprint(slot.material) for slot in obj.material_slots]))
+    
+    key.append(config.use_isolation)
+    key.append(sorted(config.render_passes))
+    
+    for obj in get_isolation_objects(config) if config.use_isolation else scene.objects:
+        if obj.name not in names and obj != view_cam and (config.use_isolation or obj.visible_get()) and not obj.hide_render:
+            key.append((obj.name, obj.type, np.array(obj.matrix_world).round(6).tolist(), get_rna_fingerprint(obj.data) if obj.data is not None else []))
+    
+    return hashlib.blake2b(json.dumps(key, default = str).encode("utf-8"), digest_size = 20).hexdigest()
+
+def evict_render_cache(cache_dir:str, max_bytes:int) -> int:
+    """
+        Deletes the least recently used files of a render cache until it fits in max_bytes.
         
-        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
-        added_count:int = 0
+        Cache hits refresh the modification time of their file, so it doubles as the last use time.
         
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                continue
-            if any(item.mesh_object == obj for item in config.blender_objects):
+        Args:
+            cache_dir (str): The render cache directory.
+            max_bytes (int): The maximum total size of the cache in bytes.
+        
+        Returns:
+            int: The number of deleted files.
+    """
+    entries:list[tuple[float, int, str]] = []
+    
+    for root, _, files in os.walk(cache_dir):
+        for file_name in files:
+            path:str = os.path.join(root, file_name)
+            
+            try:
+                stat:os.stat_result = os.stat(path)
+            except FileNotFoundError:
                 continue
             
-            item:OrthoScale219ObjectItem = config.blender_objects.add()
-            item.mesh_object = obj
-            added_count += 1
+            entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total:int = sum(size for _, size, _ in entries)
+    deleted:int = 0
+    
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
         
-        if added_count > 0:
-            self.report({'INFO'}, f"Added {added_count} object(s) to the list.")
-        else:
-            self.report({'INFO'}, "No new mesh objects to add (already in list or none selected).")
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
         
-        return {'FINISHED'}
+        total -= size
+        deleted += 1
+    
+    return deleted
 
-class OBJECT_OT_OrthoScale219RemoveObject(Operator): # pylint: disable=invalid-name # noqa: N801
+def get_render_tiles(res_x:int, res_y:int, tile_size:int) -> list[tuple[int, int, int, int]]:
     """
-        Operator to remove the selected object from the active configuration's object list.
+        Splits a frame into pixel-exact tiles, ordered top row first and left to right, the order PNG rows are written in.
         
-        This operator checks for an active configuration, removes the object item at the active object index, and adjusts the
-        active object index to the previous valid one (or 0 if none remain).
+        Args:
+            res_x (int): The frame width in pixels.
+            res_y (int): The frame height in pixels.
+            tile_size (int): The maximum tile width and height in pixels; edge tiles are smaller.
+        
+        Returns:
+            list[tuple[int, int, int, int]]: (x, y, width, height) of every tile, with x and y the pixel offsets of its
+                bottom-left corner from the bottom-left corner of the frame.
     """
-    bl_idname:str = "ortho_scale_219.remove_object"
-    bl_label:str = "Remove Object"
-    bl_description:str = "Remove the selected object from the active config's list"
-    bl_options:set[str] = {
-        'REGISTER',
-        'UNDO',
-    }
+    return [(x, y, min(tile_size, res_x - x), min(tile_size, res_y - y)) for y in reversed(range(0, res_y, tile_size)) for x in range(0, res_x, tile_size)]
+
+def get_png_chunk(kind:bytes, data:bytes) -> bytes:
+    """
+        Encodes a PNG chunk.
+        
+        Args:
+            kind (bytes): The 4-byte chunk type, e.g. b"IDAT".
+            data (bytes): The chunk data.
+        
+        Returns:
+            bytes: The length, type, data, and CRC of the chunk.
+    """
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+def assemble_tiles(tile_paths:list[str], tiles:list[tuple[int, int, int, int]], res_x:int, res_y:int, output_path:str) -> None:
+    """
+        Assembles rendered tiles into one 8-bit RGBA PNG, streaming one row of tiles at a time.
+        
+        Only the tiles of the current tile row are loaded; their pixel rows are compressed into the output as they are read,
+        so memory stays at one tile row no matter how large the frame is. The 8-bit tile values are copied unchanged, so every
+        pixel equals the pixel of a PNG rendered in one piece, except near tile edges for effects that read neighboring
+        pixels (see render_tiled).
+        
+        Args:
+            tile_paths (list[str]): The rendered tile PNGs, in the order of tiles.
+            tiles (list[tuple[int, int, int, int]]): The tiles from get_render_tiles.
+            res_x (int): The frame width in pixels.
+            res_y (int): The frame height in pixels.
+            output_path (str): The PNG file to write.
+    """
+    compressor:Any = zlib.compressobj(6)
+    rows:dict[int, list[int]] = {}
     
-    def execute(self:OBJECT_OT_OrthoScale219RemoveObject, context:bpy.types.Context) -> set[str]:
-        """
-            Executes the removal of the selected object from the active config's list.
+    for index, tile in enumerate(tiles):
+        rows.setdefault(tile[1], []).append(index)
+    
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok = True)
+    
+    with open(output_path, "wb") as output_file:
+        output_file.write(b"\x89PNG\r\n\x1a\n")
+        output_file.write(get_png_chunk(b"IHDR", struct.pack(">IIBBBBB", res_x, res_y, 8, 6, 0, 0, 0)))
+        
+        for tile_y in sorted(rows, reverse = True):
+            band:np.ndarray = np.zeros((tiles[rows[tile_y][0]][3], res_x, 4), dtype = np.uint8)
             
-            This method validates the active config, removes the object at the active index if valid, and adjusts the index.
+            for index in rows[tile_y]:
+                x, _, width, height = tiles[index]
+                image:bpy.types.Image = bpy.data.images.load(tile_paths[index])
+                pixels:np.ndarray = np.empty(width * height * 4, dtype = np.float32)
+                image.pixels.foreach_get(pixels)
+                bpy.data.images.remove(image)
+                band[:, x:x + width] = np.round(pixels.reshape(height, width, 4)[::-1] * 255)
             
-            Args:
-                self (OBJECT_OT_OrthoScale219RemoveObject): The operator instance.
-                context (bpy.types.Context): The current Blender context.
+            filtered:np.ndarray = np.zeros((band.shape[0], res_x * 4 + 1), dtype = np.uint8)
+            filtered[:, 1:] = band.reshape(band.shape[0], -1)
+            output_file.write(get_png_chunk(b"IDAT", compressor.compress(filtered.tobytes())))
+        
+        output_file.write(get_png_chunk(b"IDAT", compressor.flush()))
+        output_file.write(get_png_chunk(b"IEND", b""))
+
+def run_tile_worker(job_path:str) -> dict[str, Any]:
+    """
+        Renders tiles of a render_tiled job in a background Blender process that has loaded the job's .blend file.
+        
+        Workers share the job's tile queue through claim files created with O_EXCL in the tile directory, so every tile is
+        rendered exactly once and fast workers take on more tiles. Every tile is rendered through the job camera with the
+        tile's resolution, orthographic scale, and shift, as an 8-bit RGBA PNG.
+        
+        Args:
+            job_path (str): The JSON job written by render_tiled.
+        
+        Returns:
+            dict[str, Any]: The worker report: the indices of the rendered tiles and the render time.
+    """
+    with open(job_path, encoding = "utf-8") as job_file:
+        job:dict[str, Any] = json.load(job_file)
+    
+    scene:bpy.types.Scene = bpy.data.scenes[job["scene"]]
+    cam_obj:bpy.types.Object = bpy.data.objects[job["camera"]]
+    cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
+    render:bpy.types.RenderSettings = scene.render
+    scene.camera = cam_obj
+    render.resolution_percentage = 100
+    render.use_border = False
+    render.use_file_extension = False
+    render.image_settings.file_format = 'PNG'
+    render.image_settings.color_mode = 'RGBA'
+    render.image_settings.color_depth = '8'
+    cam_data.type = 'ORTHO'
+    cam_data.sensor_fit = 'AUTO'
+    worker_report:dict[str, Any] = {"tiles": [], "seconds": 0.0}
+    start:float = time.perf_counter()
+    
+    for index, tile in enumerate(job["tiles"]):
+        try:
+            os.close(os.open(os.path.join(job["tile_dir"], f"tile_{index}.claim"), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            continue
+        
+        render.resolution_x = tile["width"]
+        render.resolution_y = tile["height"]
+        cam_data.ortho_scale = tile["ortho_scale"]
+        cam_data.shift_x = tile["shift_x"]
+        cam_data.shift_y = tile["shift_y"]
+        render.filepath = os.path.join(job["tile_dir"], f"tile_{index}.png")
+        bpy.ops.render.render(write_still = True, scene = scene.name)
+        worker_report["tiles"].append(index)
+    
+    worker_report["seconds"] = time.perf_counter() - start
+    
+    return worker_report
+
+def render_tiled(scene:bpy.types.Scene, cam_obj:bpy.types.Object, output_path:str, tile_size:int = 1024, workers:int = 0, threads:int = 0) -> dict[str, Any]:
+    """
+        Renders the compiled frame of an orthographic camera as tiles across background Blender processes and assembles them.
+        
+        The frame is split by get_render_tiles. Every tile keeps the frame's pixels per Blender Unit: its orthographic scale
+        spans its own longer side, and its shift_x/shift_y move its center to its pixel offset, so tile pixels land exactly on
+        the pixels of the full frame. The scene is saved to a temporary copy that every worker loads once; each worker then
+        renders tiles off the shared queue of run_tile_worker. The tiles are assembled by assemble_tiles into an 8-bit RGBA PNG.
+        
+        Args:
+            scene (bpy.types.Scene): The scene to render, whose render resolution is the compiled frame.
+            cam_obj (bpy.types.Object): The compiled orthographic camera.
+            output_path (str): The PNG file to write; a leading "//" is resolved relative to the current .blend file.
+            tile_size (int): The maximum tile width and height in pixels. Default: 1024.
+            workers (int): The number of worker processes; 0 uses one per 4 cores. Default: 0.
+            threads (int): The render threads of every worker; 0 splits the cores evenly. Default: 0.
+        
+        Returns:
+            dict[str, Any]: The report: status ('FINISHED' or 'FAILED'), output, tiles, workers (per-worker tiles and render
+                time), seconds, and error if a tile is missing.
+        
+        Notes:
+            Tiles are rendered without overlap, so screen-space effects that read pixels beyond a tile's edge see only the
+            tile: Workbench anti-aliasing, outlines, and cavity, EEVEE bloom, ambient occlusion, and screen-space reflections,
+            and compositor filters such as Glare, Blur, or Defocus can leave visible seams along tile edges. Geometry, shading,
+            and Cycles path tracing match a render in one piece.
+    """
+    render:bpy.types.RenderSettings = scene.render
+    res_x:int = render.resolution_x * render.resolution_percentage // 100
+    res_y:int = render.resolution_y * render.resolution_percentage // 100
+    cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
+    pixel_size:float = cam_data.ortho_scale / max(res_x, res_y)
+    center_x:float = cam_data.shift_x * cam_data.ortho_scale
+    center_y:float = cam_data.shift_y * cam_data.ortho_scale
+    tiles:list[tuple[int, int, int, int]] = get_render_tiles(res_x, res_y, max(1, tile_size))
+    workers = min(len(tiles), workers or max(1, (os.cpu_count() or 1) // 4))
+    threads = threads or max(1, (os.cpu_count() or 1) // workers)
+    output_path = bpy.path.abspath(output_path)
+    report:dict[str, Any] = {"status": 'FINISHED', "output": output_path, "tiles": len(tiles), "workers": [], "seconds": 0.0}
+    start:float = time.perf_counter()
+    
+    with tempfile.TemporaryDirectory(prefix = "ortho_scale_219_tiles_") as tile_dir:
+        blend_copy:str = os.path.join(tile_dir, "scene.blend")
+        bpy.ops.wm.save_as_mainfile(filepath = blend_copy, copy = True)
+        job_path:str = os.path.join(tile_dir, "job.json")
+        
+        with open(job_path, "w", encoding = "utf-8") as job_file:
+            json.dump({
+                "scene": scene.name,
+                "camera": cam_obj.name,
+                "tile_dir": tile_dir,
+                "tiles": [{
+                    "width": width,
+                    "height": height,
+                    "ortho_scale": max(width, height) * pixel_size,
+                    "shift_x": (center_x + (x + width / 2 - res_x / 2) * pixel_size) / (max(width, height) * pixel_size),
+                    "shift_y": (center_y + (y + height / 2 - res_y / 2) * pixel_size) / (max(width, height) * pixel_size),
+                } for x, y, width, height in tiles],
+            }, job_file)
+        
+        processes:list[tuple[subprocess.Popen[bytes], str, str]] = []
+        
+        for index in range(workers):
+            report_path:str = os.path.join(tile_dir, f"worker_{index}.json")
+            log_path:str = os.path.join(tile_dir, f"worker_{index}.log")
+            command:list[str] = [bpy.app.binary_path, "-b", "--factory-startup", "-t", str(threads), blend_copy, "--python", os.path.abspath(__file__), "--", "--render-tiles", job_path, "--report", report_path]
             
-            Returns:
-                set[str]: {'FINISHED'} on success, or {'CANCELLED'} if no active config.
-        """
-        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+            with open(log_path, "wb") as log_file:
+                processes.append((subprocess.Popen(command, stdout = log_file, stderr = subprocess.STDOUT), report_path, log_path))
         
-        if not 0 <= settings.active_config_index < len(settings.configs):
-            return {'CANCELLED'}
+        output:str = ""
         
-        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
-        index:int = config.active_object_index
+        for process, report_path, log_path in processes:
+            if process.wait() != 0:
+                with open(log_path, encoding = "utf-8", errors = "replace") as log_file:
+                    output = log_file.read()[-2000:]
+            
+            if os.path.exists(report_path):
+                with open(report_path, encoding = "utf-8") as worker_file:
+                    report["workers"].append(json.load(worker_file))
         
-        if 0 <= index < len(config.blender_objects):
-            config.blender_objects.remove(index)
-            config.active_object_index = max(0, index - 1)
+        tile_paths:list[str] = [os.path.join(tile_dir, f"tile_{index}.png") for index in range(len(tiles))]
+        missing:list[int] = [index for index, path in enumerate(tile_paths) if not os.path.exists(path)]
         
-        return {'FINISHED'}
+        if missing:
+            report["status"] = 'FAILED'
+            report["error"] = f"{len(missing)} tile(s) were not rendered: {output}"
+        else:
+            assemble_tiles(tile_paths, tiles, res_x, res_y, output_path)
+    
+    report["seconds"] = time.perf_counter() - start
+    
+    return report
 
-class OBJECT_OT_OrthoScale219CompileCamera(Operator): # pylint: disable=invalid-name # noqa: N801
+def split_render_passes(exr_paths:list[str], passes:set[str]) -> list[str]:
     """
-        Operator to set up the orthographic camera and render settings based on the active configuration.
+        Writes every declared pass of multilayer EXR renders to its own EXR file, on parallel threads.
         
-        This operator validates the active configuration, selected camera, and mesh objects; computes the bounding box in camera
-        space; adjusts camera position, orthographic scale, clip planes, and render resolution; and applies padding margins. It
-        reports errors for invalid states, warnings for objects behind the camera, and info on completion.
+        Each render is opened once with OpenImageIO; the channels of every pass are then copied out of it and written as
+        <render>_<pass>.exr, one file per thread, so the compression and disk writes of all renders and passes overlap.
+        Channels are matched by the pass names of RENDER_PASSES, taken from the first view layer of the render that has them.
+        Passes the render engine did not produce are skipped.
+        
+        Args:
+            exr_paths (list[str]): The multilayer EXR renders.
+            passes (set[str]): The declared outputs, keys of RENDER_PASSES.
+        
+        Returns:
+            list[str]: The written files, in render and pass order.
+        
+        Raises:
+            ImportError: If the OpenImageIO Python module is not available.
+            OSError: If a render cannot be read or a pass cannot be written.
     """
-    bl_idname:str = "render.ortho_scale_219_compile"
-    bl_label:str = "Compile Camera"
-    bl_description:str = "Applies all the configuration settings to the camera."
-    bl_options:set[str] = {
-        'REGISTER',
-        'UNDO',
-    }
+    if oiio is None:
+        raise ImportError("Splitting render passes requires the OpenImageIO Python module.")
     
-    def execute(self:OBJECT_OT_OrthoScale219CompileCamera, context:bpy.types.Context) -> set[str]:
+    def write_pass(source:Any, channels:list[int], names:list[str], path:str) -> str:
         """
-            Executes the compilation of the camera and render settings.
-            
-            This method validates inputs, computes the bounding box, adjusts camera and render properties, and reports status.
+            Copies the channels of one pass out of a render and writes them to an EXR file.
             
             Args:
-                self (OBJECT_OT_OrthoScale219CompileCamera): The operator instance.
-                context (bpy.types.Context): The current Blender context.
+                source (Any): The OpenImageIO ImageBuf of the render.
+                channels (list[int]): The indices of the pass's channels.
+                names (list[str]): The channel names of the written file.
+                path (str): The EXR file to write.
             
             Returns:
-                set[str]: {'FINISHED'} on success, or {'CANCELLED'} on validation errors.
-            
-            Notes:
-                Reports ERROR via self.report for no config/objects/camera/vertices.
-                Reports WARNING for objects behind the camera or invalid states.
-                Reports INFO on completion with setup details.
-                Uses a helper function get_bbox to compute bounds and center the camera.
+                str: The written file.
         """
-        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
+        image:Any = oiio.ImageBufAlgo.channels(source, tuple(channels), tuple(names))
         
-        if not 0 <= settings.active_config_index < len(settings.configs):
-            self.report({'ERROR'}, "No active config selected.")
-            
-            return {'CANCELLED'}
+        if not image.write(path):
+            raise OSError(image.geterror())
         
-        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
-        objs:list[bpy.types.Object] = [item.mesh_object for item in config.blender_objects if item.mesh_object and item.mesh_object.type == 'MESH']
+        return path
+    
+    tasks:list[tuple[Any, list[int], list[str], str]] = []
+    
+    for exr_path in exr_paths:
+        source:Any = oiio.ImageBuf(exr_path)
         
-        if not objs:
-            self.report({'ERROR'}, "No valid objects in the active config's list!")
+        if source.has_error:
+            raise OSError(source.geterror())
+        
+        channel_names:list[list[str]] = [name.rsplit(".", 2) for name in source.spec().channelnames]
+        
+        for key in (key for key in RENDER_PASSES if key in passes):
+            matches:list[int] = [index for index, parts in enumerate(channel_names) if len(parts) == 3 and parts[1] == RENDER_PASSES[key][1]]
             
-            return {'CANCELLED'}
+            if matches:
+                channels:list[int] = [index for index in matches if channel_names[index][0] == channel_names[matches[0]][0]]
+                tasks.append((source, channels, [channel_names[index][2] for index in channels], f"{os.path.splitext(exr_path)[0]}_{RENDER_PASSES[key][1]}.exr"))
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max(1, min(len(tasks), os.cpu_count() or 1))) as executor:
+        return list(executor.map(lambda task: write_pass(*task), tasks))
+
+def run_batch_job(scene:bpy.types.Scene, config:OrthoScale219ConfigProperties, blend_path:str, output_pattern:str, render:bool, cache_dir:str | None = None, tile_workers:int = 0, tile_size:int = 1024, tile_threads:int = 0) -> dict[str, Any]:
+    """
+        Compiles, and optionally renders, a single configuration for the batch driver.
         
-        cam_obj:bpy.types.Object | None = config.camera
+        Multi-view configs render one image per compiled view. The output path is output_pattern formatted with the {blend},
+        {scene}, {config}, and {view} placeholders; Blender adds the file extension and resolves a leading "//" relative to the
+        loaded .blend file. With a cache_dir, every view is looked up by get_render_cache_key first: a hit copies the cached
+        image to the output path instead of rendering, and a rendered image is stored in the cache. Configs with use_isolation
+        render through begin_isolation, which stays in place for the next isolated config of the scene; other configs end it
+        first. The config's render passes are applied by apply_render_passes for the renders and restored afterwards, so the
+        scene keeps its own output format and passes. With tile_workers, every view is rendered by render_tiled across that
+        many worker processes and written as a PNG; configs that declare render passes beyond color are rendered in one piece
+        instead. Configs with split_passes have the passes of all their multilayer EXR renders split into separate files by
+        split_render_passes at the end.
         
-        if cam_obj is None or cam_obj.type != 'CAMERA':
-            self.report({'ERROR'}, "No valid camera selected in active config.")
+        Args:
+            scene (bpy.types.Scene): The scene owning the config.
+            config (OrthoScale219ConfigProperties): The configuration to process.
+            blend_path (str): The path of the loaded .blend file.
+            output_pattern (str): The render output pattern.
+            render (bool): Whether to render after compiling.
+            cache_dir (str | None): The render cache directory, or None to always render. Default: None.
+            tile_workers (int): The number of worker processes of tiled renders, or 0 to render in this process. Default: 0.
+            tile_size (int): The maximum tile width and height in pixels of tiled renders. Default: 1024.
+            tile_threads (int): The render threads of every tile worker process, or 0 to split the cores evenly between
+                them. Default: 0.
+        
+        Returns:
+            dict[str, Any]: The job record: blend, scene, config, status ('FINISHED' or 'FAILED'), messages, compile_seconds,
+                render_seconds, resolution, peak_rss_mb, estimated_render_seconds and estimated_peak_mb (None without
+                render history), outputs, and cache_hits, plus empty_fraction for configs with use_occupancy.
+    """
+    messages:list[str] = []
+    job:dict[str, Any] = {
+        "blend": blend_path,
+        "scene": scene.name,
+        "config": config.config_name,
+        "status": 'FINISHED',
+        "messages": messages,
+        "compile_seconds": 0.0,
+        "render_seconds": 0.0,
+        "resolution": None,
+        "peak_rss_mb": 0.0,
+        "outputs": [],
+        "pass_outputs": [],
+        "cache_hits": 0,
+    }
+    
+    def report(report_type:set[str], message:str) -> None:
+        """
+            Collects a status message into the job record.
             
-            return {'CANCELLED'}
+            Args:
+                report_type (set[str]): The report type, e.g. {'ERROR'}.
+                message (str): The message.
+        """
+        messages.append(f"{next(iter(report_type))}: {message}")
+    
+    start:float = time.perf_counter()
+    
+    with bpy.context.temp_override(scene = scene, view_layer = scene.view_layers[0]):
+        compiled:bool = compile_config(bpy.context, config, report)
+    
+    job["compile_seconds"] = time.perf_counter() - start
+    
+    if not compiled:
+        job["status"] = 'FAILED'
         
-        def get_bbox(objs:list[bpy.types.Object], context:bpy.types.Context, cam_obj:bpy.types.Object | None) -> tuple[mathutils.Vector, mathutils.Vector, float, float]:
-            """
-                Computes the bounding box of objects in camera space and centers the camera.
-                
-                This helper function evaluates meshes, transforms vertices to camera coordinates, finds min/max extents, centers
-                the camera on the XY plane, and returns the updated bounds.
-                
-                Args:
-                    objs (list[bpy.types.Object]): List of mesh objects to bound.
-                    context (bpy.types.Context): The current Blender context for depsgraph access.
-                    cam_obj (bpy.types.Object | None): The camera object for transformation matrix.
-                
-                Returns:
-                    tuple[mathutils.Vector, mathutils.Vector, float, float]: (min_co, max_co, min_z, max_z) in camera space.
-                        Returns zeros if no camera or no vertices.
-                
-                Notes:
-                    Modifies cam_obj.location to center the view.
-                    Uses evaluated depsgraph for accurate mesh data.
-                    Clears temporary meshes after use.
-            """
-            if cam_obj is None:
-                return Vector((0.0, 0.0, 0.0)), Vector((0.0, 0.0, 0.0)), 0.0, 0.0
-            
-            depsgraph:bpy.types.Depsgraph = context.evaluated_depsgraph_get()
-            cam_matrix_inv:mathutils.Matrix = cam_obj.matrix_world.inverted()
-            
-            min_x:float = float('inf')
-            min_y:float = float('inf')
-            min_z:float = float('inf')
-            max_x:float = -float('inf')
-            max_y:float = -float('inf')
-            max_z:float = -float('inf')
-            
-            has_verts:bool = False
+        return job
+    
+    job["resolution"] = [scene.render.resolution_x, scene.render.resolution_y]
+    job["peak_rss_mb"] = config.summary_peak_rss_mb
+    job["estimated_render_seconds"] = config.summary_estimate_seconds if config.summary_estimate_renders else None
+    job["estimated_peak_mb"] = config.summary_estimate_peak_mb if config.summary_estimate_renders else None
+    
+    if config.use_occupancy:
+        job["empty_fraction"] = config.summary_empty_fraction
+    
+    if not render:
+        return job
+    
+    if config.use_multi_view:
+        views:list[tuple[bpy.types.Object, int, int]] = [(view.camera, view.res_x, view.res_y) for view in config.multi_view_cameras if view.camera is not None]
+    else:
+        views = [(get_render_camera(config), scene.render.resolution_x, scene.render.resolution_y)]
+    
+    start = time.perf_counter()
+    
+    with bpy.context.temp_override(scene = scene, view_layer = scene.view_layers[0]):
+        if config.use_isolation:
+            begin_isolation(bpy.context, config)
+        else:
+            end_isolation(bpy.context)
+    
+    exr_paths:list[str] = []
+    
+    if tile_workers and config.render_passes - {'COLOR'}:
+        report({'WARNING'}, "Tiled renders only write color; rendering the config's passes in one piece.")
+        tile_workers = 0
+    
+    pass_state:dict[str, Any] | None = apply_render_passes(scene, config)
+    
+    try:
+        for index, (view_cam, res_x, res_y) in enumerate(views):
+            scene.camera = view_cam
+            scene.render.resolution_x = res_x
+            scene.render.resolution_y = res_y
+            scene.render.filepath = output_pattern.format(
+                blend = os.path.splitext(os.path.basename(blend_path))[0],
+                scene = scene.name,
+                config = config.config_name,
+                view = index,
+            )
             
-            for obj in objs:
-                eval_obj:bpy.types.Object | None = depsgraph.objects.get(obj.name)
-                
-                if eval_obj is None:
-                    continue
+            output_path:str = bpy.path.abspath(scene.render.filepath)
+            
+            if scene.render.use_file_extension:
+                output_path = bpy.path.ensure_ext(output_path, scene.render.file_extension)
+            cache_path:str | None = None
+            
+            if tile_workers:
+                output_path = os.path.splitext(output_path)[0] + ".png"
+            
+            if cache_dir is not None:
+                cache_key:str = get_render_cache_key(scene, config, view_cam) + ("-tiled" if tile_workers else "")
+                cache_path = os.path.join(cache_dir, cache_key[:2], cache_key + os.path.splitext(output_path)[1])
                 
-                mesh:bpy.types.Mesh = eval_obj.to_mesh(
-                    preserve_all_data_layers = True,
-                    depsgraph = depsgraph,
-                )
+                os.makedirs(os.path.dirname(output_path), exist_ok = True)
                 
-                if not mesh.vertices:
-                    eval_obj.to_mesh_clear()
+                try:
+                    shutil.copyfile(cache_path, output_path)
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                else:
+                    job["cache_hits"] += 1
+                    job["outputs"].append(bpy.path.abspath(scene.render.filepath))
+                    exr_paths.append(output_path)
                     
                     continue
+            
+            if tile_workers:
+                tiled:dict[str, Any] = render_tiled(scene, view_cam, output_path, tile_size, tile_workers, tile_threads)
                 
-                has_verts = True
-                
-                for vert in mesh.vertices:
-                    world_co:mathutils.Vector = eval_obj.matrix_world @ vert.co
-                    cam_co:mathutils.Vector = cam_matrix_inv @ world_co
+                if tiled["status"] == 'FAILED':
+                    report({'ERROR'}, tiled["error"])
+                    job["status"] = 'FAILED'
                     
-                    min_x = min(min_x, cam_co.x)
-                    max_x = max(max_x, cam_co.x)
-                    min_y = min(min_y, cam_co.y)
-                    max_y = max(max_y, cam_co.y)
-                    min_z = min(min_z, cam_co.z)
-                    max_z = max(max_z, cam_co.z)
-                
-                eval_obj.to_mesh_clear()
-            
-            if not has_verts:
-                return Vector((0.0, 0.0, 0.0)), Vector((0.0, 0.0, 0.0)), 0.0, 0.0
-            
-            center_cam_x:float = (min_x + max_x) / 2
-            center_cam_y:float = (min_y + max_y) / 2
-            
-            if abs(center_cam_x) < 1e-6:
-                center_cam_x = 0
-            
-            if abs(center_cam_y) < 1e-6:
-                center_cam_y = 0
-            
-            delta_local:mathutils.Vector = Vector((center_cam_x, center_cam_y, 0))
-            delta_world:mathutils.Vector = cam_obj.matrix_world.to_3x3() @ delta_local
-            
-            cam_obj.location += delta_world
+                    break
+            else:
+                try:
+                    bpy.ops.render.render(write_still = True, scene = scene.name)
+                except RuntimeError as error:
+                    report({'ERROR'}, str(error))
+                    job["status"] = 'FAILED'
+                    
+                    break
             
-            return Vector((min_x, min_y, 0)), Vector((max_x, max_y, 0)), min_z, max_z
-        
-        min_co:mathutils.Vector = Vector((0.0, 0.0, 0.0))
-        max_co:mathutils.Vector = Vector((0.0, 0.0, 0.0))
-        min_z:float = 0.0
-        max_z:float = 0.0
-        
-        min_co, max_co, min_z, max_z = get_bbox(objs, context, cam_obj)
-        
-        if min_co == Vector((0.0, 0.0, 0.0)) and max_co == Vector((0.0, 0.0, 0.0)):
-            self.report({'ERROR'}, "No valid vertices found in objects!")
+            if cache_path is not None and os.path.exists(output_path):
+                os.makedirs(os.path.dirname(cache_path), exist_ok = True)
+                shutil.copyfile(output_path, f"{cache_path}.{os.getpid()}.tmp")
+                os.replace(f"{cache_path}.{os.getpid()}.tmp", cache_path)
             
-            return {'CANCELLED'}
+            job["outputs"].append(bpy.path.abspath(scene.render.filepath))
+            exr_paths.append(output_path)
         
-        if max_z > 0:
-            self.report({'WARNING'}, "Some objects are behind the camera; they may not render correctly.")
+        if config.split_passes and scene.render.image_settings.file_format == 'OPEN_EXR_MULTILAYER' and job["status"] == 'FINISHED':
+            try:
+                job["pass_outputs"] = split_render_passes(exr_paths, set(config.render_passes))
+            except ImportError as error:
+                report({'WARNING'}, str(error))
+            except OSError as error:
+                report({'ERROR'}, str(error))
+                job["status"] = 'FAILED'
+    finally:
+        restore_render_passes(scene, pass_state)
+    
+    job["render_seconds"] = time.perf_counter() - start
+    
+    return job
+
+def run_batch_worker(worker_index:int, chunks:queue.Queue[list[str]], args:argparse.Namespace, threads:int, report_dir:str, batch_report:dict[str, Any], lock:threading.Lock) -> None:
+    """
+        Runs one worker of a parallel batch: pulls chunks of .blend files off a shared queue and processes each chunk in a fresh
+        background Blender process running run_batch.
         
-        width_bu:float = max_co.x - min_co.x
-        height_bu:float = max_co.y - min_co.y
+        Args:
+            worker_index (int): The index of the worker, used to name its report files.
+            chunks (queue.Queue[list[str]]): The shared queue of .blend file chunks.
+            args (argparse.Namespace): The parsed driver arguments, forwarded to every child process.
+            threads (int): The number of render threads of every child process.
+            report_dir (str): The directory child processes write their JSON reports to.
+            batch_report (dict[str, Any]): The merged report that the results of every chunk are appended to.
+            lock (threading.Lock): Guards batch_report.
+    """
+    chunk_index:int = 0
+    
+    while True:
+        try:
+            chunk:list[str] = chunks.get_nowait()
+        except queue.Empty:
+            return
         
-        view_width_bu:float = width_bu + 2 * config.edge_margin
-        view_height_bu:float = height_bu + 2 * config.edge_margin
+        report_path:str = os.path.join(report_dir, f"worker_{worker_index}_{chunk_index}.json")
+        chunk_index += 1
+        command:list[str] = [bpy.app.binary_path, "-b", "--factory-startup", "-t", str(threads), "--python", os.path.abspath(__file__), "--", "--blend", *chunk, "--scene", *args.scene, "--config", *args.config, "--output", args.output, "--report", report_path, "--threads", str(threads)]
         
-        ppbu:float = config.pixels_per_blender_unit
-        res_x:int = math.ceil(ppbu * view_width_bu)
-        res_y:int = math.ceil(ppbu * view_height_bu)
+        if args.render:
+            command.append("--render")
         
-        world_width:float = res_x / ppbu
-        world_height:float = res_y / ppbu
+        if args.cache_dir:
+            command.extend(["--cache-dir", os.path.abspath(args.cache_dir), "--cache-size-mb", str(args.cache_size_mb)])
         
-        scene:bpy.types.Scene = context.scene
-        scene.render.resolution_x = res_x
-        scene.render.resolution_y = res_y
-        scene.render.resolution_percentage = 100
+        if args.tile_workers:
+            command.extend(["--tile-workers", str(args.tile_workers), "--tile-size", str(args.tile_size)])
         
-        cam_data:bpy.types.Camera = cast(bpy.types.Camera, cam_obj.data)
-        cam_data.type = 'ORTHO'
+        start:float = time.perf_counter()
+        process:subprocess.CompletedProcess[str] = subprocess.run(command, capture_output = True, text = True, check = False)
+        chunk_report:dict[str, Any] = {}
         
-        if res_x >= res_y:
-            cam_data.ortho_scale = world_width
-        else:
-            cam_data.ortho_scale = world_height
+        if os.path.exists(report_path):
+            with open(report_path, encoding = "utf-8") as report_file:
+                chunk_report = json.load(report_file)
         
-        cam_data.shift_x = 0
-        cam_data.shift_y = 0
+        done:set[str] = {entry["blend"] for entry in chunk_report.get("blend_files", [])}
+        failed:list[dict[str, Any]] = [{"blend": blend_path, "status": 'FAILED', "error": f"Worker process exited with code {process.returncode}: {process.stderr[-2000:] or process.stdout[-2000:]}", "load_seconds": 0.0} for blend_path in chunk if blend_path not in done]
         
-        small:float = 0.001
-        target_closest:float = -(config.edge_margin + small)
-        k:float = max_z - target_closest
+        with lock:
+            batch_report["blend_files"].extend(chunk_report.get("blend_files", []) + failed)
+            batch_report["jobs"].extend(chunk_report.get("jobs", []))
+            batch_report["workers"][worker_index]["chunks"] += 1
+            batch_report["workers"][worker_index]["files"] += len(chunk)
+            batch_report["workers"][worker_index]["seconds"] += time.perf_counter() - start
+
+def run_parallel_batch(args:argparse.Namespace, blend_paths:list[str]) -> dict[str, Any]:
+    """
+        Fans a batch out over args.parallel background Blender processes on this machine.
         
-        delta_local_z:mathutils.Vector = Vector((0, 0, k))
-        delta_world_z:mathutils.Vector = cam_obj.matrix_world.to_3x3() @ delta_local_z
-        cam_obj.location += delta_world_z
+        The .blend files are sorted largest first and split into chunks of args.chunk_size, which workers pull off a shared
+        queue, so fast workers take on more chunks and the slowest files do not end up last. Each chunk runs in a fresh
+        Blender process, which pays Blender's startup once per chunk and contains crashes to the files of one chunk. Render
+        threads are split evenly between the workers so they do not oversubscribe the cores; each worker passes its share on
+        as --threads, which its tile workers split again.
         
-        new_min_z:float = min_z - k
+        Args:
+            args (argparse.Namespace): The parsed driver arguments.
+            blend_paths (list[str]): The .blend files to process.
         
-        cam_data.clip_start = small
-        cam_data.clip_end = -new_min_z + config.edge_margin
+        Returns:
+            dict[str, Any]: The merged job report, with per-worker chunk counts, file counts, and busy time under "workers".
+                Files whose worker process died before reporting them are recorded as FAILED with the process output.
+    """
+    chunks:queue.Queue[list[str]] = queue.Queue()
+    ordered:list[str] = sorted(blend_paths, key = lambda path: os.path.getsize(path) if os.path.exists(path) else 0, reverse = True)
+    
+    for index in range(0, len(ordered), args.chunk_size):
+        chunks.put(ordered[index:index + args.chunk_size])
+    
+    worker_count:int = min(args.parallel, chunks.qsize())
+    threads:int = args.threads or max(1, (os.cpu_count() or 1) // max(1, worker_count))
+    batch_report:dict[str, Any] = {
+        "blend_files": [],
+        "jobs": [],
+        "workers": [{"chunks": 0, "files": 0, "seconds": 0.0} for _ in range(worker_count)],
+        "total_seconds": 0.0,
+    }
+    lock:threading.Lock = threading.Lock()
+    
+    with tempfile.TemporaryDirectory(prefix = "ortho_scale_219_") as report_dir:
+        workers:list[threading.Thread] = [threading.Thread(target = run_batch_worker, args = (index, chunks, args, threads, report_dir, batch_report, lock)) for index in range(worker_count)]
         
-        self.report({'INFO'}, f"OrthoScale219 camera compiling complete: Resolution {res_x}x{res_y}, Orthographic Scale {cam_data.ortho_scale}, Pixels Per Blender Unit {ppbu}, Clip Start/End {cam_data.clip_start}/{cam_data.clip_end}")
+        for worker in workers:
+            worker.start()
         
-        return {'FINISHED'}
+        for worker in workers:
+            worker.join()
+    
+    order:dict[str, int] = {blend_path: index for index, blend_path in enumerate(blend_paths)}
+    batch_report["blend_files"].sort(key = lambda entry: order.get(entry["blend"], len(order)))
+    batch_report["jobs"].sort(key = lambda job: order.get(job["blend"], len(order)))
+    
+    return batch_report
 
-class RENDER_PT_OrthoScale219Panel(Panel): # pylint: disable=invalid-name # noqa: N801
-    """
-        Panel in the Render properties for configuring OrthoScale219 settings.
-        
-        This panel displays UI elements for managing configurations, selecting cameras and objects, adjusting pixels per unit and
-        margins, and executing the setup operator. It is collapsible and located in the Properties window under Render context.
+def run_batch(argv:list[str]) -> dict[str, Any]:
     """
-    bl_label:str = "OrthoScale219"
-    bl_idname:str = "RENDER_PT_ortho_scale_219"
-    bl_space_type:str = 'PROPERTIES'
-    bl_region_type:str = 'WINDOW'
-    bl_context:str = "render"
-    bl_options:set[str] = {'DEFAULT_CLOSED'}
-    
-    def draw(self:RENDER_PT_OrthoScale219Panel, context:bpy.types.Context):
-        """
-            Draws the UI elements for the OrthoScale219 panel.
-            
-            This method lays out boxes, rows, columns, labels, property fields, template lists, and operators for configurations,
-            cameras, objects, and settings. It conditionally renders elements based on the active configuration index.
-        """
-        layout:bpy.types.UILayout = self.layout
-        settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(context.scene, "ortho_scale_219_settings"))
-        
-        box:bpy.types.UILayout = layout.box()
-        row:bpy.types.UILayout = box.row()
-        col:bpy.types.UILayout = row.column()
-        col.label(text = "Configurations:")
-        col.template_list(
-            listtype_name = "ORTHOSCALE219_UL_ConfigList",
-            list_id = "ortho_scale_219_configs",
-            dataptr = settings,
-            propname = "configs",
-            active_dataptr = settings,
-            active_propname = "active_config_index",
-            rows = 2,
-        )
-        sub:bpy.types.UILayout = row.column(align = True)
-        sub.operator(
-            operator = "ortho_scale_219.add_config",
-            text = "",
-            icon = 'ADD',
-        )
-        sub.operator(
-            operator = "ortho_scale_219.remove_config",
-            text = "",
-            icon = 'REMOVE',
-        )
+        Command-line batch driver for headless compile-and-render on farm nodes.
         
-        if not 0 <= settings.active_config_index < len(settings.configs):
-            return
+        Run after "--" when executing this file as a Blender script, e.g.
+        blender -b --python __init__.py -- --blend a.blend b.blend --config "Hero*" --output "//renders/{config}_{view}" --render
+        --report report.json. Every .blend file is loaded once, and every matching config of every matching scene is compiled
+        (and rendered with --render) in the same process, so Blender's startup cost is paid once per job rather than once per
+        config. With --parallel N, the files are instead fanned out over N background Blender processes by run_parallel_batch.
+        With --tile-workers N, every view is rendered by render_tiled; its worker processes run this driver with the internal
+        --render-tiles option. The output pattern is checked before any file is loaded, and an exception in one config or file
+        is recorded as FAILED in the report instead of aborting the run.
         
-        config:OrthoScale219ConfigProperties = settings.configs[settings.active_config_index]
+        Args:
+            argv (list[str]): The arguments following "--".
         
-        layout.separator()
-        col = layout.column()
-        col.label(text = "Camera:")
-        col.prop(
-            data = config,
-            property = "camera",
-            text = "",
-            icon = 'CAMERA_DATA',
-        )
-        layout.separator()
+        Returns:
+            dict[str, Any]: The job report: per-file load timings, per-config job records from run_batch_job, and the total
+                wall-clock time. Also written as JSON to --report when given.
+    """
+    parser:argparse.ArgumentParser = argparse.ArgumentParser(
+        prog = "blender -b --python __init__.py --",
+        description = "Compile and render OrthoScale219 configs of one or more .blend files in one or more background Blender processes.",
+    )
+    parser.add_argument("--blend", nargs = "+", default = [], help = ".blend files to process.")
+    parser.add_argument("--blend-dir", nargs = "+", default = [], help = "Directories searched recursively for .blend files to process.")
+    parser.add_argument("--scene", nargs = "+", default = ["*"], help = "Scene name patterns (fnmatch). Default: every scene.")
+    parser.add_argument("--config", nargs = "+", default = ["*"], help = "Config name patterns (fnmatch). Default: every config.")
+    parser.add_argument("--output", default = "//{config}_{view}", help = "Render output pattern with {blend}, {scene}, {config}, and {view} placeholders.")
+    parser.add_argument("--render", action = "store_true", help = "Render every compiled config.")
+    parser.add_argument("--report", help = "Path to write the JSON job report to.")
+    parser.add_argument("--parallel", type = int, default = 1, help = "Number of background Blender processes to fan the files out over. Default: 1 (this process).")
+    parser.add_argument("--chunk-size", type = int, default = 8, help = "Number of .blend files each worker process handles before it is restarted. Default: 8.")
+    parser.add_argument("--threads", type = int, default = 0, help = "Render threads of every worker process, split again between its --tile-workers. Default: the cores divided by --parallel.")
+    parser.add_argument("--cache-dir", help = "Render cache directory. Views whose render cache key matches a cached image are copied instead of rendered.")
+    parser.add_argument("--cache-size-mb", type = float, default = 10240.0, help = "Size the render cache is evicted down to after the batch, least recently used first. Default: 10240.")
+    parser.add_argument("--tile-workers", type = int, default = 0, help = "Render every view as tiles across this many background Blender processes and assemble them into a PNG. Default: 0 (render in one piece).")
+    parser.add_argument("--tile-size", type = int, default = 1024, help = "Maximum tile width and height in pixels for --tile-workers. Default: 1024.")
+    parser.add_argument("--render-tiles", help = argparse.SUPPRESS)
+    args:argparse.Namespace = parser.parse_args(argv)
+    
+    if args.render_tiles:
+        worker_report:dict[str, Any] = run_tile_worker(args.render_tiles)
         
-        box = layout.box()
-        box.label(text = "Objects:")
-        row = box.row()
-        col = row.column()
-        col.template_list(
-            listtype_name = "ORTHOSCALE219_UL_ObjectList",
-            list_id = "ortho_scale_219_objects",
-            dataptr = config,
-            propname = "blender_objects",
-            active_dataptr = config,
-            active_propname = "active_object_index",
-            rows = 3,
-        )
-        sub = row.column(align = True)
-        box.separator()
-        sub.operator(
-            operator = "ortho_scale_219.remove_object",
-            text = "",
-            icon = 'REMOVE',
-        )
-        sub = box.row(align = True)
-        sub.prop(
-            data = config,
-            property = "add_blender_object",
-            text = "",
-        )
-        sub.operator(
-            operator = "ortho_scale_219.add_blender_object",
-            text = "",
-            icon = 'ADD',
-        )
-        box.operator(
-            operator = "ortho_scale_219.add_selected_objects"
-        )
+        if args.report:
+            with open(args.report, "w", encoding = "utf-8") as report_file:
+                json.dump(worker_report, report_file, indent = 2)
         
-        layout.separator()
-        layout.prop(
-            data = config,
-            property = "pixels_per_blender_unit",
-        )
-        layout.prop(
-            data = config,
-            property = "edge_margin",
-        )
-        layout.separator()
+        return worker_report
+    
+    try:
+        args.output.format(blend = "blend", scene = "scene", config = "config", view = 0)
+    except (KeyError, IndexError, ValueError) as error:
+        parser.error(f"invalid --output pattern {args.output!r}: {error!r}; use the {{blend}}, {{scene}}, {{config}}, and {{view}} placeholders and double literal braces")
+    
+    blend_paths:list[str] = list(args.blend)
+    
+    for blend_dir in args.blend_dir:
+        blend_paths.extend(sorted(glob.glob(os.path.join(glob.escape(blend_dir), "**", "*.blend"), recursive = True)))
+    
+    if not blend_paths:
+        parser.error("no .blend files given; use --blend or --blend-dir")
+    
+    start:float = time.perf_counter()
+    
+    if args.parallel > 1:
+        batch_report:dict[str, Any] = run_parallel_batch(args, blend_paths)
+    else:
+        batch_report = {
+            "blend_files": [],
+            "jobs": [],
+            "total_seconds": 0.0,
+        }
+        tile_threads:int = max(1, (args.threads or os.cpu_count() or 1) // args.tile_workers) if args.tile_workers > 0 else 0
         
-        row = layout.row()
-        row.scale_x = 3.0
-        row.scale_y = 3.0
-        row.operator(operator = "render.ortho_scale_219_compile")
+        for blend_path in blend_paths:
+            load_start:float = time.perf_counter()
+            
+            try:
+                bpy.ops.wm.open_mainfile(filepath = blend_path)
+            except RuntimeError as error:
+                batch_report["blend_files"].append({"blend": blend_path, "status": 'FAILED', "error": str(error), "load_seconds": time.perf_counter() - load_start})
+                
+                continue
+            
+            file_entry:dict[str, Any] = {"blend": blend_path, "status": 'FINISHED', "load_seconds": time.perf_counter() - load_start}
+            batch_report["blend_files"].append(file_entry)
+            
+            try:
+                for scene in bpy.data.scenes:
+                    if not any(fnmatch.fnmatchcase(scene.name, pattern) for pattern in args.scene):
+                        continue
+                    
+                    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(scene, "ortho_scale_219_settings"))
+                    
+                    for config in settings.configs:
+                        if not any(fnmatch.fnmatchcase(config.config_name, pattern) for pattern in args.config):
+                            continue
+                        
+                        scene_name:str = scene.name
+                        config_name:str = config.config_name
+                        
+                        try:
+                            batch_report["jobs"].append(run_batch_job(scene, config, blend_path, args.output, args.render, args.cache_dir, args.tile_workers, args.tile_size, tile_threads))
+                        except Exception as error: # pylint: disable=broad-exception-caught
+                            batch_report["jobs"].append({
+                                "blend": blend_path,
+                                "scene": scene_name,
+                                "config": config_name,
+                                "status": 'FAILED',
+                                "messages": [f"ERROR: {type(error).__name__}: {error}"],
+                                "compile_seconds": 0.0,
+                                "render_seconds": 0.0,
+                                "resolution": None,
+                                "peak_rss_mb": 0.0,
+                                "outputs": [],
+                                "pass_outputs": [],
+                                "cache_hits": 0,
+                            })
+                    
+                    with bpy.context.temp_override(scene = scene, view_layer = scene.view_layers[0]):
+                        end_isolation(bpy.context)
+            except Exception as error: # pylint: disable=broad-exception-caught
+                file_entry["status"] = 'FAILED'
+                file_entry["error"] = f"{type(error).__name__}: {error}"
+    
+    if args.cache_dir and os.path.isdir(args.cache_dir):
+        batch_report["cache_evicted"] = evict_render_cache(args.cache_dir, int(args.cache_size_mb * 2 ** 20))
+    
+    batch_report["total_seconds"] = time.perf_counter() - start
+    
+    if args.report:
+        with open(args.report, "w", encoding = "utf-8") as report_file:
+            json.dump(batch_report, report_file, indent = 4)
+    
+    failed:int = sum(1 for job in batch_report["jobs"] if job["status"] != 'FINISHED') + sum(1 for entry in batch_report["blend_files"] if entry["status"] != 'FINISHED')
+    print(f"OrthoScale219 batch complete: {len(batch_report['blend_files'])} file(s), {len(batch_report['jobs'])} config(s), {failed} failed, {sum(job.get('cache_hits', 0) for job in batch_report['jobs'])} cached render(s), {batch_report['total_seconds']:.2f}s")
+    
+    return batch_report
 
 rna_classes = (
     OrthoScale219ObjectItem,
     ORTHOSCALE219_UL_ObjectList,
+    OrthoScale219BoundsItem,
+    OrthoScale219ViewItem,
     OrthoScale219ConfigProperties,
     ORTHOSCALE219_UL_ConfigList,
+    OrthoScale219TileItem,
     OrthoScale219Settings,
     OBJECT_OT_OrthoScale219AddConfig,
     OBJECT_OT_OrthoScale219RemoveConfig,
     OBJECT_OT_OrthoScale219AddObject,
     OBJECT_OT_OrthoScale219AddSelectedObjects,
     OBJECT_OT_OrthoScale219RemoveObject,
+    OBJECT_OT_OrthoScale219PruneObjects,
     OBJECT_OT_OrthoScale219CompileCamera,
+    OBJECT_OT_OrthoScale219CompileAll,
+    OBJECT_OT_OrthoScale219CompileCameraModal,
+    OBJECT_OT_OrthoScale219ApplyView,
+    OBJECT_OT_OrthoScale219SwitchCamera,
+    OBJECT_OT_OrthoScale219Isolate,
+    OBJECT_OT_OrthoScale219CompileTiles,
+    OBJECT_OT_OrthoScale219ApplyTile,
     RENDER_PT_OrthoScale219Panel,
+    RENDER_PT_OrthoScale219TileGridPanel,
 )
 
 ortho_scale_219_registered = [False]
@@ -859,8 +5578,9 @@ def register() -> None:
     """
         Registers all classes and properties for the OrthoScale219 add-on.
         
-        This function registers each class in the 'rna_classes' tuple with Blender and attaches the OrthoScale219Settings
-        property group to the Scene type for scene-level persistence.
+        This function registers each class in the 'rna_classes' tuple with Blender, attaches the OrthoScale219Settings
+        property group to the Scene type for scene-level persistence, and installs the handlers that keep cached geometry
+        up to date and record the render history.
     """
     if ortho_scale_219_registered[0]:
         return
@@ -869,14 +5589,21 @@ def register() -> None:
         bpy.utils.register_class(cls)
     
     bpy.types.Scene.ortho_scale_219_settings = bpy.props.PointerProperty(type = OrthoScale219Settings)
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update_post)
+    bpy.app.handlers.frame_change_post.append(on_frame_change_post)
+    bpy.app.handlers.load_post.append(on_load_post)
+    bpy.app.handlers.render_pre.append(on_render_pre)
+    bpy.app.handlers.render_stats.append(on_render_stats)
+    bpy.app.handlers.render_post.append(on_render_post)
+    bpy.app.handlers.render_cancel.append(on_render_cancel)
     ortho_scale_219_registered[0] = True
 
 def unregister():
     """
         Unregisters all classes and properties for the OrthoScale219 add-on.
         
-        This function unregisters each class in the 'rna_classes' tuple in reverse order and removes the OrthoScale219Settings
-        property from the Scene type.
+        This function unregisters each class in the 'rna_classes' tuple in reverse order, removes the OrthoScale219Settings
+        property from the Scene type, and removes the cache handlers.
     """
     if not ortho_scale_219_registered[0]:
         return
@@ -890,7 +5617,26 @@ def unregister():
     if hasattr(bpy.types.Scene, "ortho_scale_219_settings"):
         del bpy.types.Scene.ortho_scale_219_settings
     
+    for handlers, handler in (
+        (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update_post),
+        (bpy.app.handlers.frame_change_post, on_frame_change_post),
+        (bpy.app.handlers.load_post, on_load_post),
+        (bpy.app.handlers.render_pre, on_render_pre),
+        (bpy.app.handlers.render_stats, on_render_stats),
+        (bpy.app.handlers.render_post, on_render_post),
+        (bpy.app.handlers.render_cancel, on_render_cancel),
+    ):
+        if handler in handlers:
+            handlers.remove(handler)
+    
+    if bpy.app.timers.is_registered(prune_all_configs_timer):
+        bpy.app.timers.unregister(prune_all_configs_timer)
+    
+    clear_geometry_cache()
     ortho_scale_219_registered[0] = False
 
 if __name__ == "__main__":
     register()
+    
+    if "--" in sys.argv:
+        run_batch(sys.argv[sys.argv.index("--") + 1:])
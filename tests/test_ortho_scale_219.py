@@ -18,6 +18,35 @@
         test_add_selected_objects: Test adding all selected mesh objects to the active config.
         test_remove_object: Test removing an object from the active config's list.
         test_compile_camera: Test compiling the camera setup based on the config.
+        test_compile_linked_duplicates: Test compiling around linked duplicates that share mesh data.
+        test_hull_reduction: Test that shared geometry is reduced to its convex hull only with enough users.
+        test_recompile_after_geometry_edit: Test that recompiling picks up edited geometry despite cached extents.
+        test_compile_multi_view: Test compiling several views of a multi-view config in one operator call.
+        test_compile_tile_grid: Test compiling a shared tile grid across configs and skipping empty tiles.
+        test_spatial_index: Test querying the spatial index of a config and its incremental update after a move.
+        test_compile_config_function: Test compiling a config that is not active through compile_config.
+        test_compile_all: Test compiling every config in one operator call.
+        test_measure_compile_undo: Test measuring compiles with and without undo pushes and restoring the undo setting.
+        test_compile_modal: Test driving the cancellable compile to completion and through edits and cancellation.
+        test_object_list_filter_and_summary: Test bulk filtering and sorting of the object list and the cached compile summary.
+        test_prune_stale_objects: Test removing deleted objects from every config in one validation pass.
+        test_compile_non_mesh_objects: Test compiling around a curve and a text object without leaving converted meshes.
+        test_local_coords_volume: Test that a volume is bounded by the corners of its evaluated bounding box.
+        test_local_coords_point_cloud: Test that a point cloud is bounded by its position attribute.
+        test_local_coords_metaball: Test that a metaball family is bounded by its basis and other metaballs evaluate empty.
+        test_local_coords_hair_curves: Test that hair curves are bounded by their control points.
+        test_compile_streaming: Test that a streaming compile matches a regular compile and respects its cache budget.
+        test_persisted_compile_result: Test reusing the compile result stored in a config for unchanged objects.
+        test_parallel_batch: Test fanning a directory of .blend files out over two background Blender processes.
+        test_batch_errors: Test that a bad output pattern is rejected up front and a failing config does not abort the batch.
+        test_dedicated_ortho_camera: Test compiling through a dedicated ortho camera and switching back to the source camera.
+        test_render_cache: Test that an unchanged config render is served from the render cache and an edit invalidates it.
+        test_render_isolation: Test isolating configs in a temporary view layer and tearing it down.
+        test_occupancy_pre_pass: Test the occupancy pre-pass on an L-shaped layout and its trimmed render border.
+        test_render_estimate: Test recording render timings and estimating render time and memory from them.
+        test_pipelined_bounds: Test that pipelined extraction produces the same extents as sequential extraction.
+        test_render_tiled: Test that a tiled render across two worker processes matches a single render of the frame.
+        test_render_passes: Test writing color, depth, normal, and object index maps from one render and splitting them.
     
     Notes:
         Requires pytest and pytest-blender installed in Blender's Python environment.
@@ -28,14 +57,17 @@
     Author: S.A. Lowell
     Version: 2.1.9+109092.1756709219
 """
+from types import SimpleNamespace
 from typing import cast, TYPE_CHECKING
 
+import json
 import math
+import tempfile
 import bpy
 import pytest
 
 if TYPE_CHECKING:
-    from .. import OrthoScale219Settings
+    from .. import OBJECT_OT_OrthoScale219CompileCameraModal, OrthoScale219Settings, ORTHOSCALE219_UL_ObjectList, apply_render_passes, clear_geometry_cache, begin_isolation, compile_config, end_isolation, estimate_render_cost, evict_render_cache, get_evaluated_point_count, get_geometry_fingerprint, get_local_coords, get_object_camera_bounds, get_pipelined_object_bounds, get_point_count, get_render_cache_key, get_spatial_index, measure_compile_undo, prune_all_configs, ortho_scale_219_geometry_cache, record_render, render_tiled, restore_render_passes, run_batch
 else:
     import importlib.util
     import sys
@@ -47,7 +79,7 @@ else:
     sys.modules["ortho_scale_219"] = ortho_scale_219
     spec.loader.exec_module(ortho_scale_219)
 
-    from ortho_scale_219 import OrthoScale219Settings
+    from ortho_scale_219 import OBJECT_OT_OrthoScale219CompileCameraModal, OrthoScale219Settings, ORTHOSCALE219_UL_ObjectList, apply_render_passes, clear_geometry_cache, begin_isolation, compile_config, end_isolation, estimate_render_cost, evict_render_cache, get_evaluated_point_count, get_geometry_fingerprint, get_local_coords, get_object_camera_bounds, get_pipelined_object_bounds, get_point_count, get_render_cache_key, get_spatial_index, measure_compile_undo, prune_all_configs, ortho_scale_219_geometry_cache, record_render, render_tiled, restore_render_passes, run_batch
 
 @pytest.fixture(scope = "function")
 def clean_scene():
@@ -55,7 +87,8 @@ def clean_scene():
         Fixture to create a clean scene for each test.
         
         This fixture deletes all objects in the current scene and clears the OrthoScale219 configurations to start with a clean
-        slate. It yields control to the test and cleans up afterward if needed.
+        slate. Render recording is switched off, so only tests that opt in write a render history, and compile undo steps are switched back on. It yields control to the
+        test and cleans up afterward if needed.
         
         Yields:
             None
@@ -68,6 +101,8 @@ def clean_scene():
     settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
     settings.configs.clear()
     settings.active_config_index = 0
+    settings.use_render_history = False
+    settings.use_compile_undo = True
     
     yield
     
@@ -227,3 +262,1534 @@ def test_compile_camera(clean_scene:None): # noinspection PyUnusedLocal,PyShadow
     assert cam_data.clip_end == pytest.approx(2.001, abs=0.1)
     
     print("test_compile_camera completed")
+
+def test_compile_linked_duplicates(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling around linked duplicates that share mesh data.
+        
+        This test creates a cube and a linked duplicate offset along X, adds both to a config, invokes the compile operator, and
+        verifies the resolution spans both objects even though their shared mesh is only evaluated once and only fingerprinted
+        once per memo.
+    """
+    print("Starting test_compile_linked_duplicates")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    
+    cube = bpy.context.active_object
+    duplicate = bpy.data.objects.new("TestDuplicate", cube.data)
+    bpy.context.collection.objects.link(duplicate)
+    duplicate.location = (4, 0, 0)
+    
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    
+    for obj in (cube, duplicate):
+        config.add_blender_object = obj
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    bpy.ops.render.ortho_scale_219_compile()
+    
+    scene = bpy.context.scene
+    assert duplicate.data == cube.data
+    assert scene.render.resolution_x == pytest.approx(60, abs=1)
+    assert scene.render.resolution_y == pytest.approx(20, abs=1)
+    assert cam_data.ortho_scale == pytest.approx(6.0, abs=0.1)
+    
+    memo = {}
+    fingerprint = get_geometry_fingerprint(cube, memo)
+    assert fingerprint
+    assert get_geometry_fingerprint(duplicate, memo) == fingerprint
+    assert list(memo.values()) == [fingerprint]
+    
+    print("test_compile_linked_duplicates completed")
+
+def test_hull_reduction(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that shared geometry is reduced to its convex hull only with enough users.
+        
+        This test builds a 13x13x13 vertex lattice, bounds two linked duplicates of it through a rotated camera and verifies the
+        full vertex set is cached, then bounds 24 duplicates and verifies only the hull vertices are cached, and that the
+        extents of every duplicate match those of its full vertex set in both cases.
+    """
+    print("Starting test_hull_reduction")
+    
+    steps = range(-6, 7)
+    mesh = bpy.data.meshes.new("TestLattice")
+    mesh.from_pydata([(x * 0.1, y * 0.2, z * 0.3) for x in steps for y in steps for z in steps], [], [])
+    
+    cam_obj = bpy.data.objects.new("TestCamera", bpy.data.cameras.new("TestCamera"))
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (3, -10, 2)
+    cam_obj.rotation_euler = (math.radians(70), math.radians(10), math.radians(25))
+    bpy.context.view_layer.update()
+    cam_matrix_inv = cam_obj.matrix_world.inverted()
+    objs = []
+    
+    for user_count in (2, 24):
+        while len(objs) < user_count:
+            obj = bpy.data.objects.new(f"TestLattice{len(objs)}", mesh)
+            bpy.context.collection.objects.link(obj)
+            obj.location = (len(objs) * 5.0, 0, 0)
+            obj.rotation_euler = (0, 0, math.radians(len(objs) * 15))
+            objs.append(obj)
+        
+        bpy.context.view_layer.update()
+        clear_geometry_cache()
+        bounds = get_object_camera_bounds(objs, bpy.context.evaluated_depsgraph_get(), cam_matrix_inv)
+        cached = list(ortho_scale_219_geometry_cache.values())
+        
+        assert len(cached) == 1
+        
+        if user_count == 2:
+            assert len(cached[0]) == len(mesh.vertices)
+        else:
+            assert 4 <= len(cached[0]) < len(mesh.vertices) - 11 ** 3 + 1
+        
+        for obj in objs:
+            cam_coords = [cam_matrix_inv @ obj.matrix_world @ vertex.co for vertex in mesh.vertices]
+            
+            for axis in range(3):
+                assert bounds[obj.name][0][axis] == pytest.approx(min(co[axis] for co in cam_coords), abs=1e-4)
+                assert bounds[obj.name][1][axis] == pytest.approx(max(co[axis] for co in cam_coords), abs=1e-4)
+    
+    print("test_hull_reduction completed")
+
+def test_recompile_after_geometry_edit(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that recompiling picks up edited geometry despite cached extents.
+        
+        This test compiles an axis-aligned camera around a cube, verifies only its extents and not its coordinates are cached,
+        scales the cube's mesh data in place, recompiles, and verifies the resolution follows the edited geometry rather than
+        the cached extents of the first compile.
+    """
+    print("Starting test_recompile_after_geometry_edit")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    
+    cube = bpy.context.active_object
+    
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    
+    config.add_blender_object = cube
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    clear_geometry_cache()
+    bpy.ops.render.ortho_scale_219_compile()
+    
+    scene = bpy.context.scene
+    assert scene.render.resolution_x == pytest.approx(20, abs=1)
+    assert not ortho_scale_219_geometry_cache
+    
+    for vert in cube.data.vertices:
+        vert.co *= 2.0
+    
+    cube.data.update()
+    bpy.ops.render.ortho_scale_219_compile()
+    
+    assert scene.render.resolution_x == pytest.approx(40, abs=1)
+    assert scene.render.resolution_y == pytest.approx(40, abs=1)
+    
+    print("test_recompile_after_geometry_edit completed")
+
+def test_compile_multi_view(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling several views of a multi-view config in one operator call.
+        
+        This test enables multi-view on a config around a box that is longer along X than along Y, compiles four views, and
+        verifies a camera and resolution is produced per view. It then lowers the view count and verifies the extra cameras and
+        their camera data are removed.
+    """
+    print("Starting test_compile_multi_view")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.rotation_euler = (math.radians(90), 0, 0)
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0), scale=(2, 1, 1))
+    
+    box = bpy.context.active_object
+    
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    config.use_multi_view = True
+    config.multi_view_count = 4
+    
+    config.add_blender_object = box
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    bpy.ops.render.ortho_scale_219_compile()
+    
+    assert len(config.multi_view_cameras) == 4
+    assert len({view.camera.name for view in config.multi_view_cameras}) == 4
+    assert config.multi_view_cameras[0].res_x == pytest.approx(40, abs=1)
+    assert config.multi_view_cameras[1].res_x == pytest.approx(20, abs=1)
+    assert config.multi_view_cameras[2].res_x == pytest.approx(40, abs=1)
+    assert config.multi_view_cameras[3].res_x == pytest.approx(20, abs=1)
+    assert all(view.res_y == pytest.approx(20, abs=1) for view in config.multi_view_cameras)
+    assert bpy.context.scene.camera == config.multi_view_cameras[0].camera
+    
+    stale_data_names = [view.camera.data.name for view in config.multi_view_cameras[2:]]
+    config.multi_view_count = 2
+    bpy.ops.render.ortho_scale_219_compile()
+    
+    assert len(config.multi_view_cameras) == 2
+    assert not any(name in bpy.data.cameras for name in stale_data_names)
+    
+    print("test_compile_multi_view completed")
+
+def test_compile_tile_grid(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling a shared tile grid across configs and skipping empty tiles.
+        
+        This test places two cubes far apart in two separate configs, compiles a grid of 2 BU tiles, and verifies only the tiles
+        covering the cubes are emitted. It then rotates the camera, applies a tile, and verifies the camera is back in the compiled
+        rotation and the camera and resolution match the tile size.
+    """
+    print("Starting test_compile_tile_grid")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.rotation_euler = (math.radians(90), 0, 0)
+    
+    for location in ((0, 0, 0), (10, 0, 0)):
+        bpy.ops.ortho_scale_219.add_config()
+        config = settings.configs[settings.active_config_index]
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        config.add_blender_object = bpy.context.active_object
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    settings.tile_camera = cam_obj
+    settings.tile_pixels_per_blender_unit = 10.0
+    settings.tile_size = 20
+    
+    bpy.ops.render.ortho_scale_219_compile_tiles()
+    
+    assert len(settings.tiles) == 8
+    assert all(tile.object_count == 1 for tile in settings.tiles)
+    
+    cam_obj.rotation_euler = (math.radians(60), 0, math.radians(30))
+    settings.active_tile_index = 0
+    bpy.ops.render.ortho_scale_219_apply_tile()
+    bpy.context.view_layer.update()
+    
+    scene = bpy.context.scene
+    assert tuple(cam_obj.rotation_euler) == pytest.approx((math.radians(90), 0, 0), abs=1e-5)
+    assert tuple(cam_obj.matrix_world.translation) == pytest.approx(tuple(settings.tiles[0].location), abs=1e-5)
+    assert scene.camera == cam_obj
+    assert scene.render.resolution_x == 20
+    assert scene.render.resolution_y == 20
+    assert cam_data.ortho_scale == pytest.approx(2.0)
+    
+    print("test_compile_tile_grid completed")
+
+def test_spatial_index(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test querying the spatial index of a config and its incremental update after a move.
+        
+        This test indexes two cubes far apart, verifies rectangle queries only return the cube they overlap, then moves one
+        cube and verifies the index picks up its new extents on the next query.
+    """
+    print("Starting test_spatial_index")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.rotation_euler = (math.radians(90), 0, 0)
+    config.camera = cam_obj
+    
+    cubes = []
+    
+    for location in ((0, 0, 0), (10, 0, 0)):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        cubes.append(bpy.context.active_object)
+        config.add_blender_object = cubes[-1]
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    index = get_spatial_index(bpy.context, config)
+    assert index.query((-2, -2), (2, 2)) == {cubes[0].name}
+    assert index.is_empty((4, -2), (6, 2))
+    
+    cubes[1].location = (5, 0, 0)
+    
+    index = get_spatial_index(bpy.context, config)
+    assert index.query((4, -2), (6, 2)) == {cubes[1].name}
+    assert index.is_empty((9, -2), (11, 2))
+    
+    print("test_spatial_index completed")
+
+def test_compile_config_function(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling a config that is not active through compile_config.
+        
+        This test sets up a config around a cube, makes a second empty config active, compiles the first config directly with
+        compile_config as the batch driver does, and verifies the resolution and the collected reports.
+    """
+    print("Starting test_compile_config_function")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    config.add_blender_object = bpy.context.active_object
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    bpy.ops.ortho_scale_219.add_config()
+    
+    reports = []
+    assert compile_config(bpy.context, config, lambda report_type, message: reports.append((report_type, message)))
+    assert bpy.context.scene.render.resolution_x == pytest.approx(20, abs=1)
+    assert any('INFO' in report_type for report_type, _ in reports)
+    
+    reports.clear()
+    assert not compile_config(bpy.context, settings.configs[1], lambda report_type, message: reports.append((report_type, message)))
+    assert any('ERROR' in report_type for report_type, _ in reports)
+    
+    print("test_compile_config_function completed")
+
+def test_compile_all(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling every config in one operator call.
+        
+        This test sets up two configs with their own camera and cube, compiles both with the compile all operator, and verifies
+        each camera was framed. It then adds an empty config and verifies the batch still finishes for the valid configs.
+    """
+    print("Starting test_compile_all")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    cameras = []
+    
+    for index, size in enumerate((2.0, 4.0)):
+        bpy.ops.ortho_scale_219.add_config()
+        config = settings.configs[settings.active_config_index]
+        
+        cam_data = bpy.data.cameras.new(f"TestCamera{index}")
+        cam_obj = bpy.data.objects.new(f"TestCamera{index}", cam_data)
+        bpy.context.collection.objects.link(cam_obj)
+        cam_obj.location = (index * 20, -10, 0)
+        cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+        cameras.append(cam_obj)
+        
+        bpy.ops.mesh.primitive_cube_add(size=size, location=(index * 20, 0, 0))
+        
+        config.camera = cam_obj
+        config.pixels_per_blender_unit = 10.0
+        config.edge_margin = 0.0
+        config.add_blender_object = bpy.context.active_object
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    result = bpy.ops.render.ortho_scale_219_compile_all()
+    assert result == {'FINISHED'}
+    assert cameras[0].data.ortho_scale == pytest.approx(2.0, abs=0.1)
+    assert cameras[1].data.ortho_scale == pytest.approx(4.0, abs=0.1)
+    
+    bpy.ops.ortho_scale_219.add_config()
+    
+    result = bpy.ops.render.ortho_scale_219_compile_all()
+    assert result == {'FINISHED'}
+    
+    print("test_compile_all completed")
+
+def test_measure_compile_undo(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test measuring compiles with and without undo pushes and restoring the undo setting.
+        
+        This test sets up a config with a cube, turns the undo setting off, runs measure_compile_undo with three compiles per
+        mode, and verifies one result per mode with non-negative timings, that the setting is restored, and that the camera
+        was framed.
+    """
+    print("Starting test_measure_compile_undo")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    
+    bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 0))
+    
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    config.add_blender_object = bpy.context.active_object
+    bpy.ops.ortho_scale_219.add_blender_object()
+    settings.use_compile_undo = False
+    
+    results = measure_compile_undo(bpy.context, 3)
+    assert set(results) == {'OPERATOR_UNDO', 'OPERATOR_NO_UNDO', 'DIRECT'}
+    
+    for result in results.values():
+        assert set(result) == {"seconds", "seconds_per_compile", "rss_growth_mb"}
+        assert all(isinstance(value, float) for value in result.values())
+        assert result["seconds"] >= 0.0
+        assert result["seconds_per_compile"] == pytest.approx(result["seconds"] / 3)
+    
+    assert not settings.use_compile_undo
+    assert cam_data.ortho_scale == pytest.approx(2.0, abs=0.1)
+    
+    print("test_measure_compile_undo completed")
+
+def test_compile_modal(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test driving the cancellable compile to completion and through edits and cancellation.
+        
+        Background sessions have no window to run modal operators in, so this test calls the operator's methods on a stand-in
+        instance with a stand-in window manager and feeds them timer and Esc events. It verifies a modal compile matches the
+        regular compile and stores its result and summary in the config like it, so a regular compile afterwards is up to
+        date, that rotating the camera or deleting an object between ticks still gives the regular compile's
+        result, that removing the config cancels, and that Esc cancels without touching the resolution.
+    """
+    print("Starting test_compile_modal")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    scene = bpy.context.scene
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    
+    cubes = []
+    
+    for location in ((0, 0, 0), (4, 0, 0), (-4, 0, 2)):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        cubes.append(bpy.context.active_object)
+        config.add_blender_object = cubes[-1]
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    timer = SimpleNamespace()
+    messages = []
+    window_manager = SimpleNamespace(
+        event_timer_add = lambda time_step, window = None: timer,
+        event_timer_remove = lambda removed_timer: None,
+        progress_begin = lambda minimum, maximum: None,
+        progress_update = lambda value: None,
+        progress_end = lambda: None,
+        modal_handler_add = lambda operator: True,
+    )
+    context = SimpleNamespace(
+        scene = scene,
+        window = None,
+        window_manager = window_manager,
+        workspace = SimpleNamespace(status_text_set = lambda text: None),
+        evaluated_depsgraph_get = bpy.context.evaluated_depsgraph_get,
+    )
+    
+    def run_modal(edit = None, event_type = 'TIMER'):
+        operator = SimpleNamespace(report = lambda report_type, message: messages.append(message))
+        
+        for name in ("modal", "finish", "cancel", "get_config"):
+            setattr(operator, name, getattr(OBJECT_OT_OrthoScale219CompileCameraModal, name).__get__(operator))
+        
+        assert OBJECT_OT_OrthoScale219CompileCameraModal.invoke(operator, context, None) == {'RUNNING_MODAL'}
+        
+        if edit is not None:
+            edit()
+            bpy.context.view_layer.update()
+        
+        for _ in range(1000):
+            result = operator.modal(context, SimpleNamespace(type = event_type, timer = timer))
+            
+            if result != {'RUNNING_MODAL'}:
+                return result
+        
+        return result
+    
+    def compile_resolution():
+        assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+        
+        return (scene.render.resolution_x, scene.render.resolution_y, cam_data.ortho_scale)
+    
+    expected = compile_resolution()
+    scene.render.resolution_x = scene.render.resolution_y = 1
+    config.cached_bounds.clear()
+    config.summary_object_count = 0
+    
+    assert run_modal() == {'FINISHED'}
+    assert (scene.render.resolution_x, scene.render.resolution_y) == expected[:2]
+    assert cam_data.ortho_scale == pytest.approx(expected[2])
+    assert len(config.cached_bounds) == 3
+    assert config.summary_object_count == 3
+    
+    messages.clear()
+    assert compile_config(bpy.context, config, lambda report_type, message: messages.append(message))
+    assert any("up to date" in message for message in messages)
+    
+    def rotate_camera():
+        cam_obj.rotation_euler = (math.radians(70), 0, math.radians(200))
+    
+    assert run_modal(rotate_camera) == {'FINISHED'}
+    modal_result = (scene.render.resolution_x, scene.render.resolution_y, cam_data.ortho_scale)
+    expected = compile_resolution()
+    assert modal_result[:2] == expected[:2]
+    assert modal_result[2] == pytest.approx(expected[2])
+    
+    def delete_cube():
+        bpy.data.objects.remove(cubes.pop())
+    
+    assert run_modal(delete_cube) == {'FINISHED'}
+    modal_result = (scene.render.resolution_x, scene.render.resolution_y, cam_data.ortho_scale)
+    expected = compile_resolution()
+    assert modal_result[:2] == expected[:2]
+    
+    scene.render.resolution_x = 7
+    
+    assert run_modal(event_type = 'ESC') == {'CANCELLED'}
+    assert scene.render.resolution_x == 7
+    assert any("cancelled" in message for message in messages)
+    
+    def remove_config():
+        settings.configs.remove(settings.active_config_index)
+    
+    messages.clear()
+    assert run_modal(remove_config) == {'CANCELLED'}
+    assert scene.render.resolution_x == 7
+    assert any("removed" in message for message in messages)
+    
+    print("test_compile_modal completed")
+
+def test_object_list_filter_and_summary(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test bulk filtering and sorting of the object list and the cached compile summary.
+        
+        This test adds three named cubes to a config, runs the list's filter_items on a stand-in for the list instance with a
+        name filter, a type filter, and name sorting, and verifies the flags and order. It then compiles the config and verifies the stored summary.
+    """
+    print("Starting test_object_list_filter_and_summary")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    
+    for index, name in enumerate(("Wall", "Floor", "Wall.001")):
+        bpy.ops.mesh.primitive_cube_add(location=(index * 3, 0, 0))
+        bpy.context.active_object.name = name
+        config.add_blender_object = bpy.context.active_object
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    bitflag = 1 << 30
+    ui_list = SimpleNamespace(filter_name = "wall", filter_object_type = 'ALL', use_filter_sort_alpha = False, bitflag_filter_item = bitflag)
+    
+    flt_flags, flt_neworder = ORTHOSCALE219_UL_ObjectList.filter_items(ui_list, bpy.context, config, "blender_objects")
+    assert [bool(flag & bitflag) for flag in flt_flags] == [True, False, True]
+    assert flt_neworder == []
+    
+    ui_list.filter_name = ""
+    ui_list.filter_object_type = 'MISSING'
+    flt_flags, _ = ORTHOSCALE219_UL_ObjectList.filter_items(ui_list, bpy.context, config, "blender_objects")
+    assert not any(flag & bitflag for flag in flt_flags)
+    
+    ui_list.filter_object_type = 'ALL'
+    ui_list.use_filter_sort_alpha = True
+    _, flt_neworder = ORTHOSCALE219_UL_ObjectList.filter_items(ui_list, bpy.context, config, "blender_objects")
+    assert flt_neworder == [1, 0, 2]
+    
+    assert config.summary_compiled_at == ""
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert config.summary_object_count == 3
+    assert config.summary_vertex_count == 24
+    assert config.summary_compiled_at != ""
+    
+    print("test_object_list_filter_and_summary completed")
+
+def test_prune_stale_objects(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test removing deleted objects from every config in one validation pass.
+        
+        This test adds two cubes to two configs, deletes one cube, runs the validation pass directly (the automatic trigger runs
+        from a timer), and verifies that only the live cube is left in both configs.
+    """
+    print("Starting test_prune_stale_objects")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    cubes = []
+    
+    for location in ((0, 0, 0), (3, 0, 0)):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        cubes.append(bpy.context.active_object)
+    
+    for _ in range(2):
+        bpy.ops.ortho_scale_219.add_config()
+        config = settings.configs[settings.active_config_index]
+        
+        for cube in cubes:
+            config.add_blender_object = cube
+            bpy.ops.ortho_scale_219.add_blender_object()
+    
+    kept_name = cubes[1].name
+    bpy.data.objects.remove(cubes[0])
+    
+    assert prune_all_configs() == 2
+    
+    for config in settings.configs:
+        assert [item.mesh_object.name for item in config.blender_objects] == [kept_name]
+    
+    assert prune_all_configs() == 0
+    
+    print("test_prune_stale_objects completed")
+
+def test_compile_non_mesh_objects(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling around a curve and a text object without leaving converted meshes.
+        
+        This test adds a bezier circle and a text object through the add selected operator, compiles the config, and verifies
+        both were accepted, the resolution covers the circle, and no mesh data-blocks were added to the file.
+    """
+    print("Starting test_compile_non_mesh_objects")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    
+    bpy.ops.curve.primitive_bezier_circle_add(radius=1.0, location=(0, 0, 0), rotation=(math.radians(90), 0, 0))
+    bpy.ops.object.text_add(location=(0, 0, 0), rotation=(math.radians(90), 0, 0))
+    bpy.context.active_object.data.body = "A"
+    bpy.context.active_object.data.size = 0.5
+    
+    bpy.ops.object.select_all(action = 'SELECT')
+    cam_obj.select_set(False)
+    bpy.ops.ortho_scale_219.add_selected_objects()
+    assert len(config.blender_objects) == 2
+    
+    mesh_count = len(bpy.data.meshes)
+    result = bpy.ops.render.ortho_scale_219_compile()
+    assert result == {'FINISHED'}
+    assert bpy.context.scene.render.resolution_x == pytest.approx(20, abs=1)
+    assert bpy.context.scene.render.resolution_y == pytest.approx(20, abs=1)
+    assert len(bpy.data.meshes) == mesh_count
+    
+    print("test_compile_non_mesh_objects completed")
+
+def test_local_coords_volume(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that a volume is bounded by the corners of its evaluated bounding box.
+        
+        This test adds a volume object and verifies get_local_coords returns the 8 corners of its evaluated bound_box without
+        adding mesh data-blocks to the file.
+    """
+    print("Starting test_local_coords_volume")
+    
+    bpy.ops.object.volume_add(location=(0, 0, 0))
+    obj = bpy.context.active_object
+    assert obj.type == 'VOLUME'
+    
+    mesh_count = len(bpy.data.meshes)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    coords = get_local_coords(eval_obj, depsgraph)
+    assert coords.shape == (8, 3)
+    assert coords.ravel().tolist() == pytest.approx([value for corner in eval_obj.bound_box for value in corner])
+    assert len(bpy.data.meshes) == mesh_count
+    
+    print("test_local_coords_volume completed")
+
+def test_local_coords_point_cloud(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that a point cloud is bounded by its position attribute.
+        
+        This test converts a cube to a point cloud of its 8 corners and verifies get_local_coords returns exactly those corners
+        without adding mesh data-blocks to the file.
+    """
+    print("Starting test_local_coords_point_cloud")
+    
+    bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0, 0))
+    bpy.ops.object.convert(target = 'POINTCLOUD')
+    obj = bpy.context.active_object
+    assert obj.type == 'POINTCLOUD'
+    
+    mesh_count = len(bpy.data.meshes)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    coords = get_local_coords(obj.evaluated_get(depsgraph), depsgraph)
+    assert coords.shape == (8, 3)
+    assert [abs(value) for value in coords.ravel().tolist()] == pytest.approx([1.0] * 24)
+    assert len({tuple(co) for co in coords.tolist()}) == 8
+    assert len(bpy.data.meshes) == mesh_count
+    
+    print("test_local_coords_point_cloud completed")
+
+def test_local_coords_metaball(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that a metaball family is bounded by its basis and other metaballs evaluate empty.
+        
+        This test adds two metaballs of the same family, verifies the basis metaball evaluates to a surface around both
+        elements, and that the non-basis metaball, whose elements are polygonized into the basis, returns no coordinates.
+        Neither leaves a converted mesh in the file.
+    """
+    print("Starting test_local_coords_metaball")
+    
+    bpy.ops.object.metaball_add(type='BALL', radius=1.0, location=(0, 0, 0))
+    basis = bpy.context.active_object
+    bpy.ops.object.metaball_add(type='BALL', radius=1.0, location=(5, 0, 0))
+    other = bpy.context.active_object
+    assert basis.type == 'META' and other.type == 'META'
+    assert basis.name == "Mball" and other.name.startswith("Mball.")
+    
+    mesh_count = len(bpy.data.meshes)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    basis_coords = get_local_coords(basis.evaluated_get(depsgraph), depsgraph)
+    other_coords = get_local_coords(other.evaluated_get(depsgraph), depsgraph)
+    assert len(basis_coords) > 0
+    assert basis_coords[:, 0].min() < 0.0 < 5.0 < basis_coords[:, 0].max()
+    assert other_coords.shape == (0, 3)
+    assert len(bpy.data.meshes) == mesh_count
+    
+    print("test_local_coords_metaball completed")
+
+def test_local_coords_hair_curves(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that hair curves are bounded by their control points.
+        
+        This test converts a bezier circle to hair curves and verifies get_local_coords returns the positions of its control
+        points, which span the circle, without adding mesh data-blocks to the file.
+    """
+    print("Starting test_local_coords_hair_curves")
+    
+    bpy.ops.curve.primitive_bezier_circle_add(radius=1.0, location=(0, 0, 0))
+    bpy.ops.object.convert(target = 'CURVES')
+    obj = bpy.context.active_object
+    assert obj.type == 'CURVES'
+    
+    mesh_count = len(bpy.data.meshes)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    coords = get_local_coords(eval_obj, depsgraph)
+    positions = [value for point in eval_obj.data.position_data for value in point.vector]
+    assert coords.shape == (len(positions) // 3, 3)
+    assert coords.ravel().tolist() == pytest.approx(positions)
+    assert coords.min(axis=0)[:2].tolist() == pytest.approx([-1.0, -1.0], abs=1e-4)
+    assert coords.max(axis=0)[:2].tolist() == pytest.approx([1.0, 1.0], abs=1e-4)
+    assert len(bpy.data.meshes) == mesh_count
+    
+    print("test_local_coords_hair_curves completed")
+
+def test_compile_streaming(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that a streaming compile matches a regular compile and respects its cache budget.
+        
+        This test compiles a config around a subdivided sphere and a cube normally, then again in streaming mode with a zero
+        cache budget after clearing the geometry cache, and verifies the framing is identical and nothing was cached. It also
+        verifies the streaming order estimates the sphere's cost from its subdivided geometry rather than its base mesh.
+    """
+    print("Starting test_compile_streaming")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    
+    bpy.ops.mesh.primitive_uv_sphere_add(radius=2.0, location=(-3, 0, 0))
+    sphere = bpy.context.active_object
+    sphere.modifiers.new("Subdivision", 'SUBSURF').levels = 2
+    config.add_blender_object = sphere
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    bpy.ops.mesh.primitive_cube_add(location=(3, 0, 1))
+    config.add_blender_object = bpy.context.active_object
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    expected = (bpy.context.scene.render.resolution_x, bpy.context.scene.render.resolution_y, cam_data.ortho_scale, tuple(cam_obj.location))
+    
+    clear_geometry_cache()
+    config.use_streaming = True
+    config.streaming_budget_mb = 0.0
+    assert get_evaluated_point_count(sphere, bpy.context.evaluated_depsgraph_get()) > 4 * get_point_count(sphere)
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert (bpy.context.scene.render.resolution_x, bpy.context.scene.render.resolution_y) == expected[:2]
+    assert cam_data.ortho_scale == pytest.approx(expected[2])
+    assert tuple(cam_obj.location) == pytest.approx(expected[3])
+    assert not ortho_scale_219_geometry_cache
+    assert config.summary_peak_rss_mb >= 0.0
+    
+    print("test_compile_streaming completed")
+
+def test_persisted_compile_result(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test reusing the compile result stored in a config for unchanged objects.
+        
+        This test compiles two cubes, verifies a second compile is reported as up to date, moves one cube and verifies only the
+        other cube's stored extents are reused, and finally clears the geometry cache as a reopened file would and verifies a
+        compile with a new PPBU reuses every stored extent without extracting any geometry.
+    """
+    print("Starting test_persisted_compile_result")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    
+    cubes = []
+    
+    for location in ((0, 0, 0), (4, 0, 0)):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        cubes.append(bpy.context.active_object)
+        config.add_blender_object = cubes[-1]
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    messages = []
+    assert compile_config(bpy.context, config, lambda report_type, message: messages.append(message))
+    assert bpy.context.scene.render.resolution_x == pytest.approx(60, abs=1)
+    assert len(config.cached_bounds) == 2
+    
+    messages.clear()
+    assert compile_config(bpy.context, config, lambda report_type, message: messages.append(message))
+    assert any("up to date" in message for message in messages)
+    
+    cubes[1].location = (6, 0, 0)
+    bpy.context.view_layer.update()
+    
+    messages.clear()
+    assert compile_config(bpy.context, config, lambda report_type, message: messages.append(message))
+    assert any("Reused 1/2" in message for message in messages)
+    assert bpy.context.scene.render.resolution_x == pytest.approx(80, abs=1)
+    
+    clear_geometry_cache()
+    config.pixels_per_blender_unit = 20.0
+    
+    messages.clear()
+    assert compile_config(bpy.context, config, lambda report_type, message: messages.append(message))
+    assert any("Reused 2/2" in message for message in messages)
+    assert bpy.context.scene.render.resolution_x == pytest.approx(160, abs=1)
+    assert not ortho_scale_219_geometry_cache
+    
+    print("test_persisted_compile_result completed")
+
+def test_parallel_batch(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test fanning a directory of .blend files out over two background Blender processes.
+        
+        This test saves the current scene with a compilable config as three .blend files plus one corrupt file, runs the
+        driver with two workers and one file per chunk, and verifies every valid file's config was compiled, the corrupt file
+        is reported as failed, and the current session was left untouched.
+    """
+    print("Starting test_parallel_batch")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    config.add_blender_object = bpy.context.active_object
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    filepath = bpy.data.filepath
+    
+    with tempfile.TemporaryDirectory() as blend_dir:
+        for index in range(3):
+            bpy.ops.wm.save_as_mainfile(filepath = os.path.join(blend_dir, f"asset_{index}.blend"), copy = True)
+        
+        with open(os.path.join(blend_dir, "corrupt.blend"), "wb") as corrupt_file:
+            corrupt_file.write(b"not a blend file")
+        
+        batch_report = run_batch(["--blend-dir", blend_dir, "--parallel", "2", "--chunk-size", "1"])
+    
+    assert len(batch_report["blend_files"]) == 4
+    assert sum(1 for entry in batch_report["blend_files"] if entry["status"] == 'FINISHED') == 3
+    assert [entry["status"] for entry in batch_report["blend_files"] if entry["blend"].endswith("corrupt.blend")] == ['FAILED']
+    assert len(batch_report["jobs"]) == 3
+    assert all(job["status"] == 'FINISHED' for job in batch_report["jobs"])
+    assert sum(worker["files"] for worker in batch_report["workers"]) == 4
+    assert bpy.data.filepath == filepath
+    
+    print("test_parallel_batch completed")
+
+def test_batch_errors(clean_scene:None, monkeypatch:pytest.MonkeyPatch): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that a bad output pattern is rejected up front and a failing config does not abort the batch.
+        
+        This test saves a scene with two configs, verifies an output pattern with a stray brace stops the driver before any
+        file is loaded, then makes every config job raise a ReferenceError and verifies both configs are reported as FAILED
+        with the error and the JSON report is still written. The failing jobs run in this session, which loads the saved file,
+        so the session is saved first and reopened afterwards.
+    """
+    print("Starting test_batch_errors")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    
+    for _ in range(2):
+        bpy.ops.ortho_scale_219.add_config()
+    
+    def fail(*args, **kwargs):
+        raise ReferenceError("StructRNA of type Object has been removed")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        blend_path = os.path.join(temp_dir, "asset.blend")
+        report_path = os.path.join(temp_dir, "report.json")
+        session_path = os.path.join(temp_dir, "session.blend")
+        bpy.ops.wm.save_as_mainfile(filepath = blend_path, copy = True)
+        bpy.ops.wm.save_as_mainfile(filepath = session_path, copy = True)
+        
+        with pytest.raises(SystemExit):
+            run_batch(["--blend", blend_path, "--output", "//{config}_{view", "--report", report_path])
+        
+        assert not os.path.exists(report_path)
+        assert len(settings.configs) == 2
+        
+        monkeypatch.setattr(sys.modules[run_batch.__module__], "run_batch_job", fail)
+        
+        try:
+            batch_report = run_batch(["--blend", blend_path, "--report", report_path])
+        finally:
+            bpy.ops.wm.open_mainfile(filepath = session_path)
+        
+        assert batch_report["blend_files"][0]["status"] == 'FINISHED'
+        assert [job["status"] for job in batch_report["jobs"]] == ['FAILED', 'FAILED']
+        assert all("ReferenceError" in job["messages"][0] for job in batch_report["jobs"])
+        
+        with open(report_path, encoding = "utf-8") as report_file:
+            assert len(json.load(report_file)["jobs"]) == 2
+    
+    print("test_batch_errors completed")
+
+def test_dedicated_ortho_camera(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test compiling through a dedicated ortho camera and switching back to the source camera.
+        
+        This test compiles a config with a perspective source camera in dedicated camera mode, verifies the source camera was
+        left untouched while a new ortho camera with a copy of its data was framed and made the scene camera, recompiles and verifies the ortho
+        camera is reused without being moved, and finally switches back to the source camera and its resolution.
+    """
+    print("Starting test_dedicated_ortho_camera")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    scene = bpy.context.scene
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_data.shift_x = 0.25
+    cam_data.sensor_width = 50.0
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    scene.camera = cam_obj
+    scene.render.resolution_x = 1920
+    scene.render.resolution_y = 1080
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    config.use_dedicated_camera = True
+    config.add_blender_object = bpy.context.active_object
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    ortho_cam = config.ortho_camera
+    assert ortho_cam is not None and ortho_cam != cam_obj
+    assert ortho_cam.data.type == 'ORTHO'
+    assert ortho_cam.data != cam_data
+    assert ortho_cam.data.sensor_width == pytest.approx(50.0)
+    assert scene.camera == ortho_cam
+    assert cam_data.type == 'PERSP'
+    assert cam_data.shift_x == pytest.approx(0.25)
+    assert tuple(cam_obj.location) == pytest.approx((0, -10, 0))
+    assert scene.render.resolution_x == pytest.approx(20, abs=1)
+    
+    bpy.context.view_layer.update()
+    location = tuple(ortho_cam.location)
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert config.ortho_camera == ortho_cam
+    assert tuple(ortho_cam.location) == pytest.approx(location)
+    
+    assert bpy.ops.render.ortho_scale_219_switch_camera(mode = 'SOURCE') == {'FINISHED'}
+    assert scene.camera == cam_obj
+    assert (scene.render.resolution_x, scene.render.resolution_y) == (1920, 1080)
+    
+    assert bpy.ops.render.ortho_scale_219_switch_camera(mode = 'ORTHO') == {'FINISHED'}
+    assert scene.camera == ortho_cam
+    assert scene.render.resolution_x == pytest.approx(20, abs=1)
+    
+    print("test_dedicated_ortho_camera completed")
+
+def test_render_cache(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that an unchanged config render is served from the render cache and an edit invalidates it.
+        
+        This test saves a small Workbench scene, renders it through the batch driver twice with the same cache directory and
+        verifies the second run copies the cached image instead of rendering, then moves the object, saves again, and
+        verifies the edited scene misses the cache. It then evicts the cache down to zero bytes, verifies that the thread
+        count and other settings that do not affect the image keep the cache key, and verifies that Workbench shading, the
+        current frame, the compositor, view layer passes, and the render visibility of a config object each change it.
+    """
+    print("Starting test_render_cache")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    bpy.context.scene.render.engine = 'BLENDER_WORKBENCH'
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 8.0
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    cube = bpy.context.active_object
+    config.add_blender_object = cube
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        blend_path = os.path.join(temp_dir, "asset.blend")
+        cache_dir = os.path.join(temp_dir, "cache")
+        argv = ["--blend", blend_path, "--parallel", "2", "--render", "--output", os.path.join(temp_dir, "out_{config}_{view}"), "--cache-dir", cache_dir]
+        bpy.ops.wm.save_as_mainfile(filepath = blend_path, copy = True)
+        
+        first_report = run_batch(argv)
+        second_report = run_batch(argv)
+        
+        assert first_report["jobs"][0]["status"] == 'FINISHED'
+        assert first_report["jobs"][0]["cache_hits"] == 0
+        assert second_report["jobs"][0]["cache_hits"] == 1
+        assert all(os.path.exists(path + ".png") for path in second_report["jobs"][0]["outputs"])
+        
+        cube.location.x = 0.5
+        bpy.ops.wm.save_as_mainfile(filepath = blend_path, copy = True)
+        
+        assert run_batch(argv)["jobs"][0]["cache_hits"] == 0
+        assert evict_render_cache(cache_dir, 0) == 2
+    
+    scene = bpy.context.scene
+    keys = [get_render_cache_key(scene, config, cam_obj)]
+    scene.render.threads_mode = 'FIXED'
+    scene.render.threads = 3
+    scene.render.use_lock_interface = not scene.render.use_lock_interface
+    scene.render.use_persistent_data = not scene.render.use_persistent_data
+    assert get_render_cache_key(scene, config, cam_obj) == keys[0]
+    scene.display.shading.light = 'FLAT'
+    keys.append(get_render_cache_key(scene, config, cam_obj))
+    scene.frame_current += 1
+    keys.append(get_render_cache_key(scene, config, cam_obj))
+    scene.use_nodes = True
+    keys.append(get_render_cache_key(scene, config, cam_obj))
+    bpy.context.view_layer.use_pass_z = not bpy.context.view_layer.use_pass_z
+    keys.append(get_render_cache_key(scene, config, cam_obj))
+    cube.hide_render = True
+    keys.append(get_render_cache_key(scene, config, cam_obj))
+    assert len(set(keys)) == len(keys)
+    
+    print("test_render_cache completed")
+
+def test_render_isolation(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test isolating configs in a temporary view layer and tearing it down.
+        
+        This test isolates a config whose cube shares the scene with set dressing, verifies the isolation view layer only
+        contains the cube, the camera, and the lights collection and is the only view layer enabled for rendering, isolates a
+        second config and verifies the same view layer is reused, and finally ends the isolation and verifies the scene is
+        restored.
+    """
+    print("Starting test_render_isolation")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    scene = bpy.context.scene
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    
+    lights = bpy.data.collections.new("TestLights")
+    scene.collection.children.link(lights)
+    light = bpy.data.objects.new("TestLight", bpy.data.lights.new("TestLight", 'SUN'))
+    lights.objects.link(light)
+    
+    set_collection = bpy.data.collections.new("TestSet")
+    scene.collection.children.link(set_collection)
+    set_dressing = bpy.data.objects.new("TestSetDressing", bpy.data.meshes.new("TestSetDressing"))
+    set_collection.objects.link(set_dressing)
+    root_object = bpy.data.objects.new("TestRootEmpty", None)
+    scene.collection.objects.link(root_object)
+    
+    cubes = []
+    
+    for index in range(2):
+        bpy.ops.ortho_scale_219.add_config()
+        config = settings.configs[settings.active_config_index]
+        config.camera = cam_obj
+        config.use_isolation = True
+        config.isolation_lights = lights
+        bpy.ops.mesh.primitive_cube_add(location=(index * 3, 0, 0))
+        cubes.append(bpy.context.active_object)
+        config.add_blender_object = cubes[-1]
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    view_layer_count = len(scene.view_layers)
+    view_layer = begin_isolation(bpy.context, settings.configs[0])
+    bpy.context.view_layer.update()
+    
+    assert len(scene.view_layers) == view_layer_count + 1
+    assert {obj.name for obj in view_layer.objects} == {cubes[0].name, cam_obj.name, light.name, root_object.name}
+    assert set_dressing.name not in view_layer.objects
+    assert root_object.hide_render
+    assert [other.name for other in scene.view_layers if other.use] == [view_layer.name]
+    
+    assert begin_isolation(bpy.context, settings.configs[1]) == view_layer
+    assert cubes[1].name in view_layer.objects and cubes[0].name not in view_layer.objects
+    assert len(scene.view_layers) == view_layer_count + 1
+    
+    assert end_isolation(bpy.context)
+    assert len(scene.view_layers) == view_layer_count
+    assert all(other.use for other in scene.view_layers)
+    assert not root_object.hide_render
+    assert not any(child.get("ortho_scale_219_isolation") for child in scene.collection.children)
+    assert not end_isolation(bpy.context)
+    
+    print("test_render_isolation completed")
+
+def test_occupancy_pre_pass(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test the occupancy pre-pass on an L-shaped layout and its trimmed render border.
+        
+        This test compiles three cubes laid out in an L with the occupancy pre-pass enabled and verifies that roughly the
+        missing corner of the frame is reported empty, then compiles a single cube with a wide edge margin and a trimmed
+        border and verifies the render border excludes the margin while keeping the full image size. Finally it compiles
+        again without the trimmed border and verifies the border is switched off.
+    """
+    print("Starting test_occupancy_pre_pass")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    scene = bpy.context.scene
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    config.use_occupancy = True
+    config.occupancy_resolution = 30
+    
+    for location in ((0, 0, 0), (4, 0, 0), (0, 0, 4)):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        config.add_blender_object = bpy.context.active_object
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert config.summary_occupancy_resolution == 30
+    assert 0.5 < config.summary_empty_fraction < 2 / 3 + 0.01
+    assert not scene.render.use_border
+    
+    config.blender_objects.remove(2)
+    config.blender_objects.remove(1)
+    config.edge_margin = 2.0
+    config.use_occupancy_border = True
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert (scene.render.resolution_x, scene.render.resolution_y) == (60, 60)
+    assert scene.render.use_border and not scene.render.use_crop_to_border
+    assert scene.render.border_min_x == pytest.approx(1 / 3, abs=0.05)
+    assert scene.render.border_max_x == pytest.approx(2 / 3, abs=0.05)
+    assert scene.render.border_min_y == pytest.approx(1 / 3, abs=0.05)
+    assert config.summary_empty_fraction == pytest.approx(8 / 9, abs=0.05)
+    
+    config.use_occupancy_border = False
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert not scene.render.use_border
+    
+    print("test_occupancy_pre_pass completed")
+
+def test_render_estimate(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test recording render timings and estimating render time and memory from them.
+        
+        This test points the render history at a temporary file, renders a compiled Workbench config and verifies nothing is
+        recorded until the scene opts in, then renders again and verifies the render was recorded with its pixel and triangle
+        counts and that recompiling stores an estimate. It then records synthetic renders that follow a known linear cost
+        into a fresh history and verifies the estimate recovers it.
+    """
+    print("Starting test_render_estimate")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    scene = bpy.context.scene
+    scene.render.engine = 'BLENDER_WORKBENCH'
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    scene.camera = cam_obj
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 10.0
+    config.edge_margin = 0.0
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    config.add_blender_object = bpy.context.active_object
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        history_path = os.path.join(temp_dir, "history.json")
+        os.environ["ORTHO_SCALE_219_RENDER_HISTORY"] = history_path
+        
+        try:
+            assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+            assert config.summary_triangle_count == 12
+            assert config.summary_estimate_renders == 0
+            
+            bpy.ops.render.render()
+            assert not os.path.exists(history_path)
+            
+            settings.use_render_history = True
+            bpy.ops.render.render()
+            
+            with open(history_path, encoding = "utf-8") as history_file:
+                entries = json.load(history_file)
+            
+            assert len(entries) == 1
+            assert entries[0]["engine"] == 'BLENDER_WORKBENCH'
+            assert entries[0]["pixels"] == pytest.approx(20 * 20)
+            assert entries[0]["triangles"] == 12
+            assert entries[0]["seconds"] > 0.0 and entries[0]["peak_mb"] > 0.0
+            
+            assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+            assert config.summary_estimate_renders == 1
+            assert config.summary_estimate_seconds > 0.0
+            
+            os.remove(history_path)
+            
+            for pixels, triangles in ((1e4, 10), (4e4, 1000), (9e4, 10), (1.6e5, 5000), (2.5e5, 100)):
+                record_render({"engine": 'BLENDER_WORKBENCH', "pixels": pixels, "samples": 1, "triangles": triangles, "seconds": 2e-5 * pixels + 1e-4 * triangles + 0.5, "peak_mb": 100.0 + 1e-3 * pixels, "config": "Synthetic"})
+            
+            scene.render.resolution_x = 100
+            scene.render.resolution_y = 200
+            estimate = estimate_render_cost(scene, config)
+        finally:
+            del os.environ["ORTHO_SCALE_219_RENDER_HISTORY"]
+    
+    assert estimate is not None and estimate["renders"] == 5
+    assert estimate["seconds"] == pytest.approx(2e-5 * 2e4 + 1e-4 * 12 + 0.5, rel=0.25)
+    assert estimate["peak_mb"] == pytest.approx(100.0 + 1e-3 * 2e4, rel=0.25)
+    
+    print("test_render_estimate completed")
+
+def test_pipelined_bounds(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that pipelined extraction produces the same extents as sequential extraction.
+        
+        This test bounds a mix of unique meshes, linked duplicates, and a text object through an obliquely rotated camera,
+        sequentially and pipelined with an empty geometry cache each time, and verifies the per-object extents match. It
+        repeats this through an axis-aligned camera and verifies the pipelined path takes the world extents shortcut, which
+        keeps no coordinates of single-user geometry, then verifies a pipelined compile frames the camera like a sequential
+        one.
+    """
+    print("Starting test_pipelined_bounds")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -20, 5)
+    cam_obj.rotation_euler = (math.radians(70), math.radians(10), math.radians(20))
+    config.camera = cam_obj
+    
+    objs = []
+    
+    for index in range(6):
+        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5 + index * 0.1, location=(index * 2 - 5, index % 3, 0))
+        objs.append(bpy.context.active_object)
+    
+    for index in range(3):
+        duplicate = objs[0].copy()
+        duplicate.location = (0, 4, index * 2)
+        duplicate.rotation_euler = (0, 0, index)
+        bpy.context.collection.objects.link(duplicate)
+        objs.append(duplicate)
+    
+    bpy.ops.object.text_add(location=(0, 0, 3))
+    objs.append(bpy.context.active_object)
+    
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    cam_matrix_inv = cam_obj.matrix_world.inverted()
+    
+    clear_geometry_cache()
+    expected = get_object_camera_bounds(objs, depsgraph, cam_matrix_inv)
+    clear_geometry_cache()
+    pipelined = get_pipelined_object_bounds(objs, depsgraph, cam_matrix_inv)
+    
+    assert list(pipelined) == [name for name in expected if name in pipelined]
+    assert set(pipelined) == set(expected) and len(pipelined) == len(objs)
+    
+    for name, (min_co, max_co) in expected.items():
+        assert tuple(pipelined[name][0]) == pytest.approx(tuple(min_co), abs=1e-4)
+        assert tuple(pipelined[name][1]) == pytest.approx(tuple(max_co), abs=1e-4)
+    
+    front = bpy.data.objects.new("FrontView", None)
+    front.location = (0, -20, 0)
+    front.rotation_euler = (math.radians(90), 0, 0)
+    front_matrix_inv = front.matrix_basis.inverted()
+    bpy.data.objects.remove(front)
+    clear_geometry_cache()
+    expected = get_object_camera_bounds(objs, depsgraph, front_matrix_inv)
+    clear_geometry_cache()
+    pipelined = get_pipelined_object_bounds(objs, depsgraph, front_matrix_inv)
+    
+    assert len(ortho_scale_219_geometry_cache) <= 1
+    assert set(pipelined) == set(expected)
+    
+    for name, (min_co, max_co) in expected.items():
+        assert tuple(pipelined[name][0]) == pytest.approx(tuple(min_co), abs=1e-4)
+        assert tuple(pipelined[name][1]) == pytest.approx(tuple(max_co), abs=1e-4)
+    
+    for obj in objs:
+        config.add_blender_object = obj
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    location = tuple(cam_obj.location)
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    expected_framing = (bpy.context.scene.render.resolution_x, bpy.context.scene.render.resolution_y, cam_data.ortho_scale, tuple(cam_obj.location))
+    
+    cam_obj.location = location
+    config.cached_bounds.clear()
+    clear_geometry_cache()
+    config.use_pipelined = True
+    
+    assert bpy.ops.render.ortho_scale_219_compile() == {'FINISHED'}
+    assert (bpy.context.scene.render.resolution_x, bpy.context.scene.render.resolution_y) == expected_framing[:2]
+    assert cam_data.ortho_scale == pytest.approx(expected_framing[2])
+    assert tuple(cam_obj.location) == pytest.approx(expected_framing[3], abs=1e-4)
+    
+    print("test_pipelined_bounds completed")
+
+def test_render_tiled(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test that a tiled render across two worker processes matches a single render of the frame.
+        
+        This test compiles a small Workbench scene without anti-aliasing and outlines, which read pixels across tile edges,
+        renders it once directly and once through render_tiled with tiles smaller than the frame, and verifies the assembled
+        image has the frame resolution and the same pixels as the direct render.
+    """
+    print("Starting test_render_tiled")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    scene = bpy.context.scene
+    scene.render.engine = 'BLENDER_WORKBENCH'
+    scene.render.film_transparent = True
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.image_settings.color_depth = '8'
+    scene.display.render_aa = 'OFF'
+    scene.display.shading.show_object_outline = False
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 8.0
+    
+    for location in ((0, 0, 0), (3, 0, 1)):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        config.add_blender_object = bpy.context.active_object
+        bpy.ops.ortho_scale_219.add_blender_object()
+    
+    assert compile_config(bpy.context, config, lambda report_type, message: None)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        direct_path = os.path.join(temp_dir, "direct.png")
+        tiled_path = os.path.join(temp_dir, "tiled.png")
+        scene.render.filepath = direct_path
+        bpy.ops.render.render(write_still = True)
+        
+        report = render_tiled(scene, scene.camera, tiled_path, tile_size = 16, workers = 2, threads = 1)
+        
+        assert report["status"] == 'FINISHED', report.get("error")
+        assert report["tiles"] > 2
+        assert len(report["workers"]) == 2
+        
+        direct = bpy.data.images.load(direct_path)
+        tiled = bpy.data.images.load(tiled_path)
+        
+        assert tuple(tiled.size) == tuple(direct.size) == (scene.render.resolution_x, scene.render.resolution_y)
+        assert max(abs(a - b) for a, b in zip(direct.pixels[:], tiled.pixels[:])) < 0.01
+        
+        bpy.data.images.remove(direct)
+        bpy.data.images.remove(tiled)
+    
+    print("test_render_tiled completed")
+
+def test_render_passes(clean_scene:None): # noinspection PyUnusedLocal,PyShadowingNames # pylint: disable=unused-argument,redefined-outer-name # noqa: F841
+    """
+        Test writing color, depth, normal, and object index maps from one render and splitting them.
+        
+        This test declares every output on a config, compiles it and verifies compiling leaves the view layer passes, the
+        output format, and the object's pass index alone. It then applies the passes as a batch render does and verifies the
+        passes, the multilayer EXR output, and the pass index, restores them and verifies the scene is back as it was, and
+        finally renders the config through the batch driver with split passes and verifies the multilayer EXR and one file
+        per pass are written, or that a missing OpenImageIO module is reported.
+    """
+    print("Starting test_render_passes")
+    
+    settings:OrthoScale219Settings = cast(OrthoScale219Settings, getattr(bpy.context.scene, "ortho_scale_219_settings"))
+    bpy.ops.ortho_scale_219.add_config()
+    config = settings.configs[settings.active_config_index]
+    scene = bpy.context.scene
+    scene.render.engine = 'CYCLES'
+    scene.cycles.samples = 1
+    
+    cam_data = bpy.data.cameras.new("TestCamera")
+    cam_obj = bpy.data.objects.new("TestCamera", cam_data)
+    bpy.context.collection.objects.link(cam_obj)
+    cam_obj.location = (0, -10, 0)
+    cam_obj.rotation_euler = (math.radians(90), 0, math.radians(180))
+    config.camera = cam_obj
+    config.pixels_per_blender_unit = 8.0
+    
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
+    cube = bpy.context.active_object
+    config.add_blender_object = cube
+    bpy.ops.ortho_scale_219.add_blender_object()
+    
+    view_layer = bpy.context.view_layer
+    view_layer.use_pass_z = False
+    view_layer.use_pass_normal = False
+    view_layer.use_pass_object_index = False
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_depth = '8'
+    
+    config.render_passes = {'COLOR', 'DEPTH', 'NORMAL', 'OBJECT_INDEX'}
+    config.split_passes = True
+    assert compile_config(bpy.context, config, lambda report_type, message: None)
+    
+    assert not (view_layer.use_pass_z or view_layer.use_pass_normal or view_layer.use_pass_object_index)
+    assert scene.render.image_settings.file_format == 'PNG'
+    assert cube.pass_index == 0
+    
+    state = apply_render_passes(scene, config)
+    assert state is not None
+    assert view_layer.use_pass_z and view_layer.use_pass_normal and view_layer.use_pass_object_index
+    assert scene.render.image_settings.file_format == 'OPEN_EXR_MULTILAYER'
+    assert scene.render.image_settings.color_depth == '32'
+    assert cube.pass_index == 1
+    
+    restore_render_passes(scene, state)
+    assert not (view_layer.use_pass_z or view_layer.use_pass_normal or view_layer.use_pass_object_index)
+    assert (scene.render.image_settings.file_format, scene.render.image_settings.color_depth) == ('PNG', '8')
+    assert cube.pass_index == 0
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        blend_path = os.path.join(temp_dir, "asset.blend")
+        bpy.ops.wm.save_as_mainfile(filepath = blend_path, copy = True)
+        
+        job = run_batch(["--blend", blend_path, "--parallel", "2", "--render", "--output", os.path.join(temp_dir, "out_{view}")])["jobs"][0]
+        
+        assert job["status"] == 'FINISHED'
+        assert os.path.exists(job["outputs"][0] + ".exr")
+        
+        if job["pass_outputs"]:
+            assert [os.path.basename(path) for path in job["pass_outputs"]] == ["out_0_Combined.exr", "out_0_Depth.exr", "out_0_Normal.exr", "out_0_IndexOB.exr"]
+            assert all(os.path.exists(path) for path in job["pass_outputs"])
+        else:
+            assert any("OpenImageIO" in message for message in job["messages"])
+    
+    print("test_render_passes completed")